@@ -44,6 +44,31 @@ def int_normalizer(val: str) -> int:
     return int(val)
 
 
+_SIZE_UNITS = {"": 1, "k": 2**10, "m": 2**20, "g": 2**30, "t": 2**40}
+
+
+def size_validator(val: str) -> bool:
+    try:
+        size_normalizer(val)
+    except ValueError:
+        return False
+
+    return True
+
+
+def size_normalizer(val: str) -> int:
+    """
+    Convert a size like "500M" or "10GiB" (with binary units) into bytes.
+    """
+    m = re.fullmatch(
+        r"\s*(\d+(?:\.\d+)?)\s*(?:([kmgt])(?:i?b)?|b)?\s*", val, re.IGNORECASE
+    )
+    if not m:
+        raise ValueError(f"Invalid size: {val}")
+
+    return int(float(m.group(1)) * _SIZE_UNITS[(m.group(2) or "").lower()])
+
+
 def build_config_setting_validator(val: str) -> bool:
     try:
         value = build_config_setting_normalizer(val)
@@ -143,6 +168,10 @@ _default_config: Config | None = None
 
 class Config:
     default_config: ClassVar[dict[str, Any]] = {
+        "cache": {
+            "backend": "file",
+            "max-size": None,
+        },
         "cache-dir": str(DEFAULT_CACHE_DIR),
         "data-dir": str(data_dir()),
         "virtualenvs": {
@@ -164,13 +193,20 @@ class Config:
             "re-resolve": True,
             "parallel": True,
             "max-workers": None,
+            "download-segments": 4,
+            "link-from-cache": False,
             "no-binary": None,
             "only-binary": None,
             "build-config-settings": {},
         },
         "python": {"installation-dir": os.path.join("{data-dir}", "python")},
         "solver": {
+            "activity-heuristic": False,
+            "incremental": False,
             "lazy-wheel": True,
+            "max-workers": None,
+            "parallel-sources": False,
+            "resolution-cache": False,
         },
         "system-git-client": False,
         "keyring": {
@@ -272,10 +308,23 @@ class Config:
     def repository_cache_directory(self) -> Path:
         return Path(self.get("cache-dir")).expanduser() / "cache" / "repositories"
 
+    @property
+    def resolution_cache_directory(self) -> Path:
+        return Path(self.get("cache-dir")).expanduser() / "cache" / "resolutions"
+
     @property
     def artifacts_cache_directory(self) -> Path:
         return Path(self.get("cache-dir")).expanduser() / "artifacts"
 
+    @property
+    def cache_max_size(self) -> int | None:
+        max_size = self.get("cache.max-size")
+        if max_size is None:
+            return None
+        if isinstance(max_size, str):
+            return size_normalizer(max_size)
+        return int(max_size)
+
     @property
     def virtualenvs_path(self) -> Path:
         path = self.get("virtualenvs.path")
@@ -292,6 +341,13 @@ class Config:
 
     @property
     def installer_max_workers(self) -> int:
+        return self._get_max_workers("installer.max-workers")
+
+    @property
+    def solver_max_workers(self) -> int:
+        return self._get_max_workers("solver.max-workers")
+
+    def _get_max_workers(self, setting_name: str) -> int:
         # This should be directly handled by ThreadPoolExecutor
         # however, on some systems the number of CPUs cannot be determined
         # (it raises a NotImplementedError), so, in this case, we assume
@@ -301,7 +357,7 @@ class Config:
         except NotImplementedError:
             default_max_workers = 5
 
-        desired_max_workers = self.get("installer.max-workers")
+        desired_max_workers = self.get(setting_name)
         if desired_max_workers is None:
             return default_max_workers
         return min(default_max_workers, int(desired_max_workers))
@@ -383,7 +439,12 @@ class Config:
             "virtualenvs.use-poetry-python",
             "installer.re-resolve",
             "installer.parallel",
+            "installer.link-from-cache",
+            "solver.activity-heuristic",
+            "solver.incremental",
             "solver.lazy-wheel",
+            "solver.parallel-sources",
+            "solver.resolution-cache",
             "system-git-client",
             "keyring.enabled",
         }:
@@ -393,11 +454,16 @@ class Config:
             return lambda val: str(Path(val))
 
         if name in {
+            "installer.download-segments",
             "installer.max-workers",
             "requests.max-retries",
+            "solver.max-workers",
         }:
             return int_normalizer
 
+        if name == "cache.max-size":
+            return size_normalizer
+
         if name in ["installer.no-binary", "installer.only-binary"]:
             return PackageFilterPolicy.normalize
 
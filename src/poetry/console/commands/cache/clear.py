@@ -11,7 +11,7 @@ from packaging.utils import canonicalize_name
 
 from poetry.config.config import Config
 from poetry.console.commands.command import Command
-from poetry.utils.cache import FileCache
+from poetry.utils.cache import create_file_cache
 
 
 if TYPE_CHECKING:
@@ -44,7 +44,7 @@ class CacheClearCommand(Command):
         except ValueError:
             raise ValueError(f"{root} is not a valid repository cache")
 
-        cache = FileCache(cache_dir)
+        cache = create_file_cache(cache_dir, config.get("cache.backend"))
 
         if len(parts) == 1:
             if not self.option("all"):
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import ClassVar
+
+from cleo.helpers import option
+from cleo.io.outputs.output import Verbosity
+
+from poetry.config.config import Config
+from poetry.config.config import size_normalizer
+from poetry.console.commands.command import Command
+from poetry.utils.cache import CachePruner
+
+
+if TYPE_CHECKING:
+    from cleo.io.inputs.option import Option
+
+
+class CachePruneCommand(Command):
+    name = "cache prune"
+    description = (
+        "Removes the least recently used entries of Poetry's caches"
+        " until they fit into a size budget."
+    )
+
+    options: ClassVar[list[Option]] = [
+        option(
+            "max-size",
+            None,
+            "The size budget of the caches, e.g. 500M or 10G."
+            " (Defaults to the <comment>cache.max-size</comment> setting.)",
+            flag=False,
+        ),
+        option(
+            "dry-run",
+            None,
+            "Output the entries that would be removed but do not remove them.",
+        ),
+    ]
+
+    def handle(self) -> int:
+        config = Config.create()
+
+        max_size_option = self.option("max-size")
+        if max_size_option is not None:
+            try:
+                max_size = size_normalizer(max_size_option)
+            except ValueError as e:
+                self.line_error(f"<error>{e}</error>")
+                return 1
+        else:
+            max_size_setting = config.cache_max_size
+            if max_size_setting is None:
+                self.line_error(
+                    "<error>No size budget has been configured. Set"
+                    " <c1>cache.max-size</c1> or pass the --max-size option.</error>"
+                )
+                return 1
+            max_size = max_size_setting
+
+        dry_run = self.option("dry-run")
+        result = CachePruner.from_config(config).prune(max_size, dry_run=dry_run)
+
+        for entry in result.evicted:
+            self.line(
+                f"{'Would remove' if dry_run else 'Removed'}"
+                f" <c1>{entry.path}</c1>" + (f" ({entry.key})" if entry.key else ""),
+                verbosity=Verbosity.VERBOSE,
+            )
+
+        size = result.size - (0 if dry_run else result.evicted_size)
+        self.line(
+            f"{'Would remove' if dry_run else 'Removed'}"
+            f" {len(result.evicted)} entries ({_format_size(result.evicted_size)}),"
+            f" the caches {'would ' if dry_run else ''}use {_format_size(size)}"
+            f" of {_format_size(max_size)}."
+        )
+
+        return 0
+
+
+def _format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+
+    value = size / 1024
+    for unit in ("KiB", "MiB", "GiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TiB"
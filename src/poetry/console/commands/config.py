@@ -19,10 +19,13 @@ from poetry.config.config import boolean_validator
 from poetry.config.config import build_config_setting_normalizer
 from poetry.config.config import build_config_setting_validator
 from poetry.config.config import int_normalizer
+from poetry.config.config import size_normalizer
+from poetry.config.config import size_validator
 from poetry.config.config_source import UNSET
 from poetry.config.config_source import ConfigSourceMigration
 from poetry.config.config_source import PropertyNotFoundError
 from poetry.console.commands.command import Command
+from poetry.utils.cache import CACHE_BACKENDS
 
 
 if TYPE_CHECKING:
@@ -75,6 +78,8 @@ To remove a repository (repo is a short alias for repositories):
     @property
     def unique_config_values(self) -> dict[str, tuple[Any, Any]]:
         unique_config_values = {
+            "cache.backend": (lambda val: val in CACHE_BACKENDS, str),
+            "cache.max-size": (size_validator, size_normalizer),
             "cache-dir": (str, lambda val: str(Path(val))),
             "virtualenvs.create": (boolean_validator, boolean_normalizer),
             "virtualenvs.in-project": (boolean_validator, boolean_normalizer),
@@ -91,6 +96,8 @@ To remove a repository (repo is a short alias for repositories):
             "requests.max-retries": (lambda val: int(val) >= 0, int_normalizer),
             "installer.re-resolve": (boolean_validator, boolean_normalizer),
             "installer.parallel": (boolean_validator, boolean_normalizer),
+            "installer.download-segments": (lambda val: int(val) > 0, int_normalizer),
+            "installer.link-from-cache": (boolean_validator, boolean_normalizer),
             "installer.max-workers": (lambda val: int(val) > 0, int_normalizer),
             "installer.no-binary": (
                 PackageFilterPolicy.validator,
@@ -100,7 +107,12 @@ To remove a repository (repo is a short alias for repositories):
                 PackageFilterPolicy.validator,
                 PackageFilterPolicy.normalize,
             ),
+            "solver.activity-heuristic": (boolean_validator, boolean_normalizer),
+            "solver.incremental": (boolean_validator, boolean_normalizer),
             "solver.lazy-wheel": (boolean_validator, boolean_normalizer),
+            "solver.max-workers": (lambda val: int(val) > 0, int_normalizer),
+            "solver.parallel-sources": (boolean_validator, boolean_normalizer),
+            "solver.resolution-cache": (boolean_validator, boolean_normalizer),
             "keyring.enabled": (boolean_validator, boolean_normalizer),
         }
 
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import json
+
+from pathlib import Path
 from typing import TYPE_CHECKING
+from typing import Any
 from typing import ClassVar
 
 from cleo.helpers import argument
@@ -35,6 +39,17 @@ class DebugResolveCommand(InitCommand):
         option("python", None, "Python version(s) to use for resolution.", flag=False),
         option("tree", None, "Display the dependency tree."),
         option("install", None, "Show what would be installed for the current system."),
+        option(
+            "profile",
+            None,
+            "Show where the time of the dependency resolution is spent.",
+        ),
+        option(
+            "profile-output",
+            None,
+            "Write the profile of the dependency resolution as JSON to the given file.",
+            flag=False,
+        ),
     ]
 
     loggers: ClassVar[list[str]] = [
@@ -51,6 +66,7 @@ class DebugResolveCommand(InitCommand):
         from poetry.repositories.repository import Repository
         from poetry.repositories.repository_pool import RepositoryPool
         from poetry.utils.env import EnvManager
+        from poetry.utils.profiler import profile
 
         packages = self.argument("package")
 
@@ -91,7 +107,18 @@ class DebugResolveCommand(InitCommand):
 
         solver = Solver(package, pool, [], [], self.io)
 
-        ops = solver.solve().calculate_operations()
+        report: dict[str, Any] | None = None
+        if self.option("profile") or self.option("profile-output"):
+            with profile() as profiler:
+                ops = solver.solve().calculate_operations()
+            report = profiler.report()
+
+            if self.option("profile-output"):
+                Path(self.option("profile-output")).write_text(
+                    json.dumps(report, indent=2), encoding="utf-8"
+                )
+        else:
+            ops = solver.solve().calculate_operations()
 
         self.line("")
         self.line("Resolution results:")
@@ -111,6 +138,9 @@ class DebugResolveCommand(InitCommand):
                         show_command.display_package_tree(self.io, pkg, packages)
                         break
 
+            if report is not None and self.option("profile"):
+                self._display_profile(report)
+
             return 0
 
         table = self.table(style="compact")
@@ -148,4 +178,58 @@ class DebugResolveCommand(InitCommand):
         table.set_rows(rows)
         table.render()
 
+        if report is not None and self.option("profile"):
+            self._display_profile(report)
+
         return 0
+
+    def _display_profile(self, report: dict[str, Any]) -> None:
+        self.line("")
+        self.line(f"Profile ({report['total']:.3f}s in total):")
+        self.line("")
+
+        table = self.table(style="compact")
+        table.style.set_vertical_border_chars("", " ")
+        rows: Rows = []
+        for category, timing in report["categories"].items():
+            rows.append(
+                [
+                    f"<c1>{category}</c1>",
+                    f"<b>{timing['seconds']:.3f}s</b>",
+                    f"{timing['calls']} calls",
+                ]
+            )
+            for name, detail in timing["details"].items():
+                rows.append(
+                    [
+                        f"  {name}",
+                        f"{detail['seconds']:.3f}s",
+                        f"{detail['calls']} calls",
+                    ]
+                )
+        rows.append(["<c1>unaccounted</c1>", f"<b>{report['unaccounted']:.3f}s</b>"])
+        table.set_rows(rows)
+        table.render()
+
+        if report["background"]:
+            self.line("")
+            self.line("In background threads:")
+            for category, timing in report["background"].items():
+                self.line(
+                    f"  <c1>{category}</c1>: {timing['seconds']:.3f}s"
+                    f" ({timing['calls']} calls)"
+                )
+
+        backtracking = report["backtracking"]
+        self.line("")
+        self.line(
+            f"Backtracked {backtracking['count']} times"
+            f" (maximum depth: {backtracking['max_depth']},"
+            f" mean depth: {backtracking['mean_depth']})."
+        )
+
+        if report["versions_tried"]:
+            self.line("")
+            self.line("Most versions tried:")
+            for name, count in report["versions_tried"].items():
+                self.line(f"  <c1>{name}</c1>: {count}")
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import hashlib
 import io
+import json
 import logging
+import os
 import re
+import threading
 
 from bisect import bisect_left
 from bisect import bisect_right
 from contextlib import contextmanager
+from dataclasses import dataclass
 from tempfile import NamedTemporaryFile
 from typing import IO
 from typing import TYPE_CHECKING
@@ -28,6 +33,7 @@ from requests.status_codes import codes
 if TYPE_CHECKING:
     from collections.abc import Iterable
     from collections.abc import Iterator
+    from pathlib import Path
     from types import TracebackType
 
     from packaging.metadata import RawMetadata
@@ -53,6 +59,10 @@ class HTTPRangeRequestNotRespectedError(LazyWheelUnsupportedError):
     but does not respect a respective request."""
 
 
+class OutdatedRangesError(Exception):
+    """Raised when a remote file has changed since its byte ranges have been cached."""
+
+
 class UnsupportedWheelError(LazyWheelUnsupportedError):
     """Unsupported wheel."""
 
@@ -69,21 +79,29 @@ class InvalidWheelError(LazyWheelUnsupportedError):
 
 
 def metadata_from_wheel_url(
-    name: str, url: str, session: Session | Authenticator
+    name: str,
+    url: str,
+    session: Session | Authenticator,
+    cache: RangeCache | None = None,
 ) -> RawMetadata:
     """Fetch metadata from the given wheel URL.
 
     This uses HTTP range requests to only fetch the portion of the wheel
     containing metadata, just enough for the object to be constructed.
+    If a ``cache`` is given, byte ranges that have been fetched before
+    are taken from it and newly fetched ranges are added to it.
 
     :raises HTTPRangeRequestUnsupportedError: if range requests are unsupported for ``url``.
     :raises InvalidWheelError: if the zip file contents could not be parsed.
     """
     try:
-        # After context manager exit, wheel.name will point to a deleted file path.
-        # Add `delete_backing_file=False` to disable this for debugging.
-        with LazyWheelOverHTTP(url, session) as lazy_file:
-            metadata_bytes = lazy_file.read_metadata(name)
+        try:
+            metadata_bytes = _read_metadata(name, url, session, cache)
+        except OutdatedRangesError:
+            assert cache is not None
+            logger.debug("discarding outdated cached byte ranges of %s", url)
+            cache.remove(url)
+            metadata_bytes = _read_metadata(name, url, session, cache)
 
         metadata, _ = parse_email(metadata_bytes)
         return metadata
@@ -113,6 +131,101 @@ def metadata_from_wheel_url(
         ) from e
 
 
+def _read_metadata(
+    name: str,
+    url: str,
+    session: Session | Authenticator,
+    cache: RangeCache | None,
+) -> bytes:
+    # After context manager exit, wheel.name will point to a deleted file path.
+    # Add `delete_backing_file=False` to disable this for debugging.
+    with LazyWheelOverHTTP(url, session, cache=cache) as lazy_file:
+        return lazy_file.read_metadata(name)
+
+
+@dataclass
+class CachedRanges:
+    etag: str
+    length: int
+    ranges: list[tuple[int, bytes]]
+
+
+class RangeCache:
+    """Persistent cache of byte ranges of remote files.
+
+    The fetched ranges of a file are stored one after another in a data file,
+    so that it only takes up as much disk space as the bytes that have actually
+    been fetched. Their positions in the remote file and in the data file are
+    recorded in an accompanying JSON file.
+    Entries are keyed by URL and only kept for files with a strong ETag,
+    which is sent as ``If-Range`` header when further ranges of the file
+    are requested in order to detect changes of the file.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        directory = self._path / key[:2] / key[2:4]
+        return directory / f"{key}.json", directory / f"{key}.data"
+
+    def get(self, url: str) -> CachedRanges | None:
+        info_path, data_path = self._paths(url)
+        try:
+            info = json.loads(info_path.read_text(encoding="utf-8"))
+            data = data_path.read_bytes()
+            # The data of another write may have replaced the data file
+            # before the info file has been replaced as well.
+            if hashlib.sha256(data).hexdigest() != info["sha256"]:
+                return None
+            ranges = [
+                (start, data[offset : offset + size])
+                for start, offset, size in info["ranges"]
+            ]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if info.get("url") != url:
+            return None
+
+        return CachedRanges(info["etag"], info["length"], ranges)
+
+    def put(
+        self, url: str, etag: str, length: int, ranges: list[tuple[int, bytes]]
+    ) -> None:
+        """Store the given (disjoint) ranges of a file, replacing the cached ones."""
+        info_path, data_path = self._paths(url)
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}-{threading.get_ident()}.tmp"
+
+        positions = []
+        offset = 0
+        for start, data in ranges:
+            positions.append((start, offset, len(data)))
+            offset += len(data)
+        data = b"".join(data for _, data in ranges)
+
+        tmp_path = data_path.with_suffix(suffix)
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, data_path)
+
+        info = {
+            "url": url,
+            "etag": etag,
+            "length": length,
+            "ranges": positions,
+            "sha256": hashlib.sha256(data).hexdigest(),
+        }
+        tmp_path = info_path.with_suffix(suffix)
+        tmp_path.write_text(json.dumps(info), encoding="utf-8")
+        os.replace(tmp_path, info_path)
+
+    def remove(self, url: str) -> None:
+        for path in self._paths(url):
+            path.unlink(missing_ok=True)
+
+
 class MergeIntervals:
     """Stateful bookkeeping to merge interval graphs."""
 
@@ -126,6 +239,11 @@ class MergeIntervals:
             f"(left={tuple(self._left)}, right={tuple(self._right)})"
         )
 
+    @property
+    def intervals(self) -> list[tuple[int, int]]:
+        """The intervals that have been covered so far."""
+        return list(zip(self._left, self._right))
+
     def _merge(
         self, start: int, end: int, left: int, right: int
     ) -> Iterator[tuple[int, int]]:
@@ -287,13 +405,22 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
 
     This uses HTTP range requests to lazily fetch the file's content into a temporary
     file. If such requests are not supported by the server, raises
-    ``HTTPRangeRequestUnsupportedError`` in the ``__enter__`` method."""
+    ``HTTPRangeRequestUnsupportedError`` in the ``__enter__`` method.
+
+    If a ``cache`` is given, the ranges of the file that have been fetched before
+    are taken from the cache and fetched ranges are stored in the cache on exit."""
+
+    # Cache this on the type to avoid trying and failing to request multiple ranges
+    # at once multiple times in the same invocation against an index
+    # without this support.
+    _domains_without_multiple_ranges: ClassVar[set[str]] = set()
 
     def __init__(
         self,
         url: str,
         session: Session | Authenticator,
         delete_backing_file: bool = True,
+        cache: RangeCache | None = None,
     ) -> None:
         inner = NamedTemporaryFile(delete=delete_backing_file)  # noqa: SIM115
         super().__init__(inner)
@@ -305,6 +432,11 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         self._session = session
         self._url = url
 
+        self._cache = cache
+        # The ETag of the remote file and whether it has been taken from the cache.
+        self._etag: str | None = None
+        self._cached_etag = False
+
     def __enter__(self) -> Self:
         super().__enter__()
         self._setup_content()
@@ -316,6 +448,8 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         exc_value: BaseException | None,
         traceback: TracebackType | None,
     ) -> None:
+        if exc_type is None:
+            self._store_ranges()
         self._reset_content()
         super().__exit__(exc_type, exc_value, traceback)
 
@@ -373,6 +507,9 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         if self._merge_intervals is None:
             self._merge_intervals = MergeIntervals()
 
+        if self._length is None and self._cache is not None:
+            self._load_ranges(self._cache)
+
         if self._length is None:
             logger.debug("begin fetching content length")
             self._length = self._fetch_content_length()
@@ -383,6 +520,55 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         else:
             logger.debug("content length already fetched (is: %d)", self._length)
 
+    def _load_ranges(self, cache: RangeCache) -> None:
+        """Write the cached ranges of the file to the backing file."""
+        assert self._merge_intervals is not None
+        cached = cache.get(self._url)
+        if cached is None:
+            return
+
+        logger.debug("using %d cached byte ranges", len(cached.ranges))
+        self._etag = cached.etag
+        self._cached_etag = True
+        self._length = cached.length
+        self.truncate(cached.length)
+        with self._stay():
+            for start, data in cached.ranges:
+                self.seek(start)
+                self._file.write(data)
+                for _ in self._merge_intervals.minimal_intervals_covering(
+                    start, start + len(data) - 1
+                ):
+                    # The returned intervals are not needed, only the bookkeeping.
+                    pass
+
+    def _store_ranges(self) -> None:
+        """Store the ranges of the file that have been fetched in the cache."""
+        if (
+            self._cache is None
+            or self._request_count == 0
+            or self._length is None
+            or self._merge_intervals is None
+            # Only strong ETags are suitable for If-Range requests.
+            or self._etag is None
+            or self._etag.startswith("W/")
+        ):
+            return
+
+        ranges = []
+        with self._stay():
+            for start, end in self._merge_intervals.intervals:
+                self.seek(start)
+                ranges.append((start, self._file.read(end - start + 1)))
+        try:
+            self._cache.put(self._url, self._etag, self._length, ranges)
+        except OSError as e:
+            logger.debug("could not cache byte ranges of %s: %s", self._url, e)
+
+    def _remember_etag(self, response: Response) -> None:
+        if self._etag is None:
+            self._etag = response.headers.get("ETag")
+
     def _reset_content(self) -> None:
         """Unset the internal length field and merge intervals.
 
@@ -409,6 +595,7 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         )
         head.raise_for_status()
         assert head.status_code == codes.ok
+        self._remember_etag(head)
         accepted_range = head.headers.get("Accept-Ranges", None)
         if accepted_range != "bytes":
             raise HTTPRangeRequestUnsupportedError(
@@ -422,16 +609,32 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         #     again in LazyWheelOverHTTP.
         return self._content_length_from_head()
 
+    def _range_headers(self, ranges: Iterable[tuple[int, int]]) -> dict[str, str]:
+        headers = self._uncached_headers()
+        headers["Range"] = "bytes=" + ",".join(
+            f"{start}-{end}" for start, end in ranges
+        )
+        if self._cached_etag:
+            # Only return the ranges if the file has not changed.
+            assert self._etag is not None
+            headers["If-Range"] = self._etag
+        return headers
+
+    def _check_not_outdated(self, response: Response) -> None:
+        if self._cached_etag and response.status_code == codes.ok:
+            raise OutdatedRangesError(f"{self._url} has changed")
+
     def _stream_response(self, start: int, end: int) -> Response:
         """Return streaming HTTP response to a range request from start to end."""
-        headers = self._uncached_headers()
-        headers["Range"] = f"bytes={start}-{end}"
+        headers = self._range_headers([(start, end)])
         logger.debug("streamed bytes request: %s", headers["Range"])
         self._request_count += 1
 
         response = self._session.get(self._url, headers=headers, stream=True)
         try:
             response.raise_for_status()
+            self._check_not_outdated(response)
+            self._remember_etag(response)
             if int(response.headers["Content-Length"]) != (end - start + 1):
                 raise HTTPRangeRequestNotRespectedError(
                     f"server did not respect byte range request: "
@@ -453,6 +656,106 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         with self._stream_response(start, end) as response:
             yield from response.iter_content(CONTENT_CHUNK_SIZE)
 
+    def _fetch_content_ranges(
+        self, ranges: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """Request multiple byte ranges at once and write them to the backing file.
+
+        Return the ranges that are still missing, e.g. because the server only
+        returned a single range or does not support multiple ranges at all.
+        """
+        domain = urlparse(self._url).netloc
+        if domain in self._domains_without_multiple_ranges:
+            return ranges
+
+        headers = self._range_headers(ranges)
+        logger.debug("multiple bytes request: %s", headers["Range"])
+        self._request_count += 1
+
+        try:
+            with self._session.get(self._url, headers=headers, stream=True) as response:
+                response.raise_for_status()
+                self._check_not_outdated(response)
+                self._remember_etag(response)
+                if response.status_code != codes.partial_content:
+                    raise HTTPRangeRequestNotRespectedError(
+                        f"did not receive partial content: got code"
+                        f" {response.status_code}"
+                    )
+                parts = self._parse_partial_content(response)
+        except (HTTPError, LazyWheelUnsupportedError) as e:
+            logger.debug(
+                "Multiple byte ranges not supported for domain '%s': %s", domain, e
+            )
+            self._domains_without_multiple_ranges.add(domain)
+            return ranges
+
+        for start, data in parts:
+            self.seek(start)
+            self._file.write(data)
+
+        missing = [
+            (start, end)
+            for start, end in ranges
+            if not any(
+                part_start <= start and end < part_start + len(data)
+                for part_start, data in parts
+            )
+        ]
+        if missing:
+            self._domains_without_multiple_ranges.add(domain)
+        return missing
+
+    @classmethod
+    def _parse_partial_content(cls, response: Response) -> list[tuple[int, bytes]]:
+        """Return the ranges of a partial content response with one or more parts."""
+        content_type = response.headers.get("Content-Type", "")
+        m = re.match(
+            r'multipart/byteranges;.*boundary="?([^";]+)"?', content_type, re.IGNORECASE
+        )
+        if m is None:
+            start, end = cls._parse_content_range(
+                response.headers.get("Content-Range", "")
+            )
+            if len(response.content) != end - start + 1:
+                raise HTTPRangeRequestNotRespectedError(
+                    "incomplete partial content response"
+                )
+            return [(start, response.content)]
+
+        parts = []
+        delimiter = b"--" + m.group(1).encode()
+        for part in response.content.split(delimiter)[1:]:
+            if part.startswith(b"--"):
+                # closing delimiter
+                break
+            part_headers, _, body = part.partition(b"\r\n\r\n")
+            header = re.search(
+                rb"^content-range:(.*)$", part_headers, re.IGNORECASE | re.MULTILINE
+            )
+            if header is None:
+                raise HTTPRangeRequestNotRespectedError(
+                    "missing Content-Range of multipart response"
+                )
+            start, end = cls._parse_content_range(header.group(1).decode().strip())
+            data = body[: end - start + 1]
+            if len(data) != end - start + 1:
+                raise HTTPRangeRequestNotRespectedError(
+                    "incomplete part of multipart response"
+                )
+            parts.append((start, data))
+        return parts
+
+    @staticmethod
+    def _parse_content_range(arg: str) -> tuple[int, int]:
+        """Parse the first and last byte position from a Content-Range header."""
+        m = re.match(r"bytes ([0-9]+)-([0-9]+)/", arg)
+        if m is None:
+            raise HTTPRangeRequestNotRespectedError(
+                f"could not parse Content-Range: '{arg}'"
+            )
+        return int(m.group(1)), int(m.group(2))
+
     @contextmanager
     def _stay(self) -> Iterator[None]:
         """Return a context manager keeping the position.
@@ -476,11 +779,11 @@ class LazyFileOverHTTP(ReadOnlyIOWrapper):
         # Reducing by 1 to get an inclusive end range.
         end -= 1
         with self._stay():
-            for (
-                range_start,
-                range_end,
-            ) in self._merge_intervals.minimal_intervals_covering(start, end):
-                self.seek(start)
+            ranges = list(self._merge_intervals.minimal_intervals_covering(start, end))
+            if len(ranges) > 1:
+                ranges = self._fetch_content_ranges(ranges)
+            for range_start, range_end in ranges:
+                self.seek(range_start)
                 for chunk in self._fetch_content_range(range_start, range_end):
                     self._file.write(chunk)
 
@@ -608,6 +911,7 @@ class LazyWheelOverHTTP(LazyFileOverHTTP):
         tail = self._session.get(self._url, headers=headers, stream=True)
         try:
             tail.raise_for_status()
+            self._remember_etag(tail)
 
             code = tail.status_code
             if code != codes.partial_content:
@@ -22,6 +22,7 @@ from poetry.installation.chooser import Chooser
 from poetry.installation.operations import Install
 from poetry.installation.operations import Uninstall
 from poetry.installation.operations import Update
+from poetry.installation.uninstaller import Uninstaller
 from poetry.installation.wheel_installer import WheelInstaller
 from poetry.puzzle.exceptions import SolverProblemError
 from poetry.utils._compat import decode
@@ -40,6 +41,7 @@ from poetry.vcs.git import Git
 if TYPE_CHECKING:
     from collections.abc import Mapping
     from collections.abc import Sequence
+    from concurrent.futures import Future
 
     from cleo.io.io import IO
     from cleo.io.outputs.section_output import SectionOutput
@@ -74,6 +76,12 @@ class Executor:
         self._enabled = True
         self._verbose = False
         self._wheel_installer = WheelInstaller(self._env)
+        # Bytecode is compiled for all installed packages at once after installation.
+        self._wheel_installer.defer_bytecode_compilation()
+        self._uninstaller = Uninstaller(self._env)
+        self._wheel_installer.enable_linking_from_cache(
+            config.get("installer.link-from-cache", False)
+        )
 
         if parallel is None:
             parallel = config.get("installer.parallel", True)
@@ -83,20 +91,32 @@ class Executor:
         else:
             self._max_workers = 1
 
+        self._download_segments: int = config.get("installer.download-segments", 1)
+
         self._artifact_cache = pool.artifact_cache
+        # Each worker may download the segments of a file concurrently.
         self._authenticator = Authenticator(
-            config, self._io, disable_cache=disable_cache, pool_size=self._max_workers
+            config,
+            self._io,
+            disable_cache=disable_cache,
+            pool_size=self._max_workers * self._download_segments,
         )
         self._chef = Chef(self._artifact_cache, self._env, pool)
         self._chooser = Chooser(pool, self._env, config)
 
         self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        # Archives are downloaded by separate workers, so that downloads
+        # are not held back by the installation of preceding operations.
+        self._download_executor = ThreadPoolExecutor(max_workers=self._max_workers)
+        self._archives: dict[int, Future[Path]] = {}
         self._executed = {"install": 0, "update": 0, "uninstall": 0}
         self._skipped = {"install": 0, "update": 0, "uninstall": 0}
         self._sections: dict[int, SectionOutput] = {}
         self._yanked_warnings: list[str] = []
         self._lock = threading.Lock()
+        self._pip_lock = threading.Lock()
         self._shutdown = False
+        self._interrupted = False
         self._hashes: dict[str, str] = {}
 
         # Cache whether decorated output is supported.
@@ -156,6 +176,7 @@ class Executor:
 
         self._sections = {}
         self._yanked_warnings = []
+        self._archives = {}
 
         # pip has to be installed/updated first without parallelism
         # because we still need it for uninstalls
@@ -165,6 +186,16 @@ class Executor:
                 del operations[i]
                 break
 
+        # Start downloading the archives of all operations in order,
+        # independently of the groups in which they are installed.
+        for operation in operations:
+            if isinstance(operation, (Install, Update)) and self._should_prefetch(
+                operation
+            ):
+                self._archives[id(operation)] = self._download_executor.submit(
+                    self._prefetch_archive, operation
+                )
+
         # We group operations by priority
         groups = itertools.groupby(operations, key=lambda o: -o.priority)
         for _, group in groups:
@@ -181,9 +212,11 @@ class Executor:
                 #
                 # We need to explicitly check source type here, see:
                 # https://github.com/python-poetry/poetry-core/pull/98
-                is_parallel_unsafe = operation.job_type == "uninstall" or (
-                    operation.package.develop
-                    and operation.package.source_type in {"directory", "git"}
+                #
+                # Uninstalls are safe because pip is only used as a fallback
+                # that is serialized in _remove().
+                is_parallel_unsafe = operation.package.develop and (
+                    operation.package.source_type in {"directory", "git"}
                 )
                 # Skipped operations are safe to execute in parallel
                 if operation.skipped:
@@ -225,11 +258,22 @@ class Executor:
 
             except KeyboardInterrupt:
                 self._shutdown = True
+                self._interrupted = True
 
             if self._shutdown:
+                self._download_executor.shutdown(wait=True, cancel_futures=True)
                 self._executor.shutdown(wait=True, cancel_futures=True)
                 break
 
+        # The modules of packages that have been installed are compiled
+        # even if other operations have failed, but not after an interruption.
+        if self._interrupted:
+            self._wheel_installer.discard_pending_bytecode()
+        else:
+            self._wheel_installer.compile_bytecode(
+                max_workers=None if self._max_workers > 1 else 1
+            )
+
         for warning in self._yanked_warnings:
             self._io.write_error_line(f"<warning>Warning: {warning}</warning>")
         for path, issues in self._wheel_installer.invalid_wheels.items():
@@ -261,19 +305,23 @@ class Executor:
             section.clear()
             section.write(line)
 
+    def _add_section(self, operation: Operation) -> None:
+        with self._lock:
+            if id(operation) not in self._sections and self._should_write_operation(
+                operation
+            ):
+                self._sections[id(operation)] = self._io.section()
+                self._sections[id(operation)].write_line(
+                    f"  <fg=blue;options=bold>-</> "
+                    f"{self.get_operation_message(operation)}:"
+                    " <fg=blue>Pending...</>"
+                )
+
     def _execute_operation(self, operation: Operation) -> None:
         try:
             op_message = self.get_operation_message(operation)
             if self.supports_fancy_output():
-                if id(operation) not in self._sections and self._should_write_operation(
-                    operation
-                ):
-                    with self._lock:
-                        self._sections[id(operation)] = self._io.section()
-                        self._sections[id(operation)].write_line(
-                            f"  <fg=blue;options=bold>-</> {op_message}:"
-                            " <fg=blue>Pending...</>"
-                        )
+                self._add_section(operation)
             else:
                 if self._should_write_operation(operation):
                     if not operation.skipped:
@@ -388,6 +436,7 @@ class Executor:
             finally:
                 with self._lock:
                     self._shutdown = True
+                    self._interrupted = True
 
     def _do_execute_operation(self, operation: Operation) -> int:
         method = operation.job_type
@@ -558,6 +607,7 @@ class Executor:
         package = operation.package
 
         cleanup_archive: bool = False
+        cached_archive: bool = False
         if package.source_type == "git":
             archive = self._prepare_git_archive(operation)
             cleanup_archive = operation.package.develop
@@ -566,11 +616,9 @@ class Executor:
         elif package.source_type == "directory":
             archive = self._prepare_archive(operation)
             cleanup_archive = True
-        elif package.source_type == "url":
-            assert package.source_url is not None
-            archive = self._download_link(operation, Link(package.source_url))
         else:
-            archive = self._download(operation)
+            archive = self._get_archive(operation)
+            cached_archive = True
 
         operation_message = self.get_operation_message(operation)
         message = (
@@ -587,7 +635,7 @@ class Executor:
                 assert isinstance(operation, Update)
                 self._remove(operation.initial_package)
 
-            self._wheel_installer.install(archive)
+            self._wheel_installer.install(archive, cached=cached_archive)
         finally:
             if cleanup_archive:
                 archive.unlink()
@@ -597,6 +645,43 @@ class Executor:
     def _update(self, operation: Install | Update) -> int:
         return self._install(operation)
 
+    def _should_prefetch(self, operation: Install | Update) -> bool:
+        return (
+            self._max_workers > 1
+            and self._enabled
+            and not self._dry_run
+            and not operation.skipped
+            and operation.package.source_type not in {"git", "file", "directory"}
+        )
+
+    def _prefetch_archive(self, operation: Install | Update) -> Path:
+        if self._shutdown:
+            raise RuntimeError("Installation has been cancelled.")
+
+        if self.supports_fancy_output():
+            self._add_section(operation)
+
+        return self._fetch_archive(operation)
+
+    def _get_archive(self, operation: Install | Update) -> Path:
+        """
+        Return the archive of an operation that has been prefetched,
+        or fetch it if it has not.
+        """
+        future = self._archives.pop(id(operation), None)
+        if future is None:
+            return self._fetch_archive(operation)
+
+        return future.result()
+
+    def _fetch_archive(self, operation: Install | Update) -> Path:
+        package = operation.package
+        if package.source_type == "url":
+            assert package.source_url is not None
+            return self._download_link(operation, Link(package.source_url))
+
+        return self._download(operation)
+
     def _remove(self, package: Package) -> int:
         # If we have a VCS package, remove its source directory
         if package.source_type == "git":
@@ -604,13 +689,19 @@ class Executor:
             if src_dir.exists():
                 remove_directory(src_dir, force=True)
 
-        try:
-            return self.run_pip("uninstall", package.name, "-y")
-        except CalledProcessError as e:
-            if "not installed" in str(e):
-                return 0
+        if self._uninstaller.uninstall(package.name):
+            return 0
 
-            raise
+        # Fall back to pip for distributions that cannot be removed based on
+        # their RECORD file. pip must not remove distributions in parallel.
+        with self._pip_lock:
+            try:
+                return self.run_pip("uninstall", package.name, "-y")
+            except CalledProcessError as e:
+                if "not installed" in str(e):
+                    return 0
+
+                raise
 
     def _prepare_archive(
         self, operation: Install | Update, *, output_dir: Path | None = None
@@ -787,7 +878,11 @@ class Executor:
         dest: Path,
     ) -> None:
         downloader = Downloader(
-            url, dest, self._authenticator, max_retries=self._max_retries
+            url,
+            dest,
+            self._authenticator,
+            max_retries=self._max_retries,
+            segments=self._download_segments,
         )
         wheel_size = downloader.total_size
 
@@ -812,7 +907,7 @@ class Executor:
                 self._sections[id(operation)].clear()
                 progress.start()
 
-        for fetched_size in downloader.download_with_progress(chunk_size=4096):
+        for fetched_size in downloader.download_with_progress():
             if progress:
                 with self._lock:
                     progress.set_progress(fetched_size)
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import logging
+import sqlite3
+
 from typing import TYPE_CHECKING
 from typing import cast
 
@@ -7,11 +10,13 @@ from cleo.io.null_io import NullIO
 from packaging.utils import canonicalize_name
 
 from poetry.installation.executor import Executor
+from poetry.puzzle.resolution_cache import ResolutionCache
 from poetry.puzzle.transaction import Transaction
 from poetry.repositories import Repository
 from poetry.repositories import RepositoryPool
 from poetry.repositories.installed_repository import InstalledRepository
 from poetry.repositories.lockfile_repository import LockfileRepository
+from poetry.utils.cache import CachePruner
 
 
 if TYPE_CHECKING:
@@ -27,9 +32,13 @@ if TYPE_CHECKING:
     from poetry.installation.operations.operation import Operation
     from poetry.packages import Locker
     from poetry.packages.transitive_package_info import TransitivePackageInfo
+    from poetry.puzzle.solver import Solver
     from poetry.utils.env import Env
 
 
+logger = logging.getLogger(__name__)
+
+
 class Installer:
     def __init__(
         self,
@@ -194,10 +203,9 @@ class Installer:
             p.name for p in locked_repository.packages if p.source_type == "directory"
         ]
 
-        with solver.provider.use_source_root(
-            source_root=self._env.path.joinpath("src")
-        ):
-            solved_packages = solver.solve(use_latest=use_latest).get_solved_packages()
+        solved_packages = self._solve(
+            solver, locked_repository.packages, use_latest=use_latest
+        )
 
         self._write_lock_file(solved_packages, force=True)
 
@@ -235,12 +243,9 @@ class Installer:
                 self._io,
             )
 
-            with solver.provider.use_source_root(
-                source_root=self._env.path.joinpath("src")
-            ):
-                solved_packages = solver.solve(
-                    use_latest=self._whitelist
-                ).get_solved_packages()
+            solved_packages = self._solve(
+                solver, locked_repository.packages, use_latest=self._whitelist
+            )
 
             if not self.executor.enabled:
                 # If we are only in lock mode, no need to go any further
@@ -371,6 +376,41 @@ class Installer:
 
         return status
 
+    def _solve(
+        self,
+        solver: Solver,
+        locked: list[Package],
+        use_latest: list[NormalizedName],
+    ) -> dict[Package, TransitivePackageInfo]:
+        resolution_cache = None
+        if self._config.get("solver.resolution-cache"):
+            resolution_cache = ResolutionCache(self._locker, self._pool, self._config)
+            packages = resolution_cache.get(locked, use_latest)
+            if packages is not None:
+                self._io.write_line("<info>Using cached dependency resolution</>")
+                return packages
+
+        with solver.provider.use_source_root(
+            source_root=self._env.path.joinpath("src")
+        ):
+            packages = solver.solve(
+                use_latest=use_latest, incremental=self._can_solve_incrementally()
+            ).get_solved_packages()
+
+        if resolution_cache is not None:
+            resolution_cache.put(locked, use_latest, packages)
+
+        return packages
+
+    def _can_solve_incrementally(self) -> bool:
+        if not self._config.get("solver.incremental") or not self._locker.is_locked():
+            return False
+
+        # The lock file only contains the dependencies that are relevant
+        # for the Python versions that were supported when locking.
+        metadata = self._locker.lock_data["metadata"]
+        return bool(metadata.get("python-versions") == self._package.python_versions)
+
     def _write_lock_file(
         self,
         packages: dict[Package, TransitivePackageInfo],
@@ -384,7 +424,29 @@ class Installer:
                 self._io.write_line("<info>Writing lock file</>")
 
     def _execute(self, operations: list[Operation]) -> int:
-        return self._executor.execute(operations)
+        result = self._executor.execute(operations)
+        if result == 0 and not self.is_dry_run():
+            self._prune_cache()
+
+        return result
+
+    def _prune_cache(self) -> None:
+        max_size = self._config.cache_max_size
+        if max_size is None:
+            return
+
+        try:
+            result = CachePruner.from_config(self._config).prune_if_due(max_size)
+        except (OSError, sqlite3.Error) as e:
+            logger.debug("Failed to prune the cache: %s", e)
+            return
+
+        if result is not None:
+            logger.debug(
+                "Pruned %d cache entries (%d bytes)",
+                len(result.evicted),
+                result.evicted_size,
+            )
 
     def _get_installed(self) -> InstalledRepository:
         return InstalledRepository.load(self._env)
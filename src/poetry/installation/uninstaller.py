@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import glob
+import logging
+import os
+
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from poetry.utils._compat import WINDOWS
+from poetry.utils.helpers import remove_directory
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from poetry.utils._compat import metadata
+    from poetry.utils.env import Env
+
+
+logger = logging.getLogger(__name__)
+
+
+class Uninstaller:
+    """
+    Removes distributions from an environment by deleting the files
+    that are listed in their RECORD files, without running pip.
+
+    A file is only removed if it is located in the environment and if its size
+    still matches its RECORD entry. Files that have been replaced by another
+    distribution are kept, so that distributions can be removed in parallel.
+    Compiled bytecode of removed modules, console scripts of the distribution
+    and directories that become empty are removed as well.
+    """
+
+    def __init__(self, env: Env) -> None:
+        self._env = env
+
+    def uninstall(self, name: str) -> bool:
+        """
+        Remove all installed distributions with the given name.
+
+        Returns False without removing anything if no such distribution is found
+        or if one of them cannot be removed based on its RECORD file, e.g. because
+        it has been installed by a legacy installer, so that the caller
+        can fall back to pip.
+        """
+        distributions = list(self._env.site_packages.distributions(name=name))
+        if not distributions or not all(map(self._can_uninstall, distributions)):
+            return False
+
+        for distribution in distributions:
+            self._uninstall(distribution)
+
+        return True
+
+    @cached_property
+    def _roots(self) -> set[Path]:
+        """
+        The directories in which files may be removed. They are never removed.
+        """
+        paths = self._env.paths
+        # The user base is not a root, since it is set for virtual environments
+        # as well. Writable user site-packages are part of the candidates.
+        roots = {
+            Path(paths[key])
+            for key in ("purelib", "platlib", "scripts", "data")
+            if key in paths
+        }
+        roots.update(self._env.site_packages.candidates)
+        return {Path(os.path.normpath(root)) for root in roots}
+
+    @staticmethod
+    def _dist_path(distribution: metadata.Distribution) -> Path:
+        path: Path = distribution._path  # type: ignore[attr-defined]
+        return path
+
+    def _can_uninstall(self, distribution: metadata.Distribution) -> bool:
+        path = self._dist_path(distribution)
+        if path.suffix != ".dist-info" or distribution.read_text("RECORD") is None:
+            logger.debug("%s has no RECORD file", path)
+            return False
+
+        if not os.access(path.parent, os.W_OK):
+            logger.debug("%s is not writable", path.parent)
+            return False
+
+        return True
+
+    def _uninstall(self, distribution: metadata.Distribution) -> None:
+        # Collect all files before removing any of them,
+        # since the metadata of the distribution is read lazily.
+        files = list(self._files(distribution))
+        directories = set()
+        for path in files:
+            if path.suffix == ".py":
+                # Bytecode that has been compiled when the module was imported
+                # is not necessarily listed in RECORD.
+                pycache = path.parent / "__pycache__"
+                for pyc in pycache.glob(f"{glob.escape(path.stem)}.*.pyc"):
+                    pyc.unlink(missing_ok=True)
+                directories.add(pycache)
+
+            path.unlink(missing_ok=True)
+            directories.add(path.parent)
+
+        dist_path = self._dist_path(distribution)
+        if dist_path.exists():
+            remove_directory(dist_path, force=True)
+
+        self._remove_empty_directories(directories)
+
+    def _files(self, distribution: metadata.Distribution) -> Iterable[Path]:
+        for file in distribution.files or []:
+            located_path = distribution.locate_file(file)
+            assert isinstance(located_path, Path)
+            path = Path(os.path.normpath(located_path))
+            if not self._is_in_environment(path):
+                logger.debug("Not removing %s, it is outside of the environment", path)
+                continue
+
+            try:
+                size = path.lstat().st_size
+            except FileNotFoundError:
+                continue
+
+            if file.size is not None and size != file.size:
+                logger.debug(
+                    "Not removing %s, it has been replaced by another distribution",
+                    path,
+                )
+                continue
+
+            yield path
+
+        # Scripts are usually listed in RECORD, but not by all installers.
+        scripts = Path(self._env.paths["scripts"])
+        for entry_point in distribution.entry_points:
+            if entry_point.group not in {"console_scripts", "gui_scripts"}:
+                continue
+
+            names = [entry_point.name]
+            if WINDOWS:
+                names += [
+                    f"{entry_point.name}.exe",
+                    f"{entry_point.name}-script.py",
+                    f"{entry_point.name}-script.pyw",
+                ]
+            for name in names:
+                path = scripts / name
+                if path.is_file():
+                    yield path
+
+    def _is_in_environment(self, path: Path) -> bool:
+        return any(root in path.parents for root in self._roots)
+
+    def _remove_empty_directories(self, directories: set[Path]) -> None:
+        # Remove the deepest directories first so that their parents can be removed.
+        for directory in sorted(directories, key=lambda d: len(d.parts), reverse=True):
+            while directory not in self._roots and self._is_in_environment(directory):
+                try:
+                    directory.rmdir()
+                except OSError:
+                    # The directory is not empty or has already been removed.
+                    break
+                directory = directory.parent
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import errno
+import importlib.util
+import json
 import logging
+import os
 import platform
+import shutil
+import stat
 import sys
+import threading
+import zipfile
 
 from pathlib import Path
+from pathlib import PurePosixPath
 from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+from typing import cast
 
 from installer import install
 from installer.destinations import SchemeDictionaryDestination
@@ -18,20 +30,336 @@ from poetry.utils._compat import WINDOWS
 
 logger = logging.getLogger(__name__)
 
+# The number of modules that are compiled in one task by a worker process.
+BYTECODE_BATCH_SIZE = 100
+
+
 if TYPE_CHECKING:
     from collections.abc import Collection
+    from collections.abc import Iterable
+    from collections.abc import Iterator
     from typing import BinaryIO
 
     from installer.records import RecordEntry
     from installer.scripts import LauncherKind
+    from installer.sources import WheelContentElement
     from installer.utils import Scheme
 
     from poetry.utils.env import Env
 
 
+class FileLinker:
+    """
+    Links files into environments: via reflinks (copy-on-write clones)
+    where the file system supports them, otherwise via hardlinks,
+    otherwise by copying them.
+    """
+
+    METHODS = ("reflink", "hardlink", "copy")
+
+    # Errors that mean that a method is not supported between the cache
+    # and the environment, e.g. because they are on different file systems.
+    UNSUPPORTED_ERRNOS: ClassVar[dict[str, set[int]]] = {
+        "reflink": {
+            errno.EXDEV,
+            errno.EPERM,
+            errno.EOPNOTSUPP,
+            errno.ENOTSUP,
+            # FICLONE is not implemented by the file system.
+            errno.ENOTTY,
+            errno.EINVAL,
+        },
+        "hardlink": {errno.EXDEV, errno.EPERM, errno.EOPNOTSUPP, errno.ENOTSUP},
+    }
+
+    def __init__(self) -> None:
+        # Unsupported methods are not tried again.
+        self._unsupported: set[str] = set()
+        self._lock = threading.Lock()
+
+    def link(self, source: Path, target: Path) -> str:
+        """
+        Link source to target, which must not exist, and return the used method.
+
+        Other errors than the ones that mean that a method is not supported,
+        e.g. too many links to a file, only make the method fall back
+        for this file.
+        """
+        for method in self.METHODS:
+            if method in self._unsupported:
+                continue
+            try:
+                getattr(self, f"_{method}")(source, target)
+            except FileNotFoundError:
+                raise
+            except OSError as e:
+                if method == "copy":
+                    raise
+                logger.debug("Cannot %s %s: %s", method, source, e)
+                if e.errno in self.UNSUPPORTED_ERRNOS[method]:
+                    with self._lock:
+                        self._unsupported.add(method)
+                continue
+            return method
+
+        raise AssertionError("copying is always supported")
+
+    @staticmethod
+    def _reflink(source: Path, target: Path) -> None:
+        if sys.platform == "linux":
+            import fcntl
+
+            # FICLONE from linux/fs.h
+            ficlone = 0x40049409
+            try:
+                with source.open("rb") as src, target.open("wb") as dst:
+                    fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+            except OSError:
+                target.unlink(missing_ok=True)
+                raise
+            shutil.copymode(source, target)
+        elif sys.platform == "darwin":
+            import ctypes
+
+            libc = ctypes.CDLL(None, use_errno=True)
+            if libc.clonefile(os.fsencode(source), os.fsencode(target), 0) != 0:
+                error = ctypes.get_errno()
+                raise OSError(error, os.strerror(error))
+        else:
+            raise OSError(errno.ENOTSUP, "reflinks are not supported")
+
+    @staticmethod
+    def _hardlink(source: Path, target: Path) -> None:
+        os.link(source, target)
+
+    @staticmethod
+    def _copy(source: Path, target: Path) -> None:
+        shutil.copy2(source, target)
+
+
+class UnpackedWheel:
+    """
+    An unpacked copy of a wheel, which is kept next to the wheel in the artifact cache
+    so that its files can be linked into environments instead of being extracted.
+
+    The hashes and sizes of all files are recorded when the wheel is unpacked,
+    so that they do not have to be computed again for the RECORD file.
+    """
+
+    MANIFEST = "manifest.json"
+
+    def __init__(
+        self, path: Path, hash_algorithm: str, files: dict[str, tuple[str, int]]
+    ) -> None:
+        self._files_path = path / "files"
+        self._hash_algorithm = hash_algorithm
+        self._files = files
+
+    @staticmethod
+    def path_for(wheel: Path) -> Path:
+        return wheel.with_name(f"{wheel.name}.unpacked")
+
+    @classmethod
+    def load(cls, wheel: Path) -> UnpackedWheel | None:
+        """
+        Return the unpacked copy of a wheel or None if there is none.
+        An invalid copy, e.g. from an older version of Poetry, is removed.
+        """
+        path = cls.path_for(wheel)
+        try:
+            manifest = json.loads((path / cls.MANIFEST).read_text(encoding="utf-8"))
+            return cls(
+                path,
+                manifest["hash_algorithm"],
+                {name: (h, size) for name, (h, size) in manifest["files"].items()},
+            )
+        except FileNotFoundError:
+            # Copies are renamed into place with their manifest,
+            # so there is none (yet).
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug("Removing invalid unpacked wheel %s: %s", path, e)
+            cls._remove(path)
+            return None
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        # Renaming is atomic, so that other processes either see
+        # the complete copy or none.
+        removed = path.with_name(f"{path.name}.{os.getpid()}~")
+        try:
+            path.rename(removed)
+        except OSError:
+            # The copy has already been removed by another process.
+            return
+        shutil.rmtree(removed, ignore_errors=True)
+
+    @classmethod
+    def create(
+        cls, wheel: Path, zip_file: zipfile.ZipFile, hash_algorithm: str
+    ) -> UnpackedWheel:
+        from installer.utils import copyfileobj_with_hashing
+        from installer.utils import make_file_executable
+
+        path = cls.path_for(wheel)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}")
+        files_path = tmp_path / "files"
+        files = {}
+        try:
+            for item in zip_file.infolist():
+                if item.is_dir():
+                    continue
+                name = PurePosixPath(item.filename)
+                if name.is_absolute() or ".." in name.parts:
+                    raise ValueError(f"Invalid path in wheel: {item.filename}")
+
+                target = files_path.joinpath(*name.parts)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                with zip_file.open(item) as src, target.open("wb") as dst:
+                    files[item.filename] = copyfileobj_with_hashing(
+                        cast("BinaryIO", src), dst, hash_algorithm
+                    )
+                mode = item.external_attr >> 16
+                if mode and stat.S_ISREG(mode) and mode & 0o111:
+                    make_file_executable(target)
+
+            (tmp_path / cls.MANIFEST).write_text(
+                json.dumps({"hash_algorithm": hash_algorithm, "files": files}),
+                encoding="utf-8",
+            )
+            # Renaming is atomic, so that a partially unpacked wheel is never used.
+            try:
+                tmp_path.rename(path)
+            except OSError:
+                # The wheel might have been unpacked concurrently.
+                unpacked = cls.load(wheel)
+                if unpacked is None:
+                    raise
+                return unpacked
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+        return cls(path, hash_algorithm, files)
+
+    def open(self, name: str) -> BinaryIO:
+        return self._files_path.joinpath(*PurePosixPath(name).parts).open("rb")
+
+    def get(
+        self, stream: BinaryIO, hash_algorithm: str
+    ) -> tuple[Path, str, int] | None:
+        """
+        Return the path, hash and size of the unpacked file
+        that has been opened as stream, if any.
+        """
+        if hash_algorithm != self._hash_algorithm:
+            return None
+        name = getattr(stream, "name", None)
+        if not isinstance(name, str):
+            return None
+        try:
+            relative = Path(name).relative_to(self._files_path)
+        except ValueError:
+            return None
+        if stream.tell() != 0:
+            return None
+
+        entry = self._files.get(relative.as_posix())
+        if entry is None:
+            return None
+
+        return Path(name), *entry
+
+
+class UnpackedWheelFile(WheelFile):
+    """
+    A wheel whose contents are read from its unpacked copy.
+    """
+
+    def __init__(self, f: zipfile.ZipFile, unpacked: UnpackedWheel) -> None:
+        super().__init__(f)
+        self.unpacked = unpacked
+
+    def get_contents(self) -> Iterator[WheelContentElement]:
+        from installer.records import parse_record_file
+
+        records = parse_record_file(self.read_dist_info("RECORD").splitlines())
+        record_mapping = {record[0]: record for record in records}
+
+        for item in self._zipfile.infolist():
+            if item.is_dir():
+                continue
+
+            record = record_mapping.pop(item.filename, (item.filename, "", ""))
+            mode = item.external_attr >> 16
+            is_executable = bool(mode and stat.S_ISREG(mode) and mode & 0o111)
+
+            with self.unpacked.open(item.filename) as stream:
+                yield record, stream, is_executable
+
+
+def _compile_files(files: list[tuple[str, int]]) -> None:
+    import compileall
+
+    for path, optimization_level in files:
+        compileall.compile_file(path, optimize=optimization_level, quiet=1)
+
+
 class WheelDestination(SchemeDictionaryDestination):
     """ """
 
+    def __init__(
+        self,
+        *args: Any,
+        unpacked: UnpackedWheel | None = None,
+        linker: FileLinker | None = None,
+        bytecode_files: list[tuple[str, int]] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self._unpacked = unpacked
+        self._linker = linker or FileLinker()
+        # If given, the files to compile are collected instead of compiled.
+        self._bytecode_files = bytecode_files
+
+    def finalize_installation(
+        self,
+        scheme: Scheme,
+        record_file_path: str,
+        records: Iterable[tuple[Scheme, RecordEntry]],
+    ) -> None:
+        from installer.records import RecordEntry
+
+        record_list = list(records)
+        if self._bytecode_files is not None:
+            # The bytecode is compiled later, but RECORD must list it nonetheless.
+            record_list += [
+                (file_scheme, RecordEntry(path, None, None))
+                for file_scheme, record in record_list
+                if file_scheme in ("purelib", "platlib") and record.path.endswith(".py")
+                for path in self._bytecode_paths(record.path)
+            ]
+
+        super().finalize_installation(scheme, record_file_path, record_list)
+
+    def _compile_bytecode(self, scheme: Scheme, record: RecordEntry) -> None:
+        if self._bytecode_files is None:
+            super()._compile_bytecode(scheme, record)
+            return
+
+        if scheme in ("purelib", "platlib") and record.path.endswith(".py"):
+            target_path = self._path_with_destdir(scheme, record.path)
+            self._bytecode_files.extend(
+                (target_path, level) for level in self.bytecode_optimization_levels
+            )
+
+    def _bytecode_paths(self, path: str) -> set[str]:
+        return {
+            importlib.util.cache_from_source(
+                path, optimization=None if level == -1 else (level or "")
+            ).replace(os.sep, "/")
+            for level in self.bytecode_optimization_levels
+        }
+
     def write_to_fs(
         self,
         scheme: Scheme,
@@ -49,6 +377,9 @@ class WheelDestination(SchemeDictionaryDestination):
             # Contrary to the base library we don't raise an error here since it can
             # break pkgutil-style and pkg_resource-style namespace packages.
             logger.warning(f"Installing {target_path} over existing file")
+            # The existing file might be linked to an unpacked wheel,
+            # which must not be modified.
+            target_path.unlink()
 
         parent_folder = target_path.parent
         if not parent_folder.exists():
@@ -56,6 +387,13 @@ class WheelDestination(SchemeDictionaryDestination):
             # that two threads try to create the directory.
             parent_folder.mkdir(parents=True, exist_ok=True)
 
+        if self._unpacked is not None:
+            unpacked_file = self._unpacked.get(stream, self.hash_algorithm)
+            if unpacked_file is not None:
+                source_path, hash_, size = unpacked_file
+                self._linker.link(source_path, target_path)
+                return RecordEntry(path, Hash(self.hash_algorithm, hash_), size)
+
         with target_path.open("wb") as f:
             hash_, size = copyfileobj_with_hashing(stream, f, self.hash_algorithm)
 
@@ -80,13 +418,81 @@ class WheelInstaller:
         self._script_kind = script_kind
 
         self._bytecode_optimization_levels: Collection[int] = ()
+        self._defer_bytecode_compilation = False
+        self._pending_bytecode_files: list[tuple[str, int]] = []
+        self._lock = threading.Lock()
+        self._link_from_cache = False
+        self._linker = FileLinker()
         self.invalid_wheels: dict[Path, list[str]] = {}
 
     def enable_bytecode_compilation(self, enable: bool = True) -> None:
         self._bytecode_optimization_levels = (-1,) if enable else ()
 
-    def install(self, wheel: Path) -> None:
-        with WheelFile.open(wheel) as source:
+    def defer_bytecode_compilation(self, defer: bool = True) -> None:
+        """
+        Collect the modules of installed wheels instead of compiling them
+        one by one, so that they can be compiled at once by compile_bytecode().
+        """
+        self._defer_bytecode_compilation = defer
+
+    def compile_bytecode(self, max_workers: int | None = None) -> None:
+        """
+        Compile the bytecode of all modules that have been installed
+        since the last compilation, in multiple processes if there are many.
+        """
+        with self._lock:
+            files = self._pending_bytecode_files
+            self._pending_bytecode_files = []
+
+        batches = [
+            files[i : i + BYTECODE_BATCH_SIZE]
+            for i in range(0, len(files), BYTECODE_BATCH_SIZE)
+        ]
+        if len(batches) > 1 and max_workers != 1:
+            from concurrent.futures import ProcessPoolExecutor
+            from concurrent.futures.process import BrokenProcessPool
+
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                    for _ in executor.map(_compile_files, batches):
+                        pass
+                return
+            except (OSError, NotImplementedError, BrokenProcessPool) as e:
+                # Already compiled modules are skipped when compiling serially.
+                logger.debug("Cannot compile bytecode in parallel: %s", e)
+
+        for batch in batches:
+            _compile_files(batch)
+
+    def discard_pending_bytecode(self) -> None:
+        """
+        Forget the modules that have not been compiled yet.
+        """
+        with self._lock:
+            self._pending_bytecode_files = []
+
+    def enable_linking_from_cache(self, enable: bool = True) -> None:
+        self._link_from_cache = enable
+
+    def install(self, wheel: Path, *, cached: bool = False) -> None:
+        """
+        Install a wheel into the environment.
+
+        :param wheel: The path of the wheel.
+        :param cached: Whether the wheel is in the artifact cache. If linking
+            from the cache is enabled, the files of cached wheels are linked from
+            an unpacked copy next to the wheel instead of being extracted.
+        """
+        bytecode_files: list[tuple[str, int]] = []
+        with zipfile.ZipFile(wheel) as zip_file:
+            unpacked = None
+            if cached and self._link_from_cache:
+                unpacked = self._get_unpacked_wheel(wheel, zip_file)
+            source = (
+                WheelFile(zip_file)
+                if unpacked is None
+                else UnpackedWheelFile(zip_file, unpacked)
+            )
             try:
                 # Content validation is temporarily disabled because of
                 # pypa/installer's out of memory issues with big wheels. See
@@ -104,6 +510,9 @@ class WheelInstaller:
                 interpreter=str(self._env.python),
                 script_kind=self._script_kind,
                 bytecode_optimization_levels=self._bytecode_optimization_levels,
+                unpacked=unpacked,
+                linker=self._linker,
+                bytecode_files=bytecode_files,
             )
 
             install(
@@ -114,3 +523,22 @@ class WheelInstaller:
                     "INSTALLER": f"Poetry {__version__}".encode(),
                 },
             )
+
+        with self._lock:
+            self._pending_bytecode_files += bytecode_files
+        if not self._defer_bytecode_compilation:
+            self.compile_bytecode()
+
+    @staticmethod
+    def _get_unpacked_wheel(
+        wheel: Path, zip_file: zipfile.ZipFile
+    ) -> UnpackedWheel | None:
+        unpacked = UnpackedWheel.load(wheel)
+        if unpacked is not None:
+            return unpacked
+
+        try:
+            return UnpackedWheel.create(wheel, zip_file, "sha256")
+        except (OSError, ValueError, zipfile.BadZipFile) as e:
+            logger.debug("Cannot unpack %s: %s", wheel, e)
+            return None
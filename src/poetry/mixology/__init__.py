@@ -12,7 +12,9 @@ if TYPE_CHECKING:
     from poetry.puzzle.provider import Provider
 
 
-def resolve_version(root: ProjectPackage, provider: Provider) -> SolverResult:
-    solver = VersionSolver(root, provider)
+def resolve_version(
+    root: ProjectPackage, provider: Provider, activity_heuristic: bool = False
+) -> SolverResult:
+    solver = VersionSolver(root, provider, activity_heuristic=activity_heuristic)
 
     return solver.solve()
@@ -29,6 +29,23 @@ class PartialSolution:
         # assigned.
         self._assignments: list[Assignment] = []
 
+        # The assignments for each package, in the order they were assigned.
+        self._package_assignments: dict[str, list[Assignment]] = {}
+
+        # The values of _positive and _negative for each package
+        # after each of its assignments, so that they can be restored
+        # without replaying all assignments when backtracking.
+        self._package_terms: dict[str, list[tuple[Term | None, Term | None]]] = {}
+
+        # The cumulative intersections of the assignments for each package,
+        # which are computed lazily when looking for a satisfier.
+        self._cumulative_terms: dict[str, list[Term | None]] = {}
+
+        # The index of the first assignment for each package that is from a direct
+        # origin or that does not refer to the same source as the first assignment.
+        # Satisfiers of such packages have to be searched linearly.
+        self._mixed_package_assignments: dict[str, int] = {}
+
         # The decisions made for each package.
         self._decisions: dict[str, Package] = {}
 
@@ -112,7 +129,24 @@ class PartialSolution:
         Adds an Assignment to _assignments and _positive or _negative.
         """
         self._assignments.append(assignment)
+
+        name = assignment.dependency.complete_name
+        package_assignments = self._package_assignments.setdefault(name, [])
+        if name not in self._mixed_package_assignments and (
+            assignment.dependency.is_direct_origin()
+            or (
+                package_assignments
+                and _source_key(assignment.dependency)
+                != _source_key(package_assignments[0].dependency)
+            )
+        ):
+            self._mixed_package_assignments[name] = len(package_assignments)
+        package_assignments.append(assignment)
+
         self._register(assignment)
+        self._package_terms.setdefault(name, []).append(
+            (self._positive.get(name), self._negative.get(name))
+        )
 
     def backtrack(self, decision_level: int) -> None:
         """
@@ -124,21 +158,51 @@ class PartialSolution:
         packages = set()
         while self._assignments[-1].decision_level > decision_level:
             removed = self._assignments.pop(-1)
-            packages.add(removed.dependency.complete_name)
+            name = removed.dependency.complete_name
+            packages.add(name)
+            self._package_assignments[name].pop()
+            self._package_terms[name].pop()
             if removed.is_decision():
-                del self._decisions[removed.dependency.complete_name]
+                del self._decisions[name]
 
-        # Re-compute _positive and _negative for the packages that were removed.
+        # Restore _positive and _negative for the packages that were removed.
+        # They are re-inserted in the order in which they were registered originally
+        # so that the order of unsatisfied dependencies does not change.
+        restored: list[tuple[int, str, Term, bool]] = []
         for package in packages:
-            if package in self._positive:
-                del self._positive[package]
+            self._positive.pop(package, None)
+            self._negative.pop(package, None)
+
+            assignments = self._package_assignments[package]
+            terms = self._package_terms[package]
+            remaining = len(assignments)
+            del self._cumulative_terms.get(package, [])[remaining:]
+            if self._mixed_package_assignments.get(package, remaining) >= remaining:
+                self._mixed_package_assignments.pop(package, None)
+
+            if not remaining:
+                del self._package_assignments[package]
+                del self._package_terms[package]
+                self._cumulative_terms.pop(package, None)
+                continue
 
-            if package in self._negative:
-                del self._negative[package]
+            positive, negative = terms[-1]
+            if positive is not None:
+                first_positive = next(
+                    i for i, t in enumerate(terms) if t[0] is not None
+                )
+                restored.append(
+                    (assignments[first_positive].index, package, positive, True)
+                )
+            else:
+                assert negative is not None
+                restored.append((assignments[0].index, package, negative, False))
 
-        for assignment in self._assignments:
-            if assignment.dependency.complete_name in packages:
-                self._register(assignment)
+        for _, package, term, is_positive in sorted(restored, key=lambda r: r[0]):
+            if is_positive:
+                self._positive[package] = term
+            else:
+                self._negative[package] = term
 
     def _register(self, assignment: Assignment) -> None:
         """
@@ -172,12 +236,37 @@ class PartialSolution:
         Returns the first Assignment in this solution such that the sublist of
         assignments up to and including that entry collectively satisfies term.
         """
-        assigned_term: Term | None = None
+        name = term.dependency.complete_name
+        assignments = self._package_assignments.get(name, [])
+
+        if (
+            assignments
+            and name not in self._mixed_package_assignments
+            and (
+                assignments[0].dependency.is_root
+                or assignments[0].dependency.is_same_package_as(term.dependency)
+            )
+        ):
+            # The cumulative intersections get narrower with each assignment,
+            # so we can use a binary search to find the first one satisfying term.
+            cumulative_terms = self._get_cumulative_terms(name)
+            low, high = 0, len(assignments)
+            while low < high:
+                middle = (low + high) // 2
+                cumulative_term = cumulative_terms[middle]
+                if cumulative_term is None or cumulative_term.satisfies(term):
+                    high = middle
+                else:
+                    low = middle + 1
+
+            if low < len(assignments):
+                return assignments[low]
+
+            raise RuntimeError(f"[BUG] {term} is not satisfied.")
 
-        for assignment in self._assignments:
-            if assignment.dependency.complete_name != term.dependency.complete_name:
-                continue
+        assigned_term: Term | None = None
 
+        for assignment in assignments:
             if (
                 not assignment.dependency.is_root
                 and not assignment.dependency.is_same_package_as(term.dependency)
@@ -201,6 +290,19 @@ class PartialSolution:
 
         raise RuntimeError(f"[BUG] {term} is not satisfied.")
 
+    def _get_cumulative_terms(self, name: str) -> list[Term | None]:
+        assignments = self._package_assignments[name]
+        cumulative_terms = self._cumulative_terms.setdefault(name, [])
+        for assignment in assignments[len(cumulative_terms) :]:
+            if not cumulative_terms:
+                cumulative_terms.append(assignment)
+            elif (previous := cumulative_terms[-1]) is None:
+                cumulative_terms.append(None)
+            else:
+                cumulative_terms.append(previous.intersect(assignment))
+
+        return cumulative_terms
+
     def satisfies(self, term: Term) -> bool:
         return self.relation(term) == SetRelation.SUBSET
 
@@ -214,3 +316,14 @@ class PartialSolution:
             return SetRelation.OVERLAPPING
 
         return negative.relation(term)
+
+
+def _source_key(dependency: Dependency) -> tuple[object, ...]:
+    return (
+        dependency.is_root,
+        dependency.source_type,
+        dependency.source_url,
+        dependency.source_reference,
+        dependency.source_resolved_reference,
+        dependency.source_subdirectory,
+    )
@@ -12,6 +12,10 @@ if TYPE_CHECKING:
     from poetry.core.packages.dependency import Dependency
 
 
+# The maximum number of cached relations and intersections of terms.
+TERM_CACHE_SIZE = 2**16
+
+
 class Term:
     """
     A statement about a package which is true or false for a given selection of
@@ -23,8 +27,12 @@ class Term:
     def __init__(self, dependency: Dependency, is_positive: bool) -> None:
         self._dependency = dependency
         self._positive = is_positive
-        self.relation = functools.lru_cache(maxsize=None)(self._relation)
-        self.intersect = functools.lru_cache(maxsize=None)(self._intersect)
+        # The dependencies of direct origin terms are updated while solving.
+        # Caching the results per instance keeps them consistent for the lifetime
+        # of a term, whereas the shared caches at module level avoid recomputing the
+        # same version range algebra for different instances.
+        self._relations: dict[Term, str] = {}
+        self._intersections: dict[Term, Term | None] = {}
 
     @property
     def inverse(self) -> Term:
@@ -50,101 +58,69 @@ class Term:
             and self.relation(other) == SetRelation.SUBSET
         )
 
-    def _relation(self, other: Term) -> str:
+    def relation(self, other: Term) -> str:
         """
         Returns the relationship between the package versions
         allowed by this term and another.
         """
-        if self.dependency.complete_name != other.dependency.complete_name:
-            raise ValueError(f"{other} should refer to {self.dependency.complete_name}")
-
-        other_constraint = other.constraint
-
-        if other.is_positive():
-            if self.is_positive():
-                if not self._compatible_dependency(other.dependency):
-                    return SetRelation.DISJOINT
-
-                # foo ^1.5.0 is a subset of foo ^1.0.0
-                if other_constraint.allows_all(self.constraint):
-                    return SetRelation.SUBSET
+        relation = self._relations.get(other)
+        if relation is None:
+            relation = self._relations[other] = self._relation(other)
 
-                # foo ^2.0.0 is disjoint with foo ^1.0.0
-                if not self.constraint.allows_any(other_constraint):
-                    return SetRelation.DISJOINT
+        return relation
 
-                return SetRelation.OVERLAPPING
-            else:
-                if not self._compatible_dependency(other.dependency):
-                    return SetRelation.OVERLAPPING
+    def _relation(self, other: Term) -> str:
+        if self.dependency.complete_name != other.dependency.complete_name:
+            raise ValueError(f"{other} should refer to {self.dependency.complete_name}")
 
-                # not foo ^1.0.0 is disjoint with foo ^1.5.0
-                if self.constraint.allows_all(other_constraint):
-                    return SetRelation.DISJOINT
+        compatible = self._compatible_dependency(other.dependency)
 
-                # not foo ^1.5.0 overlaps foo ^1.0.0
-                # not foo ^2.0.0 is a superset of foo ^1.5.0
-                return SetRelation.OVERLAPPING
-        else:
-            if self.is_positive():
-                if not self._compatible_dependency(other.dependency):
-                    return SetRelation.SUBSET
-
-                # foo ^2.0.0 is a subset of not foo ^1.0.0
-                if not other_constraint.allows_any(self.constraint):
-                    return SetRelation.SUBSET
-
-                # foo ^1.5.0 is disjoint with not foo ^1.0.0
-                if (
-                    other_constraint.allows_all(self.constraint)
-                    # if transitive markers are not equal we have to handle it
-                    # as overlapping so that markers are merged later
-                    and self.dependency.transitive_marker
-                    == other.dependency.transitive_marker
-                ):
-                    return SetRelation.DISJOINT
-
-                # foo ^1.0.0 overlaps not foo ^1.5.0
-                return SetRelation.OVERLAPPING
-            else:
-                if not self._compatible_dependency(other.dependency):
-                    return SetRelation.OVERLAPPING
-
-                # not foo ^1.0.0 is a subset of not foo ^1.5.0
-                if self.constraint.allows_all(other_constraint):
-                    return SetRelation.SUBSET
+        # if transitive markers are not equal we have to handle it
+        # as overlapping so that markers are merged later
+        same_transitive_marker = (
+            not compatible
+            or not self.is_positive()
+            or other.is_positive()
+            or self.dependency.transitive_marker == other.dependency.transitive_marker
+        )
 
-                # not foo ^2.0.0 overlaps not foo ^1.0.0
-                # not foo ^1.5.0 is a superset of not foo ^1.0.0
-                return SetRelation.OVERLAPPING
+        return _relation(
+            self.constraint,
+            self.is_positive(),
+            other.constraint,
+            other.is_positive(),
+            compatible,
+            same_transitive_marker,
+        )
 
-    def _intersect(self, other: Term) -> Term | None:
+    def intersect(self, other: Term) -> Term | None:
         """
         Returns a Term that represents the packages
         allowed by both this term and another
         """
+        try:
+            return self._intersections[other]
+        except KeyError:
+            intersection = self._intersections[other] = self._intersect(other)
+            return intersection
+
+    def _intersect(self, other: Term) -> Term | None:
         if self.dependency.complete_name != other.dependency.complete_name:
             raise ValueError(f"{other} should refer to {self.dependency.complete_name}")
 
         if self._compatible_dependency(other.dependency):
-            if self.is_positive() != other.is_positive():
-                # foo ^1.0.0 ∩ not foo ^1.5.0 → foo >=1.0.0 <1.5.0
-                positive = self if self.is_positive() else other
-                negative = other if self.is_positive() else self
-
-                return self._non_empty_term(
-                    positive.constraint.difference(negative.constraint), True, other
-                )
-            elif self.is_positive():
-                # foo ^1.0.0 ∩ foo >=1.5.0 <3.0.0 → foo ^1.5.0
-                return self._non_empty_term(
-                    self.constraint.intersect(other.constraint), True, other
-                )
-            else:
-                # not foo ^1.0.0 ∩ not foo >=1.5.0 <3.0.0 → not foo >=1.0.0 <3.0.0
-                return self._non_empty_term(
-                    self.constraint.union(other.constraint), False, other
-                )
+            intersection = _intersection(
+                self.constraint,
+                _formatting(self.constraint),
+                self.is_positive(),
+                other.constraint,
+                _formatting(other.constraint),
+                other.is_positive(),
+            )
+            if intersection is None:
+                return None
+
+            return self._new_term(*intersection, other)
         elif self.is_positive() != other.is_positive():
             return self if self.is_positive() else other
         else:
@@ -170,12 +146,9 @@ class Term:
             )
         )
 
-    def _non_empty_term(
+    def _new_term(
         self, constraint: VersionConstraint, is_positive: bool, other: Term
-    ) -> Term | None:
-        if constraint.is_empty():
-            return None
-
+    ) -> Term:
         # when creating a new term prefer direct-reference dependencies
         dependency = (
             other.dependency
@@ -196,3 +169,131 @@ class Term:
 
     def __repr__(self) -> str:
         return f"<Term {self!s}>"
+
+
+def term_cache_info() -> tuple[int, int]:
+    """
+    Returns the number of hits and misses of the caches
+    for relations and intersections of terms.
+    """
+    hits = 0
+    misses = 0
+    for info in (_relation.cache_info(), _intersection.cache_info()):
+        hits += info.hits
+        misses += info.misses
+
+    return hits, misses
+
+
+def clear_term_cache() -> None:
+    _relation.cache_clear()
+    _intersection.cache_clear()
+
+
+# Relations and intersections of terms are cached by their constraints,
+# which are immutable, and the information derived from their dependencies.
+# Thereby, equal terms of different Term instances share cache entries,
+# which is especially useful after backtracking.
+
+
+def _formatting(constraint: VersionConstraint) -> tuple[type, str]:
+    # Equal constraints may be formatted differently, e.g. "2.0" and "2.0.0".
+    # Intersections return (parts of) their operands, whose formatting ends up
+    # in new dependencies and error messages, so it must be part of the key.
+    return type(constraint), str(constraint)
+
+
+@functools.lru_cache(maxsize=TERM_CACHE_SIZE)
+def _relation(
+    constraint: VersionConstraint,
+    is_positive: bool,
+    other_constraint: VersionConstraint,
+    other_is_positive: bool,
+    compatible: bool,
+    same_transitive_marker: bool,
+) -> str:
+    if other_is_positive:
+        if is_positive:
+            if not compatible:
+                return SetRelation.DISJOINT
+
+            # foo ^1.5.0 is a subset of foo ^1.0.0
+            if other_constraint.allows_all(constraint):
+                return SetRelation.SUBSET
+
+            # foo ^2.0.0 is disjoint with foo ^1.0.0
+            if not constraint.allows_any(other_constraint):
+                return SetRelation.DISJOINT
+
+            return SetRelation.OVERLAPPING
+        else:
+            if not compatible:
+                return SetRelation.OVERLAPPING
+
+            # not foo ^1.0.0 is disjoint with foo ^1.5.0
+            if constraint.allows_all(other_constraint):
+                return SetRelation.DISJOINT
+
+            # not foo ^1.5.0 overlaps foo ^1.0.0
+            # not foo ^2.0.0 is a superset of foo ^1.5.0
+            return SetRelation.OVERLAPPING
+    else:
+        if is_positive:
+            if not compatible:
+                return SetRelation.SUBSET
+
+            # foo ^2.0.0 is a subset of not foo ^1.0.0
+            if not other_constraint.allows_any(constraint):
+                return SetRelation.SUBSET
+
+            # foo ^1.5.0 is disjoint with not foo ^1.0.0
+            if other_constraint.allows_all(constraint) and same_transitive_marker:
+                return SetRelation.DISJOINT
+
+            # foo ^1.0.0 overlaps not foo ^1.5.0
+            return SetRelation.OVERLAPPING
+        else:
+            if not compatible:
+                return SetRelation.OVERLAPPING
+
+            # not foo ^1.0.0 is a subset of not foo ^1.5.0
+            if constraint.allows_all(other_constraint):
+                return SetRelation.SUBSET
+
+            # not foo ^2.0.0 overlaps not foo ^1.0.0
+            # not foo ^1.5.0 is a superset of not foo ^1.0.0
+            return SetRelation.OVERLAPPING
+
+
+@functools.lru_cache(maxsize=TERM_CACHE_SIZE)
+def _intersection(
+    constraint: VersionConstraint,
+    formatting: tuple[type, str],
+    is_positive: bool,
+    other_constraint: VersionConstraint,
+    other_formatting: tuple[type, str],
+    other_is_positive: bool,
+) -> tuple[VersionConstraint, bool] | None:
+    """
+    Returns the constraint and the positivity of the intersection
+    of two terms of compatible dependencies or None if it is empty.
+
+    The formatting of the constraints is not used but part of the cache key.
+    """
+    if is_positive != other_is_positive:
+        # foo ^1.0.0 ∩ not foo ^1.5.0 → foo >=1.0.0 <1.5.0
+        positive = constraint if is_positive else other_constraint
+        negative = other_constraint if is_positive else constraint
+        intersection = positive.difference(negative)
+        is_positive = True
+    elif is_positive:
+        # foo ^1.0.0 ∩ foo >=1.5.0 <3.0.0 → foo ^1.5.0
+        intersection = constraint.intersect(other_constraint)
+    else:
+        # not foo ^1.0.0 ∩ not foo >=1.5.0 <3.0.0 → not foo >=1.0.0 <3.0.0
+        intersection = constraint.union(other_constraint)
+
+    if intersection.is_empty():
+        return None
+
+    return intersection, is_positive
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import bisect
 import collections
-import functools
 import time
 
 from typing import TYPE_CHECKING
@@ -18,7 +18,10 @@ from poetry.mixology.partial_solution import PartialSolution
 from poetry.mixology.result import SolverResult
 from poetry.mixology.set_relation import SetRelation
 from poetry.mixology.term import Term
+from poetry.mixology.term import term_cache_info
 from poetry.packages import PackageCollection
+from poetry.utils.profiler import get_profiler
+from poetry.utils.profiler import measure
 
 
 if TYPE_CHECKING:
@@ -45,6 +48,11 @@ class DependencyCache:
     again.
     """
 
+    # The search results that are kept at least and per package
+    # that has been searched for.
+    MIN_SEARCH_RESULTS = 128
+    SEARCH_RESULTS_PER_PACKAGE = 8
+
     def __init__(self, provider: Provider) -> None:
         self._provider = provider
 
@@ -57,28 +65,60 @@ class DependencyCache:
         # In order to maintain the integrity of the cache, `clear_level()`
         # needs to be called in descending order as decision levels are
         # backtracked so that the correct items can be popped from the stack.
-        self._cache: dict[DependencyCacheKey, list[list[DependencyPackage]]] = (
-            collections.defaultdict(list)
-        )
+        self._cache: dict[
+            DependencyCacheKey, list[tuple[int, list[DependencyPackage]]]
+        ] = collections.defaultdict(list)
         self._cached_dependencies_by_level: dict[int, list[DependencyCacheKey]] = (
             collections.defaultdict(list)
         )
 
-        self._search_for_cached = functools.lru_cache(maxsize=128)(self._search_for)
+        # self._search_results maps a dependency to the result of searching for it
+        # and the decision level of the cached package list the result has been
+        # derived from (-1 if it has been retrieved from the provider). Results are
+        # only invalidated if this decision level is rolled back and the least
+        # recently used results are evicted if there are too many.
+        self._search_results: collections.OrderedDict[
+            tuple[Dependency, DependencyCacheKey],
+            tuple[int, list[DependencyPackage]],
+        ] = collections.OrderedDict()
+        self._search_results_by_level: dict[
+            int, list[tuple[Dependency, DependencyCacheKey]]
+        ] = collections.defaultdict(list)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def max_search_results(self) -> int:
+        return max(
+            self.MIN_SEARCH_RESULTS, self.SEARCH_RESULTS_PER_PACKAGE * len(self._cache)
+        )
 
     def _search_for(
         self,
         dependency: Dependency,
         key: DependencyCacheKey,
     ) -> list[DependencyPackage]:
+        search_key = (dependency, key)
+        result = self._search_results.get(search_key)
+        if result is not None:
+            self.hits += 1
+            self._search_results.move_to_end(search_key)
+            return result[1]
+
+        self.misses += 1
         cache_entries = self._cache[key]
         if cache_entries:
+            level, cached_packages = cache_entries[-1]
             packages = [
                 p
-                for p in cache_entries[-1]
+                for p in cached_packages
                 if dependency.constraint.allows(p.package.version)
             ]
         else:
+            level = -1
             packages = None
 
         # provider.search_for() normally does not include pre-release packages
@@ -91,6 +131,13 @@ class DependencyCache:
         if not packages:
             packages = self._provider.search_for(dependency)
 
+        self._search_results[search_key] = (level, packages)
+        if level >= 0:
+            self._search_results_by_level[level].append(search_key)
+        while len(self._search_results) > self.max_search_results:
+            self._search_results.popitem(last=False)
+            self.evictions += 1
+
         return packages
 
     def search_for(
@@ -108,11 +155,11 @@ class DependencyCache:
 
         # We could always use dependency.without_features() here,
         # but for performance reasons we only do it if necessary.
-        packages = self._search_for_cached(
+        packages = self._search_for(
             dependency.without_features() if dependency.features else dependency, key
         )
-        if not self._cache[key] or self._cache[key][-1] is not packages:
-            self._cache[key].append(packages)
+        if not self._cache[key] or self._cache[key][-1][1] is not packages:
+            self._cache[key].append((decision_level, packages))
             self._cached_dependencies_by_level[decision_level].append(key)
 
         if dependency.features and packages:
@@ -125,10 +172,18 @@ class DependencyCache:
 
     def clear_level(self, level: int) -> None:
         if level in self._cached_dependencies_by_level:
-            self._search_for_cached.cache_clear()
             for key in self._cached_dependencies_by_level.pop(level):
                 self._cache[key].pop()
 
+        # Only search results that have been derived from package lists
+        # of the rolled back level are outdated.
+        for search_key in self._search_results_by_level.pop(level, []):
+            result = self._search_results.get(search_key)
+            # The result might have been evicted and searched again since.
+            if result is not None and result[0] == level:
+                del self._search_results[search_key]
+                self.invalidations += 1
+
 
 class VersionSolver:
     """
@@ -139,17 +194,52 @@ class VersionSolver:
     on how this solver works.
     """
 
-    def __init__(self, root: ProjectPackage, provider: Provider) -> None:
+    # The factor by which the activity of packages decays after each conflict.
+    ACTIVITY_DECAY = 0.95
+
+    def __init__(
+        self,
+        root: ProjectPackage,
+        provider: Provider,
+        activity_heuristic: bool = False,
+    ) -> None:
         self._root = root
         self._provider = provider
+        self._activity_heuristic = activity_heuristic
         self._dependency_cache = DependencyCache(provider)
         self._incompatibilities: dict[str, list[Incompatibility]] = {}
         self._contradicted_incompatibilities: set[Incompatibility] = set()
         self._contradicted_incompatibilities_by_level: dict[
             int, set[Incompatibility]
         ] = collections.defaultdict(set)
+        # The names of two packages whose terms in an incompatibility were not
+        # satisfied by _solution when the incompatibility was last visited.
+        # Similar to watched literals in SAT solvers, the incompatibility can
+        # neither be satisfied nor almost satisfied until one of these packages
+        # changes, so that it does not have to be visited for other packages.
+        # Since backtracking only removes assignments, unsatisfied terms stay
+        # unsatisfied and this does not have to be reset on backtracking.
+        self._watched_packages: dict[Incompatibility, tuple[str, str]] = {}
+        # The incompatibilities that have to be visited when a package changes,
+        # i.e. those watching the package and those without watched packages,
+        # as indices into _added_incompatibilities in the order they were added.
+        self._watches: dict[str, list[int]] = {}
+        self._added_incompatibilities: list[Incompatibility] = []
+        self._incompatibility_indices: dict[Incompatibility, int] = {}
         self._solution = PartialSolution()
 
+        # The activity of packages that have been involved in conflicts. Similar to
+        # VSIDS in SAT solvers, the activity of packages in learned incompatibilities
+        # is bumped and older bumps decay by growing the increment after each conflict
+        # so that packages involved in recent conflicts are decided first.
+        self._activity: dict[str, float] = collections.defaultdict(float)
+        self._activity_increment = 1.0
+
+        # Counters for the number of incompatibilities
+        # that have been visited and skipped during unit propagation.
+        self.visited_incompatibilities = 0
+        self.skipped_incompatibilities = 0
+
     @property
     def solution(self) -> PartialSolution:
         return self._solution
@@ -160,6 +250,7 @@ class VersionSolver:
         or raises an error if no such set is available.
         """
         start = time.time()
+        start_hits, start_misses = term_cache_info()
         root_dependency = Dependency(self._root.name, self._root.version)
         root_dependency.is_root = True
 
@@ -170,16 +261,27 @@ class VersionSolver:
         try:
             next: str | None = self._root.name
             while next is not None:
-                self._propagate(next)
-                next = self._choose_package_version()
+                with measure("propagation"):
+                    self._propagate(next)
+                with measure("decision making"):
+                    next = self._choose_package_version()
 
             return self._result()
         except Exception:
             raise
         finally:
+            hits, misses = term_cache_info()
             self._log(
                 f"Version solving took {time.time() - start:.3f} seconds.\n"
-                f"Tried {self._solution.attempted_solutions} solutions."
+                f"Tried {self._solution.attempted_solutions} solutions.\n"
+                f"Visited {self.visited_incompatibilities} incompatibilities"
+                f" and skipped {self.skipped_incompatibilities}"
+                " during unit propagation.\n"
+                f"Term cache: {hits - start_hits} hits, {misses - start_misses} misses.\n"
+                f"Dependency cache: {self._dependency_cache.hits} hits,"
+                f" {self._dependency_cache.misses} misses,"
+                f" {self._dependency_cache.evictions} evictions"
+                f" and {self._dependency_cache.invalidations} invalidations."
             )
 
     def _propagate(self, package: str) -> None:
@@ -191,14 +293,22 @@ class VersionSolver:
         while changed:
             package = changed.pop()
 
+            watches = self._watches[package]
+            self.skipped_incompatibilities += len(
+                self._incompatibilities[package]
+            ) - len(watches)
+
             # Iterate in reverse because conflict resolution tends to produce more
             # general incompatibilities as time goes on. If we look at those first,
             # we can derive stronger assignments sooner and more eagerly find
-            # conflicts.
-            for incompatibility in reversed(self._incompatibilities[package]):
+            # conflicts. Visiting an incompatibility may move it to the watches of
+            # other packages, so a reversed copy of the watches is iterated.
+            for index in watches[::-1]:
+                incompatibility = self._added_incompatibilities[index]
                 if incompatibility in self._contradicted_incompatibilities:
                     continue
 
+                self.visited_incompatibilities += 1
                 result = self._propagate_incompatibility(incompatibility)
 
                 if result is _conflict:
@@ -209,7 +319,8 @@ class VersionSolver:
                     # It also backjumps to a point in the solution
                     # where that incompatibility will allow us to derive new assignments
                     # that avoid the conflict.
-                    root_cause = self._resolve_conflict(incompatibility)
+                    with measure("conflict resolution"):
+                        root_cause = self._resolve_conflict(incompatibility)
 
                     # Back jumping erases all the assignments we did at the previous
                     # decision level, so we clear [changed] and refill it with the
@@ -255,11 +366,22 @@ class VersionSolver:
                 self._contradicted_incompatibilities_by_level[
                     self._solution.decision_level
                 ].add(incompatibility)
+                # It is skipped until backtracking anyway, so that it is not worth
+                # looking for another unsatisfied term to watch.
+                self._watch(incompatibility, None)
                 return None
             elif relation == SetRelation.OVERLAPPING:
                 # If more than one term is inconclusive, we can't deduce anything about
                 # incompatibility.
                 if unsatisfied is not None:
+                    # Both terms remain inconclusive until their packages change.
+                    self._watch(
+                        incompatibility,
+                        (
+                            unsatisfied.dependency.complete_name,
+                            term.dependency.complete_name,
+                        ),
+                    )
                     return None
 
                 # If exactly one term in incompatibility is inconclusive, then it's
@@ -267,6 +389,8 @@ class VersionSolver:
                 # inverse of the term to _solution.
                 unsatisfied = term
 
+        self._watch(incompatibility, None)
+
         # If *all* terms in incompatibility are satisfied by _solution, then
         # incompatibility is satisfied and we have a conflict.
         if unsatisfied is None:
@@ -287,6 +411,40 @@ class VersionSolver:
         complete_name: str = unsatisfied.dependency.complete_name
         return complete_name
 
+    def _watch(
+        self, incompatibility: Incompatibility, watched: tuple[str, str] | None
+    ) -> None:
+        """
+        Moves incompatibility to the watches of the watched packages
+        or, if there are none, to the watches of all its packages.
+        """
+        previous = self._watched_packages.get(incompatibility)
+        if watched == previous:
+            return
+
+        if watched is None:
+            del self._watched_packages[incompatibility]
+            names = self._package_names(incompatibility)
+        else:
+            self._watched_packages[incompatibility] = watched
+            names = set(watched)
+
+        previous_names = (
+            set(previous)
+            if previous is not None
+            else self._package_names(incompatibility)
+        )
+        index = self._incompatibility_indices[incompatibility]
+        for name in previous_names - names:
+            watches = self._watches[name]
+            del watches[bisect.bisect_left(watches, index)]
+        for name in names - previous_names:
+            bisect.insort(self._watches[name], index)
+
+    @staticmethod
+    def _package_names(incompatibility: Incompatibility) -> set[str]:
+        return {term.dependency.complete_name for term in incompatibility.terms}
+
     def _resolve_conflict(self, incompatibility: Incompatibility) -> Incompatibility:
         """
         Given an incompatibility that's satisfied by _solution,
@@ -378,9 +536,17 @@ class VersionSolver:
                         )
                     self._dependency_cache.clear_level(level)
 
+                profiler = get_profiler()
+                if profiler is not None:
+                    profiler.record_backtrack(
+                        self._solution.decision_level - previous_satisfier_level
+                    )
+
                 self._solution.backtrack(previous_satisfier_level)
                 if new_incompatibility:
                     self._add_incompatibility(incompatibility)
+                if self._activity_heuristic:
+                    self._bump_activity(incompatibility)
 
                 return incompatibility
 
@@ -432,6 +598,44 @@ class VersionSolver:
 
         raise SolveFailureError(incompatibility)
 
+    def _bump_activity(self, incompatibility: Incompatibility) -> None:
+        """
+        Increases the activity of the packages in a learned incompatibility
+        and lets the activity of all packages decay.
+        """
+        for term in incompatibility.terms:
+            self._activity[term.dependency.complete_name] += self._activity_increment
+
+        self._activity_increment /= self.ACTIVITY_DECAY
+        if self._activity_increment > 1e100:
+            # Rescale to avoid an overflow. This does not change the order.
+            for name in self._activity:
+                self._activity[name] *= 1e-100
+            self._activity_increment *= 1e-100
+
+    def _prefetch(self, unsatisfied: list[Dependency]) -> None:
+        """
+        Requests the metadata of the most likely candidate of each unsatisfied
+        dependency so that it can be fetched in the background while we are
+        working on other dependencies.
+        """
+        if not self._provider.is_prefetching():
+            return
+
+        for dependency in unsatisfied:
+            if dependency.is_direct_origin():
+                continue
+
+            package = self._provider.get_locked(dependency)
+            if package is None:
+                packages = self._dependency_cache.search_for(
+                    dependency, self._solution.decision_level
+                )
+                package = next(iter(packages), None)
+
+            if package is not None:
+                self._provider.prefetch(package)
+
     def _choose_next(self, unsatisfied: list[Dependency]) -> Dependency:
         """
         The original algorithm proposes to prefer packages with as few remaining
@@ -444,6 +648,10 @@ class VersionSolver:
         In order to provide results that are as deterministic as possible
         and consistent between `poetry lock` and `poetry update`, the return value
         of two different dependencies should not be equal if possible.
+
+        If the activity heuristic is enabled, dependencies that have been involved
+        in recent conflicts are preferred over dependencies with more remaining
+        versions. Until the first conflict, the choice is the same as without it.
         """
 
         class Preference:
@@ -459,10 +667,13 @@ class VersionSolver:
             LOCKED = 3
             DEFAULT = 4
 
-        def _get_min(dependency: Dependency) -> tuple[int, int, bool, int]:
+        def _get_min(dependency: Dependency) -> tuple[int, float, int, bool, int]:
             """
             Returns a tuple of:
             - preference: see Preference class
+            - activity: a package that has been involved in recent conflicts
+                        should be chosen first (only if the activity heuristic
+                        is enabled)
             - num_deps_upper_bound: a dependency with an upper bound is more likely to
                                     cause conflicts -> a package with more dependencies
                                     with upper bounds should be chosen first
@@ -474,13 +685,13 @@ class VersionSolver:
             # a regular dependency for some package only to find later that we had a
             # direct-origin dependency.
             if dependency.is_direct_origin():
-                return Preference.DIRECT_ORIGIN, 0, False, 0
+                return Preference.DIRECT_ORIGIN, 0, 0, False, 0
 
             use_latest = dependency.name in self._provider.use_latest
             if not use_latest:
                 locked = self._provider.get_locked(dependency)
                 if locked:
-                    return Preference.LOCKED, 0, False, 0
+                    return Preference.LOCKED, 0, 0, False, 0
 
             packages = self._dependency_cache.search_for(
                 dependency, self._solution.decision_level
@@ -530,7 +741,18 @@ class VersionSolver:
                 preference = Preference.USE_LATEST
             else:
                 preference = Preference.DEFAULT
-            return preference, -num_deps_upper_bound, not has_deps, -num_packages
+            activity = (
+                self._activity.get(dependency.complete_name, 0)
+                if self._activity_heuristic
+                else 0
+            )
+            return (
+                preference,
+                -activity,
+                -num_deps_upper_bound,
+                not has_deps,
+                -num_packages,
+            )
 
         return min(unsatisfied, key=_get_min)
 
@@ -546,6 +768,7 @@ class VersionSolver:
         if not unsatisfied:
             return None
 
+        self._prefetch(unsatisfied)
         dependency = self._choose_next(unsatisfied)
 
         locked = self._provider.get_locked(dependency)
@@ -571,6 +794,10 @@ class VersionSolver:
 
         package = self._provider.complete_package(package)
 
+        profiler = get_profiler()
+        if profiler is not None and not package.package.is_root():
+            profiler.record_version_tried(dependency.complete_name)
+
         conflict = False
         for incompatibility in self._provider.incompatibilities_for(package):
             self._add_incompatibility(incompatibility)
@@ -611,9 +838,16 @@ class VersionSolver:
     def _add_incompatibility(self, incompatibility: Incompatibility) -> None:
         self._log(f"fact: {incompatibility}")
 
+        index = self._incompatibility_indices.setdefault(
+            incompatibility, len(self._added_incompatibilities)
+        )
+        if index == len(self._added_incompatibilities):
+            self._added_incompatibilities.append(incompatibility)
+
         for term in incompatibility.terms:
             if term.dependency.complete_name not in self._incompatibilities:
                 self._incompatibilities[term.dependency.complete_name] = []
+                self._watches[term.dependency.complete_name] = []
 
             if (
                 incompatibility
@@ -624,6 +858,8 @@ class VersionSolver:
             self._incompatibilities[term.dependency.complete_name].append(
                 incompatibility
             )
+            if incompatibility not in self._watched_packages:
+                self._watches[term.dependency.complete_name].append(index)
 
     def _log(self, text: str) -> None:
         self._provider.debug(text, self._solution.attempted_solutions)
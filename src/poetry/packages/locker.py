@@ -84,6 +84,13 @@ class Locker:
 
         return self._lock_data
 
+    @property
+    def content_hash(self) -> str:
+        """
+        The hash of the pyproject data that is written to the lock file.
+        """
+        return self._content_hash
+
     def is_locked(self) -> bool:
         """
         Checks whether the locker has been locked (lockfile found).
@@ -159,19 +166,58 @@ class Locker:
 
         for info in locked_package_info:
             package = self._get_locked_package(info, with_dependencies=False)
-            groups = set(info["groups"])
-            locked_marker = info.get("markers", "*")
-            if isinstance(locked_marker, str):
-                markers = {group: parse_marker(locked_marker) for group in groups}
-            else:
-                markers = {
-                    group: parse_marker(locked_marker.get(group, "*"))
-                    for group in groups
-                }
-            locked_packages[package] = TransitivePackageInfo(0, groups, markers)
+            locked_packages[package] = self._get_transitive_info(info)
 
         return locked_packages
 
+    def dump_packages(
+        self, packages: dict[Package, TransitivePackageInfo]
+    ) -> list[dict[str, Any]]:
+        """
+        Returns the lock data of the given packages as plain Python objects
+        including the complete transitive information so that the packages
+        can be restored via `load_packages()`.
+        """
+        package_specs = []
+        for package, transitive_info in packages.items():
+            spec = self._dump_package(package, transitive_info)
+            spec["depth"] = transitive_info.depth
+            package_specs.append(spec)
+
+        data: list[dict[str, Any]] = (
+            document().add("package", package_specs).unwrap()["package"]
+        )
+        return data
+
+    def load_packages(
+        self, package_specs: list[dict[str, Any]]
+    ) -> dict[Package, TransitivePackageInfo]:
+        """
+        Returns the packages (including their dependencies) and their transitive
+        information from data that has been created via `dump_packages()`.
+        """
+        packages: dict[Package, TransitivePackageInfo] = {}
+
+        for info in package_specs:
+            package = self._get_locked_package(info)
+            transitive_info = self._get_transitive_info(info)
+            transitive_info.depth = info.get("depth", 0)
+            packages[package] = transitive_info
+
+        return packages
+
+    @staticmethod
+    def _get_transitive_info(info: dict[str, Any]) -> TransitivePackageInfo:
+        groups = set(info["groups"])
+        locked_marker = info.get("markers", "*")
+        if isinstance(locked_marker, str):
+            markers = {group: parse_marker(locked_marker) for group in groups}
+        else:
+            markers = {
+                group: parse_marker(locked_marker.get(group, "*")) for group in groups
+            }
+        return TransitivePackageInfo(0, groups, markers)
+
     def set_lock_data(
         self, root: Package, packages: dict[Package, TransitivePackageInfo]
     ) -> bool:
@@ -366,7 +412,6 @@ class Locker:
         )
         package.description = info.get("description", "")
         package.optional = info["optional"]
-        metadata = cast("dict[str, Any]", self.lock_data["metadata"])
 
         # Storing of package files and hashes has been through a few generations in
         # the lockfile, we can read them all:
@@ -379,21 +424,24 @@ class Locker:
         package_files = info.get("files")
         if package_files is not None:
             package.files = package_files
-        elif "hashes" in metadata:
-            hashes = cast("dict[str, Any]", metadata["hashes"])
-            package.files = [{"name": h, "hash": h} for h in hashes[name]]
-        elif source_type in {"git", "directory", "url"}:
-            package.files = []
         else:
-            files = metadata["files"][name]
-            if source_type == "file":
-                filename = Path(url).name
-                package.files = [item for item in files if item["file"] == filename]
+            metadata = cast("dict[str, Any]", self.lock_data["metadata"])
+            if "hashes" in metadata:
+                hashes = cast("dict[str, Any]", metadata["hashes"])
+                package.files = [{"name": h, "hash": h} for h in hashes[name]]
+            elif source_type in {"git", "directory", "url"}:
+                package.files = []
             else:
-                # Strictly speaking, this is not correct, but we have no chance
-                # to always determine which are the correct files because the
-                # lockfile doesn't keep track which files belong to which package.
-                package.files = files
+                files = metadata["files"][name]
+                if source_type == "file":
+                    filename = Path(url).name
+                    package.files = [item for item in files if item["file"] == filename]
+                else:
+                    # Strictly speaking, this is not correct, but we have no chance
+                    # to always determine which are the correct files because the
+                    # lockfile doesn't keep track which files belong to which
+                    # package.
+                    package.files = files
 
         package.python_versions = info["python-versions"]
 
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from typing import Optional
+
+from poetry.utils.profiler import measure
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
+    from poetry.core.constraints.version import Version
+    from poetry.core.packages.package import Package
+
+
+PrefetchKey = tuple[str, "Version", Optional[str]]
+
+
+class MetadataPrefetcher:
+    """
+    Fetches the metadata of packages in background threads
+    so that it is already available when the solver needs it.
+
+    Fetching a package that has been requested but not been started yet
+    is done synchronously by the caller instead of waiting for a worker.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Package],
+        max_workers: int,
+    ) -> None:
+        self._fetch = fetch
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._futures: dict[PrefetchKey, Future[Package]] = {}
+        self._requested: set[PrefetchKey] = set()
+        self._lock = threading.Lock()
+
+        self.prefetched = 0
+        self.hits = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="poetry-prefetch"
+            )
+
+    def shutdown(self) -> None:
+        if self._executor is None:
+            return
+
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._executor = None
+        with self._lock:
+            self._futures.clear()
+
+    def prefetch(
+        self, name: str, version: Version, repository_name: str | None = None
+    ) -> None:
+        key = (name, version, repository_name)
+        with self._lock:
+            if self._executor is None or key in self._futures or key in self._requested:
+                return
+
+            self._futures[key] = self._executor.submit(
+                self._fetch, name, version, repository_name=repository_name
+            )
+            self.prefetched += 1
+
+    def get(
+        self, name: str, version: Version, repository_name: str | None = None
+    ) -> Package:
+        key = (name, version, repository_name)
+        with self._lock:
+            self._requested.add(key)
+            future = self._futures.pop(key, None)
+
+        # A pending fetch is cancelled and done synchronously
+        # so that we do not have to wait for other prefetches to finish first.
+        if future is None or future.cancel():
+            return self._fetch(name, version, repository_name=repository_name)
+
+        self.hits += 1
+        with measure("prefetch wait"):
+            return future.result()
@@ -30,7 +30,11 @@ from poetry.packages import DependencyPackage
 from poetry.packages.direct_origin import DirectOrigin
 from poetry.packages.package_collection import PackageCollection
 from poetry.puzzle.exceptions import OverrideNeededError
+from poetry.puzzle.prefetcher import MetadataPrefetcher
+from poetry.repositories.cached_repository import CachedRepository
+from poetry.repositories.http_repository import HTTPRepository
 from poetry.utils.helpers import get_file_hash
+from poetry.utils.profiler import measure
 
 
 if TYPE_CHECKING:
@@ -110,6 +114,9 @@ class Indicator(ProgressIndicator):
 
 class Provider:
     UNSAFE_PACKAGES: ClassVar[set[str]] = set()
+    # The number of the most likely versions of a package
+    # whose metadata is prefetched in one batch.
+    PREFETCH_BATCH_SIZE: ClassVar[int] = 5
 
     def __init__(
         self,
@@ -119,6 +126,7 @@ class Provider:
         *,
         locked: list[Package] | None = None,
         active_root_extras: Collection[NormalizedName] | None = None,
+        prefetch_workers: int = 0,
     ) -> None:
         self._package = package
         self._pool = pool
@@ -134,6 +142,7 @@ class Provider:
         self._direct_origin_packages: dict[str, Package] = {}
         self._locked: dict[NormalizedName, list[DependencyPackage]] = defaultdict(list)
         self._use_latest: Collection[NormalizedName] = []
+        self._use_locked_dependencies = False
         self._active_root_extras = (
             frozenset(active_root_extras) if active_root_extras is not None else None
         )
@@ -149,7 +158,15 @@ class Provider:
                 reverse=True,
             )
 
-        self.get_package_from_pool = functools.cache(self._pool.package)
+        # Prefetching is only worth it if fetching metadata is expensive,
+        # i.e. if at least one repository has to retrieve it from a remote server.
+        self._prefetcher: MetadataPrefetcher | None = None
+        if prefetch_workers > 1 and any(
+            isinstance(repo, CachedRepository) for repo in self._pool.all_repositories
+        ):
+            self._prefetcher = MetadataPrefetcher(self._pool.package, prefetch_workers)
+
+        self.get_package_from_pool = functools.cache(self._get_package_from_pool)
 
     @property
     def pool(self) -> RepositoryPool:
@@ -211,6 +228,58 @@ class Provider:
             self._env = None
             self._package_python_constraint = original_python_constraint
 
+    @contextmanager
+    def use_prefetching(self) -> Iterator[Provider]:
+        """
+        Fetch the metadata of packages that are likely to be chosen
+        in background threads while solving.
+        """
+        if self._prefetcher is None:
+            yield self
+            return
+
+        self._prefetcher.start()
+
+        try:
+            yield self
+        finally:
+            self._prefetcher.shutdown()
+            self.debug(
+                f"Prefetched metadata of {self._prefetcher.prefetched} packages,"
+                f" {self._prefetcher.hits} of them were used."
+            )
+
+    def is_prefetching(self) -> bool:
+        return self._prefetcher is not None and self._prefetcher.is_running
+
+    def prefetch(self, dependency_package: DependencyPackage) -> None:
+        """
+        Request the metadata of a package that is likely to be completed soon.
+        """
+        package = dependency_package.package
+        if (
+            self._prefetcher is None
+            or package.is_root()
+            or package.is_direct_origin()
+            or self._get_reusable_locked_package(dependency_package) is not None
+            or self._get_python_incompatible_package(dependency_package) is not None
+        ):
+            return
+
+        self._prefetcher.prefetch(
+            package.pretty_name,
+            package.version,
+            repository_name=dependency_package.dependency.source_name,
+        )
+
+    def _get_package_from_pool(
+        self, name: str, version: Version, repository_name: str | None = None
+    ) -> Package:
+        if self._prefetcher is not None:
+            return self._prefetcher.get(name, version, repository_name=repository_name)
+
+        return self._pool.package(name, version, repository_name=repository_name)
+
     @contextmanager
     def use_latest_for(self, names: Collection[NormalizedName]) -> Iterator[Provider]:
         self._use_latest = names
@@ -220,6 +289,20 @@ class Provider:
         finally:
             self._use_latest = []
 
+    @contextmanager
+    def use_locked_dependencies(self) -> Iterator[Provider]:
+        """
+        Take the dependencies of locked packages from the lock file
+        instead of retrieving their metadata from the repositories
+        so that only packages that are not locked (anymore) have to be fetched.
+        """
+        self._use_locked_dependencies = True
+
+        try:
+            yield self
+        finally:
+            self._use_locked_dependencies = False
+
     @staticmethod
     def validate_package_for_dependency(
         dependency: Dependency, package: Package
@@ -238,19 +321,23 @@ class Provider:
 
         elif dependency.is_vcs():
             dependency = cast("VCSDependency", dependency)
-            package = self._search_for_vcs(dependency)
+            with measure("metadata", "direct origin"):
+                package = self._search_for_vcs(dependency)
 
         elif dependency.is_file():
             dependency = cast("FileDependency", dependency)
-            package = self._search_for_file(dependency)
+            with measure("metadata", "direct origin"):
+                package = self._search_for_file(dependency)
 
         elif dependency.is_directory():
             dependency = cast("DirectoryDependency", dependency)
-            package = self._search_for_directory(dependency)
+            with measure("metadata", "direct origin"):
+                package = self._search_for_directory(dependency)
 
         elif dependency.is_url():
             dependency = cast("URLDependency", dependency)
-            package = self._search_for_url(dependency)
+            with measure("metadata", "direct origin"):
+                package = self._search_for_url(dependency)
 
         else:
             raise RuntimeError(
@@ -304,8 +391,30 @@ class Provider:
             reverse=True,
         )
 
+        if self.is_prefetching():
+            self._prefetch_release_info(packages[: self.PREFETCH_BATCH_SIZE])
+
         return PackageCollection(dependency, packages)
 
+    def _prefetch_release_info(self, packages: list[Package]) -> None:
+        """
+        Request the metadata of the given packages in one batch
+        from each repository that supports it.
+        """
+        versions: dict[str, list[Version]] = defaultdict(list)
+        for package in packages:
+            if (
+                package.source_type == "legacy"
+                and package.source_reference
+                and self._pool.has_repository(package.source_reference)
+            ):
+                versions[package.source_reference].append(package.version)
+
+        for repository_name, repository_versions in versions.items():
+            repository = self._pool.repository(repository_name)
+            if isinstance(repository, HTTPRepository):
+                repository.prefetch_release_info(packages[0].name, repository_versions)
+
     def _search_for_vcs(self, dependency: VCSDependency) -> Package:
         """
         Search for the specifications that match the given VCS dependency.
@@ -416,34 +525,15 @@ class Provider:
         else:
             dependencies = package.requires
 
-            if not package.python_constraint.allows_all(self._python_constraint):
-                transitive_python_constraint = get_python_constraint_from_marker(
-                    dependency_package.dependency.transitive_marker
-                )
-                intersection = package.python_constraint.intersect(
-                    transitive_python_constraint
-                )
-                difference = transitive_python_constraint.difference(intersection)
-
-                # The difference is only relevant if it intersects
-                # the root package python constraint
-                difference = difference.intersect(self._python_constraint)
-                if (
-                    transitive_python_constraint.is_any()
-                    or self._python_constraint.intersect(
-                        dependency_package.dependency.python_constraint
-                    ).is_empty()
-                    or intersection.is_empty()
-                    or not difference.is_empty()
-                ):
-                    return [
-                        Incompatibility(
-                            [Term(package.to_dependency(), True)],
-                            PythonCauseError(
-                                package.python_versions, str(self._python_constraint)
-                            ),
-                        )
-                    ]
+            if not self._is_python_compatible(dependency_package):
+                return [
+                    Incompatibility(
+                        [Term(package.to_dependency(), True)],
+                        PythonCauseError(
+                            package.python_versions, str(self._python_constraint)
+                        ),
+                    )
+                ]
 
         return [
             Incompatibility(
@@ -453,6 +543,63 @@ class Provider:
             for dep in self._get_dependencies_with_overrides(dependencies, package)
         ]
 
+    def _is_python_compatible(self, dependency_package: DependencyPackage) -> bool:
+        """
+        Returns whether the Python requirement of a package is compatible
+        with the project's Python requirement in the context of its dependency.
+        """
+        package = dependency_package.package
+        if package.python_constraint.allows_all(self._python_constraint):
+            return True
+
+        transitive_python_constraint = get_python_constraint_from_marker(
+            dependency_package.dependency.transitive_marker
+        )
+        intersection = package.python_constraint.intersect(transitive_python_constraint)
+        difference = transitive_python_constraint.difference(intersection)
+
+        # The difference is only relevant if it intersects
+        # the root package python constraint
+        difference = difference.intersect(self._python_constraint)
+        return not (
+            transitive_python_constraint.is_any()
+            or self._python_constraint.intersect(
+                dependency_package.dependency.python_constraint
+            ).is_empty()
+            or intersection.is_empty()
+            or not difference.is_empty()
+        )
+
+    def _get_python_incompatible_package(
+        self, dependency_package: DependencyPackage
+    ) -> DependencyPackage | None:
+        """
+        Returns the package with the Python requirement from the repository index
+        if this requirement is not compatible with the project's Python requirement
+        so that the package can be rejected without retrieving its metadata.
+        """
+        package = dependency_package.package
+        requires_python = self._pool.requires_python(
+            package.name,
+            package.version,
+            repository_name=dependency_package.dependency.source_name,
+        )
+        if not requires_python:
+            return None
+
+        try:
+            package = package.clone()
+            package.python_versions = requires_python
+        except ValueError:
+            # Invalid Python requirements are handled when retrieving the metadata.
+            return None
+
+        dependency_package = DependencyPackage(dependency_package.dependency, package)
+        if self._is_python_compatible(dependency_package):
+            return None
+
+        return dependency_package
+
     def complete_package(
         self, dependency_package: DependencyPackage
     ) -> DependencyPackage:
@@ -466,6 +613,23 @@ class Provider:
             requires = package.all_requires
         elif package.is_direct_origin():
             requires = package.requires
+        elif locked_package := self._get_reusable_locked_package(dependency_package):
+            dependency_package = DependencyPackage(dependency, locked_package)
+            package = dependency_package.package
+            requires = package.requires
+        elif incompatible_package := self._get_python_incompatible_package(
+            dependency_package
+        ):
+            # The package will be rejected because of its Python requirement
+            # so that its dependencies are not relevant.
+            self.debug(
+                f"<debug>Skipping the metadata of {package.complete_name}"
+                f" ({package.full_pretty_version}) because it requires Python"
+                f" {incompatible_package.package.python_versions}.</debug>"
+            )
+            if dependency.extras:
+                return incompatible_package.with_features(list(dependency.extras))
+            return incompatible_package
         else:
             dependency_package = DependencyPackage(
                 dependency,
@@ -758,6 +922,34 @@ class Provider:
                 return DependencyPackage(dependency, package)
         return None
 
+    def _get_reusable_locked_package(
+        self, dependency_package: DependencyPackage
+    ) -> Package | None:
+        """
+        Returns the locked package corresponding to the given package
+        if its locked dependencies can be used instead of its metadata.
+        """
+        package = dependency_package.package
+        if not self._use_locked_dependencies or package.name in self._use_latest:
+            return None
+
+        for locked in self._locked.get(package.name, []):
+            if locked.package != package:
+                continue
+
+            # The lock file only contains the dependencies of extras
+            # that have been requested when locking.
+            locked_requires = {dep.name for dep in locked.package.requires}
+            if all(
+                dep.name in locked_requires
+                for extra in dependency_package.dependency.extras
+                for dep in locked.package.extras.get(extra, [])
+            ):
+                return locked.package
+            break
+
+        return None
+
     def debug(self, message: str, depth: int = 0) -> None:
         if not (self._io.is_very_verbose() or self._io.is_debug()):
             return
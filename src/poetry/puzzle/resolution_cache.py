@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+from typing import Any
+
+import requests
+
+from packaging.utils import canonicalize_name
+
+from poetry.__version__ import __version__
+from poetry.console.exceptions import PoetryRuntimeError
+from poetry.repositories.exceptions import RepositoryError
+from poetry.repositories.http_repository import HTTPRepository
+from poetry.utils.cache import create_file_cache
+
+
+if TYPE_CHECKING:
+    from collections.abc import Collection
+
+    from packaging.utils import NormalizedName
+    from poetry.core.packages.package import Package
+
+    from poetry.config.config import Config
+    from poetry.packages import Locker
+    from poetry.packages.transitive_package_info import TransitivePackageInfo
+    from poetry.repositories import RepositoryPool
+    from poetry.utils.cache import FileCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class ResolutionCache:
+    """
+    A persistent cache of dependency resolution results.
+
+    The results are keyed by the relevant content of the pyproject file,
+    the configured sources and the locked packages. Further, the fingerprints
+    of all project pages that have been consulted during the resolution
+    are stored so that a cached result is only used if none of these pages
+    have changed.
+    """
+
+    CACHE_VERSION = "1"
+
+    def __init__(self, locker: Locker, pool: RepositoryPool, config: Config) -> None:
+        self._locker = locker
+        self._pool = pool
+        self._cache: FileCache[dict[str, Any]] = create_file_cache(
+            config.resolution_cache_directory, config.get("cache.backend")
+        )
+        self._max_workers = config.solver_max_workers
+
+    @property
+    def is_supported(self) -> bool:
+        """
+        Only repositories that provide fingerprints of their project pages
+        can be checked for changes.
+        """
+        return bool(self._pool.all_repositories) and all(
+            isinstance(repo, HTTPRepository) for repo in self._pool.all_repositories
+        )
+
+    def get(
+        self, locked: list[Package], use_latest: Collection[NormalizedName]
+    ) -> dict[Package, TransitivePackageInfo] | None:
+        if not self.is_supported:
+            return None
+
+        entry = self._cache.get(self._key(locked, use_latest))
+        if entry is None:
+            return None
+
+        if not self._is_unchanged(entry["fingerprints"]):
+            logger.debug("The resolution cache is outdated.")
+            return None
+
+        return self._locker.load_packages(entry["packages"])
+
+    def put(
+        self,
+        locked: list[Package],
+        use_latest: Collection[NormalizedName],
+        packages: dict[Package, TransitivePackageInfo],
+    ) -> None:
+        # We cannot detect changes of direct origin dependencies
+        # without retrieving them again.
+        if not self.is_supported or any(p.is_direct_origin() for p in packages):
+            return
+
+        fingerprints = {
+            repo.name: repo.page_fingerprints
+            for repo in self._pool.all_repositories
+            if isinstance(repo, HTTPRepository)
+        }
+
+        self._cache.put(
+            self._key(locked, use_latest),
+            {
+                "fingerprints": fingerprints,
+                "packages": self._locker.dump_packages(packages),
+            },
+        )
+
+    def _key(
+        self, locked: list[Package], use_latest: Collection[NormalizedName]
+    ) -> str:
+        sources = [
+            (
+                repo.name,
+                self._pool.get_priority(repo.name).name,
+                repo.url if isinstance(repo, HTTPRepository) else None,
+            )
+            for repo in self._pool.all_repositories
+        ]
+        locked_packages = sorted(
+            (
+                package.name,
+                package.version.text,
+                package.source_type or "",
+                package.source_url or "",
+                package.source_reference or "",
+                package.source_resolved_reference or "",
+            )
+            for package in locked
+        )
+        key_parts = {
+            "cache-version": self.CACHE_VERSION,
+            "poetry-version": __version__,
+            "content-hash": self._locker.content_hash,
+            "sources": sources,
+            "locked": locked_packages,
+            "use-latest": sorted(use_latest),
+        }
+        return hashlib.sha256(
+            json.dumps(key_parts, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
+    def _is_unchanged(self, fingerprints: dict[str, dict[str, str | None]]) -> bool:
+        pages: list[tuple[HTTPRepository, NormalizedName, str | None]] = []
+        for repo_name, repo_fingerprints in fingerprints.items():
+            if not self._pool.has_repository(repo_name):
+                return False
+            repo = self._pool.repository(repo_name)
+            if not isinstance(repo, HTTPRepository):
+                return False
+            pages.extend(
+                (repo, canonicalize_name(name), fingerprint)
+                for name, fingerprint in repo_fingerprints.items()
+            )
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            unchanged = all(executor.map(self._is_unchanged_page, pages))
+            if not unchanged:
+                executor.shutdown(cancel_futures=True)
+
+        return unchanged
+
+    @staticmethod
+    def _is_unchanged_page(
+        page: tuple[HTTPRepository, NormalizedName, str | None],
+    ) -> bool:
+        repo, name, fingerprint = page
+        try:
+            return repo.get_page_fingerprint(name) == fingerprint
+        except (
+            RepositoryError,
+            PoetryRuntimeError,
+            requests.RequestException,
+            OSError,
+            ValueError,
+        ) as e:
+            logger.debug("Failed to check %s in %s: %s", name, repo.name, e)
+            return False
@@ -13,6 +13,7 @@ from poetry.core.version.markers import MultiMarker
 from poetry.core.version.markers import SingleMarker
 from poetry.core.version.markers import parse_marker
 
+from poetry.config.config import Config
 from poetry.mixology import resolve_version
 from poetry.mixology.failure import SolveFailureError
 from poetry.packages.transitive_package_info import TransitivePackageInfo
@@ -20,6 +21,7 @@ from poetry.puzzle.exceptions import OverrideNeededError
 from poetry.puzzle.exceptions import SolverProblemError
 from poetry.puzzle.provider import Indicator
 from poetry.puzzle.provider import Provider
+from poetry.utils.profiler import measure
 
 
 if TYPE_CHECKING:
@@ -59,14 +61,18 @@ class Solver:
         self._locked_packages = locked
         self._io = io
 
+        config = Config.create()
+        self._activity_heuristic = bool(config.get("solver.activity-heuristic"))
         self._provider = Provider(
             self._package,
             self._pool,
             self._io,
             locked=locked,
             active_root_extras=active_root_extras,
+            prefetch_workers=config.solver_max_workers,
         )
         self._overrides: list[dict[Package, dict[str, Dependency]]] = []
+        self._marker_cache = MarkerCache()
 
     @property
     def provider(self) -> Provider:
@@ -78,13 +84,30 @@ class Solver:
             yield
 
     def solve(
-        self, use_latest: Collection[NormalizedName] | None = None
+        self,
+        use_latest: Collection[NormalizedName] | None = None,
+        incremental: bool = False,
     ) -> Transaction:
+        """
+        Resolves the dependencies of the root package.
+
+        If `incremental` is set, the dependencies of locked packages are taken
+        from the lock file so that only the metadata of packages that cannot
+        be satisfied by the lock file anymore has to be retrieved.
+        """
         from poetry.puzzle.transaction import Transaction
 
         with self._progress(), self._provider.use_latest_for(use_latest or []):
             start = time.time()
-            packages = self._solve()
+            try:
+                with self._provider.use_prefetching():
+                    packages = (
+                        self._solve_incrementally() if incremental else self._solve()
+                    )
+            finally:
+                # Cancelling background work after prefetching has stopped drops
+                # lookups and metadata downloads that are not needed anymore.
+                self._pool.cancel_background_work()
             # simplify markers by removing redundant information
             for transitive_info in packages.values():
                 for group, marker in transitive_info.markers.items():
@@ -93,6 +116,12 @@ class Solver:
                     )
             end = time.time()
 
+            self._provider.debug(
+                f"Marker cache: {self._marker_cache.hits} hits,"
+                f" {self._marker_cache.misses} misses."
+            )
+            self._marker_cache.clear()
+
             if len(self._overrides) > 1:
                 self._provider.debug(
                     # ignore the warning as provider does not do interpolation
@@ -158,14 +187,34 @@ class Solver:
             new_packages = self._solve()
             override_packages.append((override, new_packages))
 
-        return merge_override_packages(override_packages)
+        return merge_override_packages(override_packages, self._marker_cache)
+
+    def _solve_incrementally(self) -> dict[Package, TransitivePackageInfo]:
+        with self._provider.use_locked_dependencies():
+            try:
+                return self._solve()
+            except SolverProblemError as e:
+                self._provider.debug(
+                    # ignore the warning as provider does not do interpolation
+                    f"Incremental version solving failed: {e}\n"
+                    "Retrying with the metadata from the repositories."
+                )
+
+        self._provider.set_overrides({})
+        self._overrides.clear()
+
+        return self._solve()
 
     def _solve(self) -> dict[Package, TransitivePackageInfo]:
         if self._provider._overrides:
             self._overrides.append(self._provider._overrides)
 
         try:
-            result = resolve_version(self._package, self._provider)
+            result = resolve_version(
+                self._package,
+                self._provider,
+                activity_heuristic=self._activity_heuristic,
+            )
 
             packages = result.packages
         except OverrideNeededError as e:
@@ -173,7 +222,8 @@ class Solver:
         except SolveFailureError as e:
             raise SolverProblemError(e)
 
-        return self._aggregate_solved_packages(packages)
+        with measure("marker aggregation"):
+            return self._aggregate_solved_packages(packages)
 
     def _aggregate_solved_packages(
         self, packages: list[Package]
@@ -182,7 +232,7 @@ class Solver:
             PackageNode(self._package, packages)
         )
         results = dict(aggregate_package_nodes(nodes) for nodes in combined_nodes)
-        calculate_markers(results, markers)
+        calculate_markers(results, markers, self._marker_cache)
 
         # Merging feature packages with base packages
         solved_packages = {}
@@ -375,9 +425,78 @@ def aggregate_package_nodes(
     return package, TransitivePackageInfo(depth, groups, {})
 
 
+class MarkerCache:
+    """
+    A cache for unions and intersections of markers.
+
+    Markers are interned so that equal markers are represented by the same
+    object and operations can be looked up by identity instead of hashing
+    and comparing (possibly large) markers again and again.
+    The cache keeps all markers alive, so it should only be used for one solve.
+    """
+
+    def __init__(self) -> None:
+        self._interned: dict[BaseMarker, BaseMarker] = {}
+        # Maps the id of each marker that has been interned to the marker itself
+        # and its interned equivalent. The marker is kept to ensure that its id
+        # is not reused by another object.
+        self._by_id: dict[int, tuple[BaseMarker, BaseMarker]] = {}
+        self._unions: dict[tuple[int, int], BaseMarker] = {}
+        self._intersections: dict[tuple[int, int], BaseMarker] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def intern(self, marker: BaseMarker) -> BaseMarker:
+        entry = self._by_id.get(id(marker))
+        if entry is not None:
+            return entry[1]
+
+        interned = self._interned.setdefault(marker, marker)
+        self._by_id[id(marker)] = (marker, interned)
+        return interned
+
+    def union(self, marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+        marker = self.intern(marker)
+        other = self.intern(other)
+        key = (id(marker), id(other))
+        result = self._unions.get(key)
+        if result is None:
+            self.misses += 1
+            result = self._unions[key] = self.intern(marker.union(other))
+        else:
+            self.hits += 1
+        return result
+
+    def intersect(self, marker: BaseMarker, other: BaseMarker) -> BaseMarker:
+        marker = self.intern(marker)
+        other = self.intern(other)
+        key = (id(marker), id(other))
+        result = self._intersections.get(key)
+        if result is None:
+            self.misses += 1
+            result = self._intersections[key] = self.intern(marker.intersect(other))
+        else:
+            self.hits += 1
+        return result
+
+    def clear(self) -> None:
+        self._interned.clear()
+        self._by_id.clear()
+        self._unions.clear()
+        self._intersections.clear()
+        self.hits = 0
+        self.misses = 0
+
+
 def calculate_markers(
-    packages: dict[Package, TransitivePackageInfo], markers: MarkerOriginDict
+    packages: dict[Package, TransitivePackageInfo],
+    markers: MarkerOriginDict,
+    marker_cache: MarkerCache | None = None,
 ) -> None:
+    if marker_cache is None:
+        marker_cache = MarkerCache()
+
     # group packages by depth
     packages_by_depth: dict[int, list[Package]] = defaultdict(list)
     max_depth = -1
@@ -387,30 +506,53 @@ def calculate_markers(
 
     # calculate markers from lowest to highest depth
     # (start with depth 0 because the root package has depth -1)
+    ordered_packages = [
+        package
+        for depth in range(max_depth + 1)
+        for package in packages_by_depth[depth]
+    ]
+    children: dict[Package, list[Package]] = defaultdict(list)
+    for package in ordered_packages:
+        for parent in markers[package]:
+            children[parent].append(package)
+
+    # The packages whose markers have to be (re-)calculated because they have not
+    # been calculated yet, the marker of a parent was not complete (cycle)
+    # or the marker of a parent has changed since they have been calculated.
+    pending = set(ordered_packages)
     has_incomplete_markers = True
     while has_incomplete_markers:
         has_incomplete_markers = False
-        for depth in range(max_depth + 1):
-            for package in packages_by_depth[depth]:
-                transitive_info = packages[package]
-                transitive_marker: dict[str, BaseMarker] = {
-                    group: EmptyMarker() for group in transitive_info.groups
-                }
-                for parent, m in markers[package].items():
-                    parent_info = packages[parent]
-                    if parent_info.groups:
-                        if parent_info.groups != set(parent_info.markers):
-                            # there is a cycle -> we need one more iteration
-                            has_incomplete_markers = True
-                            continue
-                        for group in parent_info.groups:
-                            transitive_marker[group] = transitive_marker[group].union(
-                                parent_info.markers[group].intersect(m)
-                            )
-                    else:
-                        for group in transitive_info.groups:
-                            transitive_marker[group] = transitive_marker[group].union(m)
+        for package in ordered_packages:
+            if package not in pending:
+                continue
+            pending.discard(package)
+
+            transitive_info = packages[package]
+            transitive_marker: dict[str, BaseMarker] = {
+                group: EmptyMarker() for group in transitive_info.groups
+            }
+            for parent, m in markers[package].items():
+                parent_info = packages[parent]
+                if parent_info.groups:
+                    if parent_info.groups != set(parent_info.markers):
+                        # there is a cycle -> we need one more iteration
+                        has_incomplete_markers = True
+                        pending.add(package)
+                        continue
+                    for group in parent_info.groups:
+                        transitive_marker[group] = marker_cache.union(
+                            transitive_marker[group],
+                            marker_cache.intersect(parent_info.markers[group], m),
+                        )
+                else:
+                    for group in transitive_info.groups:
+                        transitive_marker[group] = marker_cache.union(
+                            transitive_marker[group], m
+                        )
+            if transitive_marker != transitive_info.markers:
                 transitive_info.markers = transitive_marker
+                pending.update(children[package])
 
 
 def merge_override_packages(
@@ -419,7 +561,11 @@ def merge_override_packages(
             dict[Package, dict[str, Dependency]], dict[Package, TransitivePackageInfo]
         ]
     ],
+    marker_cache: MarkerCache | None = None,
 ) -> dict[Package, TransitivePackageInfo]:
+    if marker_cache is None:
+        marker_cache = MarkerCache()
+
     result: dict[Package, TransitivePackageInfo] = {}
     all_packages: dict[
         Package, list[tuple[Package, TransitivePackageInfo, BaseMarker]]
@@ -428,7 +574,9 @@ def merge_override_packages(
         override_marker: BaseMarker = AnyMarker()
         for deps in override.values():
             for dep in deps.values():
-                override_marker = override_marker.intersect(dep.marker.without_extras())
+                override_marker = marker_cache.intersect(
+                    override_marker, dep.marker.without_extras()
+                )
         for package, info in o_packages.items():
             for group, marker in info.markers.items():
                 # `override_marker` is often a SingleMarker or a MultiMarker,
@@ -458,20 +606,23 @@ def merge_override_packages(
             # we can use less expensive marker operations
             override_marker = EmptyMarker()
             for _, _, marker in package_duplicates:
-                override_marker = override_marker.union(marker)
+                override_marker = marker_cache.union(override_marker, marker)
             package_info.markers = {
-                group: override_marker.intersect(marker)
+                group: marker_cache.intersect(override_marker, marker)
                 for group, marker in package_info.markers.items()
             }
         else:
             # fallback / general algorithm with performance issues
             for group, marker in package_info.markers.items():
-                package_info.markers[group] = first_override_marker.intersect(marker)
+                package_info.markers[group] = marker_cache.intersect(
+                    first_override_marker, marker
+                )
             for _, info, override_marker in remaining:
                 for group, marker in info.markers.items():
-                    package_info.markers[group] = package_info.markers.get(
-                        group, EmptyMarker()
-                    ).union(override_marker.intersect(marker))
+                    package_info.markers[group] = marker_cache.union(
+                        package_info.markers.get(group, EmptyMarker()),
+                        marker_cache.intersect(override_marker, marker),
+                    )
         for duplicate_package, _, _ in remaining:
             for dep in duplicate_package.requires:
                 if dep not in package.requires:
@@ -11,6 +11,8 @@ from poetry.core.constraints.version import parse_constraint
 from poetry.config.config import Config
 from poetry.repositories.repository import Repository
 from poetry.utils.cache import FileCache
+from poetry.utils.cache import create_file_cache
+from poetry.utils.profiler import measure
 
 
 if TYPE_CHECKING:
@@ -29,8 +31,11 @@ class CachedRepository(Repository, ABC):
     ) -> None:
         super().__init__(name)
         self._disable_cache = disable_cache
-        self._cache_dir = (config or Config.create()).repository_cache_directory / name
-        self._release_cache: FileCache[dict[str, Any]] = FileCache(path=self._cache_dir)
+        config = config or Config.create()
+        self._cache_dir = config.repository_cache_directory / name
+        self._release_cache: FileCache[dict[str, Any]] = create_file_cache(
+            self._cache_dir, config.get("cache.backend")
+        )
 
     @abstractmethod
     def _get_release_info(
@@ -67,6 +72,7 @@ class CachedRepository(Repository, ABC):
         return PackageInfo.load(cached)
 
     def package(self, name: str, version: Version) -> Package:
-        return self.get_release_info(canonicalize_name(name), version).to_package(
-            name=name
-        )
+        with measure("metadata", self.name):
+            return self.get_release_info(canonicalize_name(name), version).to_package(
+                name=name
+            )
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import functools
 import hashlib
+import threading
+import urllib.parse
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
 from contextlib import suppress
 from pathlib import Path
@@ -21,11 +24,15 @@ from poetry.core.version.markers import parse_marker
 from poetry.config.config import Config
 from poetry.inspection.info import PackageInfo
 from poetry.inspection.lazy_wheel import LazyWheelUnsupportedError
+from poetry.inspection.lazy_wheel import RangeCache
 from poetry.inspection.lazy_wheel import metadata_from_wheel_url
 from poetry.repositories.cached_repository import CachedRepository
 from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.exceptions import RepositoryError
 from poetry.repositories.link_sources.html import HTMLPage
+from poetry.repositories.link_sources.index import IndexedPage
+from poetry.repositories.link_sources.index import PageIndex
+from poetry.repositories.link_sources.json import SimpleJsonPage
 from poetry.utils.authenticator import Authenticator
 from poetry.utils.constants import REQUESTS_TIMEOUT
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
@@ -35,15 +42,25 @@ from poetry.utils.patterns import wheel_file_re
 
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from collections.abc import Iterator
+    from concurrent.futures import Future
 
     from packaging.utils import NormalizedName
+    from poetry.core.constraints.version import Version
     from poetry.core.packages.utils.link import Link
 
     from poetry.repositories.link_sources.base import LinkSource
     from poetry.utils.authenticator import RepositoryCertificateConfig
 
 
+# PEP 691: Prefer the JSON-based Simple API but accept HTML.
+SIMPLE_API_JSON = "application/vnd.pypi.simple.v1+json"
+SIMPLE_API_ACCEPT = (
+    f"{SIMPLE_API_JSON}, application/vnd.pypi.simple.v1+html;q=0.2, text/html;q=0.01"
+)
+
+
 class HTTPRepository(CachedRepository):
     def __init__(
         self,
@@ -65,9 +82,21 @@ class HTTPRepository(CachedRepository):
             pool_size=pool_size,
         )
         self._authenticator.add_repository(name, url)
-        self.get_page = functools.lru_cache(maxsize=None)(self._get_page)
+        self._pool_size = pool_size
+        # Project pages that have been retrieved (None if the project was not found)
+        # so that we can check later if the repository has changed.
+        self._retrieved_pages: dict[NormalizedName, LinkSource | None] = {}
+        self.get_page = functools.lru_cache(maxsize=None)(self._get_retrieved_page)
 
         self._lazy_wheel = config.get("solver.lazy-wheel", True)
+        # Parsed project pages, which are revalidated with their ETag or Last-Modified.
+        self._page_index = (
+            None if disable_cache else PageIndex(self._cache_dir / "_pages")
+        )
+        # Byte ranges of wheels that have been fetched via range requests.
+        self._range_cache = (
+            None if disable_cache else RangeCache(self._cache_dir / "lazy-wheel")
+        )
         self._max_retries = config.get("requests.max-retries", 0)
         # We are tracking if a domain supports range requests or not to avoid
         # unnecessary requests.
@@ -78,6 +107,15 @@ class HTTPRepository(CachedRepository):
         # - False: The domain does not support range requests for the files we tried.
         self._supports_range_requests: dict[str, bool] = {}
 
+        # Release information that is fetched in the background
+        # (see prefetch_release_info()).
+        self._max_workers = config.solver_max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._prefetched: dict[tuple[NormalizedName, Version], Future[PackageInfo]] = {}
+        self._prefetch_requested: set[tuple[NormalizedName, Version]] = set()
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._prefetch_lock = threading.Lock()
+
     @property
     def session(self) -> Authenticator:
         return self._authenticator
@@ -128,7 +166,9 @@ class HTTPRepository(CachedRepository):
         if self._lazy_wheel and self._supports_range_requests.get(netloc, True):
             try:
                 package_info = PackageInfo.from_metadata(
-                    metadata_from_wheel_url(link.filename, link.url, self.session)
+                    metadata_from_wheel_url(
+                        link.filename, link.url, self.session, cache=self._range_cache
+                    )
                 )
             except LazyWheelUnsupportedError as e:
                 # Do not set to False if we already know that the domain supports
@@ -166,6 +206,96 @@ class HTTPRepository(CachedRepository):
         with self._cached_or_downloaded_file(link) as filepath:
             return PackageInfo.from_sdist(filepath)
 
+    def get_release_info(self, name: NormalizedName, version: Version) -> PackageInfo:
+        with self._prefetch_lock:
+            future = self._prefetched.pop((name, version), None)
+
+        # Releases whose prefetch has not been started yet or has failed
+        # are fetched synchronously so that errors are raised as usual.
+        if future is not None and not future.cancel() and not future.exception():
+            return future.result()
+
+        return super().get_release_info(name, version)
+
+    def prefetch_release_info(
+        self, name: NormalizedName, versions: Iterable[Version]
+    ) -> None:
+        """
+        Start fetching the release information of multiple versions of a package
+        in the background if their files provide core metadata (PEP 658).
+
+        Only the project page must have been retrieved before. The metadata files
+        are fetched concurrently with at most as many requests to the same host
+        at a time as the connection pool of the session allows. Subsequent calls
+        of get_release_info() for these versions wait for the result.
+        """
+        page = self._retrieved_pages.get(name)
+        if page is None:
+            return
+
+        versions = list(versions)
+        # Releases that are already in the cache do not have to be fetched.
+        cached = (
+            set()
+            if self._disable_cache
+            else self._release_cache.get_many(
+                [f"{name}:{version}" for version in versions]
+            ).keys()
+        )
+
+        with self._prefetch_lock:
+            for version in versions:
+                key = (name, version)
+                if key in self._prefetch_requested or f"{name}:{version}" in cached:
+                    continue
+
+                metadata_url = next(
+                    (
+                        link.metadata_url
+                        for link in page.links_for_version(name, version)
+                        if link.has_metadata
+                    ),
+                    None,
+                )
+                if metadata_url is None:
+                    continue
+
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self._max_workers,
+                        thread_name_prefix=f"{self.name}-metadata",
+                    )
+                self._prefetch_requested.add(key)
+                self._prefetched[key] = self._executor.submit(
+                    self._fetch_release_info,
+                    name,
+                    version,
+                    self._host_slot(metadata_url),
+                )
+
+    def cancel_background_work(self) -> None:
+        with self._prefetch_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+            self._prefetched.clear()
+            self._prefetch_requested.clear()
+
+    def _fetch_release_info(
+        self,
+        name: NormalizedName,
+        version: Version,
+        slot: threading.BoundedSemaphore,
+    ) -> PackageInfo:
+        with slot:
+            return super().get_release_info(name, version)
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urllib.parse.urlsplit(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = threading.BoundedSemaphore(self._pool_size)
+        return self._host_slots[host]
+
     def _get_info_from_metadata(self, link: Link) -> PackageInfo | None:
         if link.has_metadata:
             try:
@@ -400,11 +530,13 @@ class HTTPRepository(CachedRepository):
                 return f"{required_hash.name}:{required_hash.hexdigest()}"
         return None
 
-    def _get_response(self, endpoint: str) -> requests.Response | None:
+    def _get_response(
+        self, endpoint: str, headers: dict[str, str] | None = None
+    ) -> requests.Response | None:
         url = self._url + endpoint
         try:
             response: requests.Response = self.session.get(
-                url, raise_for_status=False, timeout=REQUESTS_TIMEOUT
+                url, raise_for_status=False, timeout=REQUESTS_TIMEOUT, headers=headers
             )
             if response.status_code in (401, 403):
                 self._log(
@@ -425,8 +557,93 @@ class HTTPRepository(CachedRepository):
             )
         return response
 
+    @property
+    def page_fingerprints(self) -> dict[NormalizedName, str | None]:
+        """
+        Fingerprints of all project pages that have been retrieved so far.
+        The fingerprint is None if the project has not been found.
+        """
+        return {
+            name: page.fingerprint if page is not None else None
+            for name, page in self._retrieved_pages.items()
+        }
+
+    def requires_python(self, name: NormalizedName, version: Version) -> str | None:
+        """
+        Returns the Python requirement of a release from the project page
+        if the page has already been retrieved.
+        """
+        if name not in self._retrieved_pages:
+            return None
+
+        page = self._retrieved_pages[name]
+        if page is None or not any(page.links_for_version(name, version)):
+            raise PackageNotFoundError(f"Package {name} ({version}) not found.")
+
+        return page.requires_python(name, version)
+
+    def get_page_fingerprint(self, name: NormalizedName) -> str | None:
+        """
+        Retrieve the current project page (bypassing the in-memory cache)
+        and return its fingerprint or None if the project has not been found.
+        """
+        try:
+            return self._get_page(name).fingerprint
+        except PackageNotFoundError:
+            return None
+
+    def _get_retrieved_page(self, name: NormalizedName) -> LinkSource:
+        try:
+            page = self._get_page(name)
+        except PackageNotFoundError:
+            self._retrieved_pages[name] = None
+            raise
+
+        self._retrieved_pages[name] = page
+        return page
+
     def _get_page(self, name: NormalizedName) -> LinkSource:
-        response = self._get_response(f"/{name}/")
+        headers = {"Accept": SIMPLE_API_ACCEPT}
+        indexed = self._page_index.get(name) if self._page_index else None
+        if indexed is not None:
+            # Revalidate the indexed page if the HTTP cache does not.
+            if indexed.etag is not None:
+                headers["If-None-Match"] = indexed.etag
+            if indexed.last_modified is not None:
+                headers["If-Modified-Since"] = indexed.last_modified
+
+        response = self._get_response(f"/{name}/", headers=headers)
         if not response:
             raise PackageNotFoundError(f"Package [{name}] not found.")
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if indexed is not None and (
+            response.status_code == 304 or indexed.is_valid(etag, last_modified)
+        ):
+            return indexed
+
+        page = self._page_from_response(response)
+        if self._page_index is not None and (etag or last_modified):
+            self._page_index.put(
+                name,
+                IndexedPage.from_page(page, etag=etag, last_modified=last_modified),
+            )
+        return page
+
+    @staticmethod
+    def _page_from_response(response: requests.Response) -> LinkSource:
+        """
+        Parses a project page of the Simple API as JSON (PEP 691) or HTML (PEP 503)
+        depending on the content type the server has chosen.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        if content_type.split(";", 1)[0].strip() == SIMPLE_API_JSON:
+            try:
+                return SimpleJsonPage(response.url, response.json())
+            except ValueError as e:
+                raise RepositoryError(
+                    f"Invalid JSON project page {response.url}: {e}"
+                ) from e
+
         return HTMLPage(response.url, response.text)
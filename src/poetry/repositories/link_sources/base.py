@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import re
 
@@ -101,6 +103,18 @@ class LinkSource:
     ) -> Iterator[Link]:
         yield from self._link_cache[name][version]
 
+    def requires_python(self, name: NormalizedName, version: Version) -> str | None:
+        """
+        Returns the Python requirement of a version
+        if all its files declare the same Python requirement.
+        """
+        requires_python = {
+            link.requires_python for link in self.links_for_version(name, version)
+        }
+        if len(requires_python) == 1:
+            return requires_python.pop()
+        return None
+
     def clean_link(self, url: str) -> str:
         """Makes sure a link is fully encoded.  That is, if a ' ' shows up in
         the link, it will be rewritten to %20 (while not over-quoting
@@ -121,6 +135,25 @@ class LinkSource:
             return "\n".join(sorted(reasons))
         return True
 
+    @cached_property
+    def fingerprint(self) -> str:
+        """
+        A hash of all links of the page including the information
+        that is relevant for dependency resolution, e.g. yanked status.
+        """
+        links = sorted(
+            (
+                link.url,
+                link.requires_python,
+                link.yanked_reason if link.yanked else False,
+                dict(link.metadata_hashes) if link.has_metadata else None,
+            )
+            for link in self.links
+        )
+        return hashlib.sha256(
+            json.dumps(links, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+
     @cached_property
     def _link_cache(self) -> LinkCache:
         raise NotImplementedError()
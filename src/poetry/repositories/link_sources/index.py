@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import zlib
+
+from collections import defaultdict
+from functools import cached_property
+from typing import TYPE_CHECKING
+from typing import Any
+
+from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
+from poetry.core.packages.utils.link import Link
+
+from poetry.repositories.link_sources.base import LinkSource
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from packaging.utils import NormalizedName
+
+    from poetry.repositories.link_sources.base import LinkCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class IndexedPage(LinkSource):
+    """
+    Links of a project page that have been loaded from a page index
+    instead of being parsed from the page itself.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        etag: str | None,
+        last_modified: str | None,
+        fingerprint: str,
+        files: dict[str, dict[str, list[list[Any]]]],
+    ) -> None:
+        super().__init__(url=url)
+        self.etag = etag
+        self.last_modified = last_modified
+        self._fingerprint = fingerprint
+        self._files = files
+
+    @classmethod
+    def from_page(
+        cls, page: LinkSource, *, etag: str | None, last_modified: str | None
+    ) -> IndexedPage:
+        files: dict[str, dict[str, list[list[Any]]]] = defaultdict(dict)
+        for name, links_per_version in page._link_cache.items():
+            for version, links in links_per_version.items():
+                files[name][version.text] = [
+                    [
+                        link.url,
+                        link.requires_python,
+                        dict(link.hashes) or None,
+                        dict(link.metadata_hashes) or link.has_metadata,
+                        (link.yanked_reason or True) if link.yanked else False,
+                    ]
+                    for link in links
+                ]
+        return cls(
+            page.url,
+            etag=etag,
+            last_modified=last_modified,
+            fingerprint=page.fingerprint,
+            files=files,
+        )
+
+    def is_valid(self, etag: str | None, last_modified: str | None) -> bool:
+        """
+        Returns whether the page has not changed according to the given
+        validators of a response for the page.
+        """
+        if etag is not None or self.etag is not None:
+            return etag == self.etag
+        return last_modified is not None and last_modified == self.last_modified
+
+    @property
+    def fingerprint(self) -> str:
+        return self._fingerprint
+
+    @cached_property
+    def _link_cache(self) -> LinkCache:
+        links: LinkCache = defaultdict(lambda: defaultdict(list))
+        for name, files_per_version in self._files.items():
+            for version, files in files_per_version.items():
+                links[canonicalize_name(name)][Version.parse(version)] = [
+                    Link(
+                        url,
+                        requires_python=requires_python,
+                        hashes=hashes,
+                        metadata=metadata,
+                        yanked=yanked,
+                    )
+                    for url, requires_python, hashes, metadata, yanked in files
+                ]
+        return links
+
+
+class PageIndex:
+    """
+    Persistent index of the links of parsed project pages.
+
+    The links of each project are stored as compressed JSON together with
+    the validators (ETag and Last-Modified) of the response they were parsed from,
+    so that an unchanged page does not have to be parsed again.
+    """
+
+    FORMAT = 1
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+
+    def _index_path(self, name: NormalizedName) -> Path:
+        return self._path / f"{name}.idx"
+
+    def get(self, name: NormalizedName) -> IndexedPage | None:
+        try:
+            data = json.loads(zlib.decompress(self._index_path(name).read_bytes()))
+            if data["format"] != self.FORMAT:
+                return None
+            return IndexedPage(
+                data["url"],
+                etag=data["etag"],
+                last_modified=data["last_modified"],
+                fingerprint=data["fingerprint"],
+                files=data["files"],
+            )
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError, zlib.error) as e:
+            logger.debug("Ignoring invalid page index of %s: %s", name, e)
+            return None
+
+    def put(self, name: NormalizedName, page: IndexedPage) -> None:
+        data = {
+            "format": self.FORMAT,
+            "url": page.url,
+            "etag": page.etag,
+            "last_modified": page.last_modified,
+            "fingerprint": page.fingerprint,
+            "files": page._files,
+        }
+        path = self._index_path(name)
+        tmp_path = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(
+                zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+            )
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug("Could not write page index of %s: %s", name, e)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import urllib.parse
+
 from collections import defaultdict
 from functools import cached_property
 from typing import TYPE_CHECKING
@@ -25,7 +27,9 @@ class SimpleJsonPage(LinkSource):
     def _link_cache(self) -> LinkCache:
         links: LinkCache = defaultdict(lambda: defaultdict(list))
         for file in self.content["files"]:
-            url = file["url"]
+            # URLs may be relative to the URL of the page.
+            url = urllib.parse.urljoin(self._url, file["url"])
+            hashes = file.get("hashes")
             requires_python = file.get("requires-python")
             yanked = file.get("yanked", False)
 
@@ -42,7 +46,11 @@ class SimpleJsonPage(LinkSource):
                     break
 
             link = Link(
-                url, requires_python=requires_python, yanked=yanked, metadata=metadata
+                url,
+                requires_python=requires_python,
+                hashes=hashes,
+                yanked=yanked,
+                metadata=metadata,
             )
 
             if link.ext not in self.SUPPORTED_FORMATS:
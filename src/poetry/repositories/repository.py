@@ -102,6 +102,13 @@ class Repository(AbstractRepository):
     def find_links_for_package(self, package: Package) -> list[Link]:
         return []
 
+    def requires_python(self, name: NormalizedName, version: Version) -> str | None:
+        """
+        Returns the Python requirement of a release if it is known
+        without retrieving its metadata, otherwise None.
+        """
+        return None
+
     def package(self, name: str, version: Version) -> Package:
         canonicalized_name = canonicalize_name(name)
         for package in self.packages:
@@ -109,3 +116,9 @@ class Repository(AbstractRepository):
                 return package
 
         raise PackageNotFoundError(f"Package {name} ({version}) not found.")
+
+    def cancel_background_work(self) -> None:
+        """
+        Stops background work of the repository, e.g. fetching metadata.
+        The repository can still be used afterwards.
+        """
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import enum
+import threading
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import partial
 from typing import TYPE_CHECKING
+from typing import TypeVar
 
 from poetry.config.config import Config
 from poetry.repositories.abstract_repository import AbstractRepository
@@ -15,10 +20,16 @@ from poetry.utils.cache import ArtifactCache
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Generator
+
+    from packaging.utils import NormalizedName
     from poetry.core.constraints.version import Version
     from poetry.core.packages.dependency import Dependency
     from poetry.core.packages.package import Package
 
+T = TypeVar("T")
+
 
 class Priority(IntEnum):
     # The order of the members below dictates the actual priority. The first member has
@@ -49,9 +60,14 @@ class RepositoryPool(AbstractRepository):
         for repository in repositories:
             self.add_repository(repository)
 
-        self._artifact_cache = ArtifactCache(
-            cache_dir=(config or Config.create()).artifacts_cache_directory
+        config = config or Config.create()
+        self._artifact_cache = ArtifactCache(cache_dir=config.artifacts_cache_directory)
+
+        self._parallel_workers = (
+            config.solver_max_workers if config.get("solver.parallel-sources") else 0
         )
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
     @staticmethod
     def from_packages(packages: list[Package], config: Config | None) -> RepositoryPool:
@@ -157,12 +173,33 @@ class RepositoryPool(AbstractRepository):
         if repository_name:
             return self.repository(repository_name).package(name, version)
 
+        with closing(
+            self._lookup(self.repositories, lambda repo: repo.package(name, version))
+        ) as results:
+            for _, result in results:
+                try:
+                    return result()
+                except PackageNotFoundError:
+                    continue
+        raise PackageNotFoundError(f"Package {name} ({version}) not found.")
+
+    def requires_python(
+        self, name: NormalizedName, version: Version, repository_name: str | None = None
+    ) -> str | None:
+        """
+        Returns the Python requirement of a release if it is known
+        without retrieving its metadata, otherwise None.
+        """
+        if repository_name:
+            return self.repository(repository_name).requires_python(name, version)
+
+        # Consult the same repository the metadata would be retrieved from.
         for repo in self.repositories:
             try:
-                return repo.package(name, version)
+                return repo.requires_python(name, version)
             except PackageNotFoundError:
                 continue
-        raise PackageNotFoundError(f"Package {name} ({version}) not found.")
+        return None
 
     def find_packages(self, dependency: Dependency) -> list[Package]:
         repository_name = dependency.source_name
@@ -170,14 +207,64 @@ class RepositoryPool(AbstractRepository):
             return self.repository(repository_name).find_packages(dependency)
 
         packages: list[Package] = []
-        for repo in self.repositories:
-            if packages and self.get_priority(repo.name) is Priority.SUPPLEMENTAL:
-                break
-            packages += repo.find_packages(dependency)
+        with closing(
+            self._lookup(self.repositories, lambda repo: repo.find_packages(dependency))
+        ) as results:
+            for repo, result in results:
+                if packages and self.get_priority(repo.name) is Priority.SUPPLEMENTAL:
+                    break
+                packages += result()
         return packages
 
+    def _lookup(
+        self, repositories: list[Repository], lookup: Callable[[Repository], T]
+    ) -> Generator[tuple[Repository, Callable[[], T]], None, None]:
+        """
+        Yields each repository together with a function returning the result
+        of the lookup in this repository, in the given order.
+
+        If parallel lookups are enabled, the lookups in all repositories are started
+        at once so that the caller only waits for the slowest repository
+        it actually needs. When the generator is closed, lookups that are
+        not running yet are cancelled and the results of running lookups
+        are discarded. Thus, results and raised exceptions are the same
+        as with sequential lookups.
+        """
+        if not self._parallel_workers or len(repositories) < 2:
+            for repo in repositories:
+                yield repo, partial(lookup, repo)
+            return
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._parallel_workers,
+                    thread_name_prefix="repository-pool",
+                )
+            futures = [self._executor.submit(lookup, repo) for repo in repositories]
+        try:
+            for repo, future in zip(repositories, futures):
+                yield repo, future.result
+        finally:
+            for future in futures:
+                future.cancel()
+
     def search(self, query: str | list[str]) -> list[Package]:
         results: list[Package] = []
         for repo in self.repositories:
             results += repo.search(query)
         return results
+
+    def cancel_background_work(self) -> None:
+        """
+        Cancel pending lookups and background work of all repositories
+        so that they do not delay exiting the interpreter.
+        The pool can still be used afterwards.
+        """
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+        for repo in self.all_repositories:
+            repo.cancel_background_work()
@@ -30,6 +30,8 @@ from poetry.utils.constants import RETRY_AFTER_HEADER
 from poetry.utils.constants import STATUS_FORCELIST
 from poetry.utils.password_manager import HTTPAuthCredential
 from poetry.utils.password_manager import PasswordManager
+from poetry.utils.profiler import get_profiler
+from poetry.utils.profiler import measure
 
 
 if TYPE_CHECKING:
@@ -223,13 +225,22 @@ class Authenticator:
         }
         send_kwargs.update(settings)
 
+        # The source to which the time spent in requests is attributed when profiling.
+        source_name = None
+        if get_profiler() is not None:
+            repository = self.get_repository_config_for_url(url)
+            source_name = (
+                repository.name if repository else urllib.parse.urlsplit(url).netloc
+            )
+
         attempt = 0
         resp = None
 
         while True:
             is_last_attempt = attempt >= 5
             try:
-                resp = session.send(prepared_request, **send_kwargs)
+                with measure("network", source_name):
+                    resp = session.send(prepared_request, **send_kwargs)
             except (requests.exceptions.ConnectionError, OSError) as e:
                 if is_last_attempt:
                     parsed_url = urllib.parse.urlsplit(url)
@@ -1,17 +1,22 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import hashlib
 import json
 import logging
+import os
 import shutil
+import sqlite3
 import threading
 import time
 
 from collections import defaultdict
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 from typing import Any
+from typing import ClassVar
 from typing import Generic
 from typing import TypeVar
 from typing import overload
@@ -25,19 +30,38 @@ from poetry.utils.wheel import Wheel
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from collections.abc import Collection
+    from collections.abc import Iterable
+    from collections.abc import Iterator
 
     from poetry.core.packages.utils.link import Link
 
+    from poetry.config.config import Config
     from poetry.utils.env import Env
 
 
 # Used by FileCache for items that do not expire.
 MAX_DATE = 9999999999
+# The available storage backends of FileCache, see create_file_cache().
+CACHE_BACKENDS = ("file", "sqlite")
+# Cache entries are marked as accessed at most once per interval (in seconds)
+# so that reading an entry does not require a write every time.
+ACCESS_INTERVAL = 10 * 60
 T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
 
+def _touch(path: Path) -> None:
+    """
+    Mark a cache entry as accessed for the least recently used eviction
+    of CachePruner by updating its modification time.
+    """
+    with contextlib.suppress(OSError):
+        if time.time() - path.stat().st_mtime >= ACCESS_INTERVAL:
+            os.utime(path)
+
+
 def _expiration(minutes: int) -> int:
     """
     Calculates the time in seconds since epoch that occurs 'minutes' from now.
@@ -92,6 +116,20 @@ class FileCache(Generic[T]):
     def get(self, key: str) -> T | None:
         return self._get_payload(key)
 
+    def get_many(self, keys: Collection[str]) -> dict[str, T]:
+        """
+        Get all items of the given keys that exist and have not expired in the cache.
+
+        :param keys: The cache keys
+        :returns: The cached values by key
+        """
+        values = {}
+        for key in keys:
+            value = self.get(key)
+            if value is not None:
+                values[key] = value
+        return values
+
     def has(self, key: str) -> bool:
         """
         Determine if a file exists and has not expired in the cache.
@@ -168,11 +206,16 @@ class FileCache(Generic[T]):
             self.forget(key)
             return None
         else:
+            _touch(path)
             return payload.data
 
+    def _hash(self, key: str) -> str:
+        hash_type, _ = _HASHES[self.hash_type]
+        return hash_type(encode(key)).hexdigest()
+
     def _path(self, key: str) -> Path:
-        hash_type, parts_count = _HASHES[self.hash_type]
-        h = hash_type(encode(key)).hexdigest()
+        _, parts_count = _HASHES[self.hash_type]
+        h = self._hash(key)
         parts = [h[i : i + 2] for i in range(0, len(h), 2)][:parts_count]
         return Path(self.path, *parts, h)
 
@@ -188,6 +231,243 @@ class FileCache(Generic[T]):
         return CacheItem(data, expires)
 
 
+@dataclasses.dataclass(frozen=True)
+class SQLiteCache(FileCache[T]):
+    """
+    File cache that stores all items in a single SQLite database
+    instead of one file per item.
+
+    The database is shared by all threads and processes using the same path.
+    Items of a file cache with the same path are moved into the database
+    when it is created.
+
+    :param path: The path of the directory that contains the database.
+    :param hash_type: The hash to use for encoding keys.
+    """
+
+    DATABASE: ClassVar[str] = "cache.db"
+    SCHEMA_VERSION: ClassVar[int] = 1
+    # SQLite limits the number of parameters of a statement.
+    BATCH_SIZE: ClassVar[int] = 500
+
+    _local: threading.local = dataclasses.field(
+        default_factory=threading.local, init=False, repr=False, compare=False
+    )
+
+    def get_many(self, keys: Collection[str]) -> dict[str, T]:
+        hashes = {self._hash(key): key for key in keys}
+        rows = []
+        digests = list(hashes)
+        for i in range(0, len(digests), self.BATCH_SIZE):
+            batch = digests[i : i + self.BATCH_SIZE]
+            rows += self._connection.execute(
+                "SELECT key, expires, data, accessed FROM items"
+                f" WHERE key IN ({', '.join('?' * len(batch))})",
+                batch,
+            ).fetchall()
+
+        values = {}
+        for digest, expires, data, accessed in rows:
+            value = self._load(hashes[digest], expires, data, accessed)
+            if value is not None:
+                values[hashes[digest]] = value
+        return values
+
+    def put(self, key: str, value: Any, minutes: int | None = None) -> None:
+        expires = _expiration(minutes) if minutes is not None else MAX_DATE
+        self._connection.execute(
+            "INSERT OR REPLACE INTO items (key, expires, data, accessed)"
+            " VALUES (?, ?, ?, ?)",
+            (self._hash(key), expires, json.dumps(value), round(time.time())),
+        )
+
+    def forget(self, key: str) -> None:
+        self._connection.execute("DELETE FROM items WHERE key = ?", (self._hash(key),))
+
+    def flush(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            del self._local.connection
+        shutil.rmtree(self.path)
+
+    def migrate(self) -> int:
+        """
+        Move the items of a file cache with the same path into the database.
+
+        :returns: The number of moved items
+        """
+        connection = self._connection
+        with self._transaction(connection):
+            migrated = self._migrate(connection)
+        self._remove_migrated(migrated)
+        return len(migrated)
+
+    def entries(self) -> list[tuple[str, int, int]]:
+        """
+        Return the hashed key, the size in bytes and the time of the last access
+        of all items in the cache.
+        """
+        return self._connection.execute(
+            "SELECT key, length(CAST(data AS BLOB)), accessed FROM items"
+        ).fetchall()
+
+    def evict(self, entries: Iterable[tuple[str, int]]) -> None:
+        """
+        Remove items by their hashed key unless they have been accessed
+        after the given time.
+        """
+        connection = self._connection
+        with self._transaction(connection):
+            connection.executemany(
+                "DELETE FROM items WHERE key = ? AND accessed <= ?", entries
+            )
+        connection.execute("PRAGMA incremental_vacuum")
+
+    def _get_payload(self, key: str) -> T | None:
+        row = self._connection.execute(
+            "SELECT expires, data, accessed FROM items WHERE key = ?",
+            (self._hash(key),),
+        ).fetchone()
+        if row is None:
+            return None
+
+        return self._load(key, *row)
+
+    def _load(self, key: str, expires: int, data: str, accessed: int) -> T | None:
+        try:
+            payload: CacheItem[T] = CacheItem(json.loads(data), expires)
+        except ValueError:
+            self.forget(key)
+            logger.warning("Corrupt cache entry was detected and cleaned up.")
+            return None
+
+        if payload.expired:
+            self.forget(key)
+            return None
+
+        now = round(time.time())
+        if now - accessed >= ACCESS_INTERVAL:
+            self._connection.execute(
+                "UPDATE items SET accessed = ? WHERE key = ?", (now, self._hash(key))
+            )
+
+        return payload.data
+
+    @property
+    def _connection(self) -> sqlite3.Connection:
+        connection: sqlite3.Connection | None = getattr(self._local, "connection", None)
+        if connection is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            # Concurrent writers wait for each other instead of failing.
+            connection = sqlite3.connect(
+                self.path / self.DATABASE, timeout=60, isolation_level=None
+            )
+            # Space of evicted items is released (only applies to new databases).
+            connection.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            migrated = []
+            try:
+                # Only one process creates the schema and migrates existing items.
+                with self._transaction(connection):
+                    (version,) = connection.execute("PRAGMA user_version").fetchone()
+                    if version < self.SCHEMA_VERSION:
+                        connection.execute(
+                            "CREATE TABLE IF NOT EXISTS items"
+                            " (key TEXT PRIMARY KEY, expires INTEGER NOT NULL,"
+                            " data TEXT NOT NULL, accessed INTEGER NOT NULL)"
+                            " WITHOUT ROWID"
+                        )
+                        migrated = self._migrate(connection)
+                        connection.execute(
+                            f"PRAGMA user_version = {self.SCHEMA_VERSION}"
+                        )
+            except BaseException:
+                connection.close()
+                raise
+            self._remove_migrated(migrated)
+            self._local.connection = connection
+
+        return connection
+
+    def _migrate(self, connection: sqlite3.Connection) -> list[Path]:
+        _, parts_count = _HASHES[self.hash_type]
+        migrated = []
+        for root, dirs, files in os.walk(self.path):
+            depth = len(Path(root).relative_to(self.path).parts)
+            # Only descend into the directories of hashed keys.
+            dirs[:] = (
+                [d for d in dirs if len(d) == 2 and _is_hex(d)]
+                if depth < parts_count
+                else []
+            )
+            if depth != parts_count:
+                continue
+
+            prefix = "".join(Path(root).relative_to(self.path).parts)
+            for name in files:
+                if not (name.startswith(prefix) and _is_hex(name)):
+                    continue
+
+                path = Path(root, name)
+                try:
+                    payload = self._deserialize(path.read_bytes())
+                    accessed = round(path.stat().st_mtime)
+                except (OSError, ValueError):
+                    continue
+                connection.execute(
+                    "INSERT OR IGNORE INTO items (key, expires, data, accessed)"
+                    " VALUES (?, ?, ?, ?)",
+                    (name, payload.expires, json.dumps(payload.data), accessed),
+                )
+                migrated.append(path)
+
+        return migrated
+
+    def _remove_migrated(self, migrated: list[Path]) -> None:
+        for path in migrated:
+            path.unlink(missing_ok=True)
+            for parent in list(path.relative_to(self.path).parents)[:-1]:
+                try:
+                    (self.path / parent).rmdir()
+                except OSError:
+                    break
+
+        if migrated:
+            logger.debug("Migrated %d items into %s", len(migrated), self.path)
+
+    @staticmethod
+    @contextmanager
+    def _transaction(connection: sqlite3.Connection) -> Iterator[None]:
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+
+def _is_hex(value: str) -> bool:
+    return all(c in "0123456789abcdef" for c in value)
+
+
+def create_file_cache(path: Path, backend: str = "file") -> FileCache[Any]:
+    """
+    Create a file cache with the given storage backend.
+
+    :param path: The path that the cache starts at.
+    :param backend: One of CACHE_BACKENDS.
+    """
+    if backend == "sqlite":
+        return SQLiteCache(path)
+    if backend == "file":
+        return FileCache(path)
+
+    raise ValueError(f"Unknown cache backend: '{backend}'.")
+
+
 class ArtifactCache:
     def __init__(self, *, cache_dir: Path) -> None:
         self._cache_dir = cache_dir
@@ -258,7 +538,9 @@ class ArtifactCache:
         cached_archive = self._get_cached_archive(
             cache_dir, strict=strict, filename=link.filename, env=env
         )
-        if cached_archive is None and strict and download_func is not None:
+        if cached_archive is not None:
+            _touch(cache_dir)
+        elif strict and download_func is not None:
             cached_archive = cache_dir / link.filename
             with self._archive_locks[cached_archive]:
                 # Check again if the archive exists (under the lock) to avoid
@@ -279,7 +561,10 @@ class ArtifactCache:
     ) -> Path | None:
         cache_dir = self.get_cache_directory_for_git(url, reference, subdirectory)
 
-        return self._get_cached_archive(cache_dir, strict=False, env=env)
+        cached_archive = self._get_cached_archive(cache_dir, strict=False, env=env)
+        if cached_archive is not None:
+            _touch(cache_dir)
+        return cached_archive
 
     def _get_cached_archive(
         self,
@@ -338,3 +623,205 @@ class ArtifactCache:
             paths += cache_dir.glob(f"*.{archive_type}")
 
         return paths
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheEntry:
+    """
+    An entry of a cache that can be evicted.
+
+    :param path: The file or directory of the entry, or the directory
+        of the SQLite cache that contains the entry.
+    :param size: The size of the entry in bytes.
+    :param accessed: The time of the last access of the entry.
+    :param key: The hashed key of an entry of a SQLite cache.
+    """
+
+    path: Path
+    size: int
+    accessed: float
+    key: str | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class PruneResult:
+    size: int
+    evicted: list[CacheEntry]
+
+    @property
+    def evicted_size(self) -> int:
+        return sum(entry.size for entry in self.evicted)
+
+
+class CachePruner:
+    """
+    Evicts the least recently used artifacts and entries of repository caches
+    until the caches fit into a size budget.
+
+    Entries that have been accessed within the grace period are never evicted
+    because other Poetry processes might be about to use them. Further,
+    entries that have been accessed since the caches were scanned are kept.
+    """
+
+    # in seconds
+    GRACE_PERIOD = 60 * 60
+    # The minimum interval between automatic runs, see prune_if_due().
+    PRUNE_INTERVAL = 24 * 60 * 60
+
+    def __init__(
+        self,
+        *,
+        artifacts_cache_dir: Path,
+        file_cache_dirs: Iterable[Path],
+        stamp: Path | None = None,
+    ) -> None:
+        self._artifacts_cache_dir = artifacts_cache_dir
+        self._file_cache_dirs = list(file_cache_dirs)
+        self._stamp = stamp
+
+    @classmethod
+    def from_config(cls, config: Config) -> CachePruner:
+        repository_cache_dir = config.repository_cache_directory
+        repository_caches = (
+            [path for path in repository_cache_dir.iterdir() if path.is_dir()]
+            if repository_cache_dir.is_dir()
+            else []
+        )
+        return cls(
+            artifacts_cache_dir=config.artifacts_cache_directory,
+            file_cache_dirs=[*repository_caches, config.resolution_cache_directory],
+            stamp=Path(config.get("cache-dir")).expanduser() / ".pruned",
+        )
+
+    def entries(self) -> list[CacheEntry]:
+        entries = list(self._artifact_entries())
+        for path in self._file_cache_dirs:
+            entries += self._file_cache_entries(path)
+        return entries
+
+    def prune(self, max_size: int, *, dry_run: bool = False) -> PruneResult:
+        """
+        Evict the least recently used entries until the total size
+        of all entries does not exceed max_size (in bytes).
+        """
+        entries = self.entries()
+        size = sum(entry.size for entry in entries)
+        excess = size - max_size
+        threshold = time.time() - self.GRACE_PERIOD
+
+        evicted = []
+        for entry in sorted(entries, key=lambda entry: entry.accessed):
+            if excess <= 0 or entry.accessed > threshold:
+                break
+            evicted.append(entry)
+            excess -= entry.size
+
+        if not dry_run:
+            self._evict(evicted)
+            if self._stamp is not None:
+                with contextlib.suppress(OSError):
+                    self._stamp.parent.mkdir(parents=True, exist_ok=True)
+                    self._stamp.touch()
+
+        return PruneResult(size, evicted)
+
+    def prune_if_due(self, max_size: int) -> PruneResult | None:
+        """
+        Prune the caches unless they have already been pruned
+        within the prune interval.
+        """
+        if self._stamp is not None:
+            with contextlib.suppress(OSError):
+                if time.time() - self._stamp.stat().st_mtime < self.PRUNE_INTERVAL:
+                    return None
+
+        return self.prune(max_size)
+
+    def _artifact_entries(self) -> Iterator[CacheEntry]:
+        # The layout of ArtifactCache is aa/bb/cc/<rest of the key>/<artifacts>.
+        for path in self._artifacts_cache_dir.glob("*/*/*/*"):
+            if path.is_dir():
+                size, accessed = _tree_usage(path)
+                yield CacheEntry(path, size, accessed)
+
+    def _file_cache_entries(self, path: Path) -> Iterator[CacheEntry]:
+        database = path / SQLiteCache.DATABASE
+        if database.exists():
+            cache: SQLiteCache[Any] = SQLiteCache(path)
+            for key, size, accessed in cache.entries():
+                yield CacheEntry(path, size, accessed, key)
+
+        database_files = {database.name, f"{database.name}-wal", f"{database.name}-shm"}
+        for root, _, files in os.walk(path):
+            for name in files:
+                if Path(root) == path and name in database_files:
+                    continue
+                with contextlib.suppress(OSError):
+                    stat = Path(root, name).stat()
+                    yield CacheEntry(Path(root, name), _disk_usage(stat), stat.st_mtime)
+
+    def _evict(self, entries: list[CacheEntry]) -> None:
+        keys: defaultdict[Path, list[tuple[str, int]]] = defaultdict(list)
+        for entry in entries:
+            if entry.key is not None:
+                keys[entry.path].append((entry.key, round(entry.accessed)))
+                continue
+
+            # Entries that have been accessed in the meantime are kept.
+            with contextlib.suppress(OSError):
+                if entry.path.is_dir():
+                    if _tree_usage(entry.path)[1] > entry.accessed:
+                        continue
+                    # Renaming is atomic, so that other processes either see
+                    # the complete entry or none.
+                    removed = entry.path.with_name(f"{entry.path.name}.{os.getpid()}~")
+                    entry.path.rename(removed)
+                    shutil.rmtree(removed, ignore_errors=True)
+                else:
+                    if entry.path.stat().st_mtime > entry.accessed:
+                        continue
+                    entry.path.unlink()
+                self._remove_empty_parents(entry.path)
+
+        for path, evicted in keys.items():
+            cache: SQLiteCache[Any] = SQLiteCache(path)
+            cache.evict(evicted)
+
+    def _remove_empty_parents(self, path: Path) -> None:
+        roots = {self._artifacts_cache_dir, *self._file_cache_dirs}
+        for parent in path.parents:
+            if parent in roots:
+                break
+            try:
+                parent.rmdir()
+            except OSError:
+                break
+
+
+def _tree_usage(path: Path) -> tuple[int, float]:
+    """
+    Return the total size of all files in a directory
+    and the time of the most recent modification of the directory and its content.
+    """
+    size = 0
+    modified = path.stat().st_mtime
+    for root, dirs, files in os.walk(path):
+        for name in [*dirs, *files]:
+            with contextlib.suppress(OSError):
+                stat = Path(root, name).stat()
+                modified = max(modified, stat.st_mtime)
+                if name in files:
+                    size += _disk_usage(stat)
+    return size, modified
+
+
+def _disk_usage(stat: os.stat_result) -> int:
+    """
+    Return the disk space used by a file, which is less than its apparent size
+    if it is sparse, e.g. range cache files of older Poetry versions.
+    """
+    blocks: int | None = getattr(stat, "st_blocks", None)
+    if blocks is None:
+        return stat.st_size
+    # Allocated blocks are always counted in units of 512 bytes.
+    return min(stat.st_size, blocks * 512)
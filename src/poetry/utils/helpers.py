@@ -4,11 +4,13 @@ import hashlib
 import io
 import logging
 import os
+import queue
 import shutil
 import stat
 import sys
 import tarfile
 import tempfile
+import threading
 import zipfile
 
 from collections.abc import Mapping
@@ -33,6 +35,7 @@ if TYPE_CHECKING:
     from collections.abc import Collection
     from collections.abc import Iterator
     from types import TracebackType
+    from typing import BinaryIO
 
     from poetry.core.packages.package import Package
     from requests import Response
@@ -125,6 +128,10 @@ def merge_dicts(d1: dict[str, Any], d2: dict[str, Any]) -> None:
             d1[k] = d2[k]
 
 
+class RangeRequestIgnoredError(Exception):
+    """Raised when a server does not respond with the requested byte range."""
+
+
 class HTTPRangeRequestSupportedError(Exception):
     """Raised when server unexpectedly supports byte ranges."""
 
@@ -134,7 +141,7 @@ def download_file(
     dest: Path,
     *,
     session: Authenticator | Session | None = None,
-    chunk_size: int = 1024,
+    chunk_size: int | None = None,
     raise_accepts_ranges: bool = False,
     max_retries: int = 0,
 ) -> None:
@@ -167,15 +174,22 @@ def download_file(
 
 
 class Downloader:
+    # Files are only downloaded in segments if each segment is at least this large.
+    MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+    MIN_CHUNK_SIZE = 16 * 1024
+    MAX_CHUNK_SIZE = 1024 * 1024
+
     def __init__(
         self,
         url: str,
         dest: Path,
         session: Authenticator | Session | None = None,
         max_retries: int = 0,
+        segments: int = 1,
     ):
         self._dest = dest
         self._max_retries = max_retries
+        self._segments = segments
         self._session = session or get_default_authenticator()
         self._url = url
         self._response = self._get()
@@ -192,10 +206,40 @@ class Downloader:
                 total_size = int(self._response.headers["Content-Length"])
         return total_size
 
-    def _get(self, start: int = 0) -> Response:
+    @cached_property
+    def chunk_size(self) -> int:
+        """
+        The chunk size that is used if none is given: small files are
+        read in small chunks so that progress is reported frequently,
+        large files are read in larger chunks to reduce overhead.
+        """
+        return min(
+            max(self.total_size // 256, self.MIN_CHUNK_SIZE), self.MAX_CHUNK_SIZE
+        )
+
+    @cached_property
+    def segment_ranges(self) -> list[tuple[int, int]]:
+        """
+        The byte ranges (with inclusive ends) of the segments that are
+        downloaded concurrently. Empty if the file is downloaded at once.
+        """
+        if not self.accepts_ranges or self._response.status_code != 200:
+            return []
+
+        count = min(self._segments, self.total_size // self.MIN_SEGMENT_SIZE)
+        if count < 2:
+            return []
+
+        size = -(-self.total_size // count)
+        return [
+            (start, min(start + size, self.total_size) - 1)
+            for start in range(0, self.total_size, size)
+        ]
+
+    def _get(self, start: int = 0, end: int | None = None) -> Response:
         headers = {"Accept-Encoding": "Identity"}
-        if start > 0:
-            headers["Range"] = f"bytes={start}-"
+        if start > 0 or end is not None:
+            headers["Range"] = f"bytes={start}-{'' if end is None else end}"
 
         response = self._session.get(
             self._url, stream=True, headers=headers, timeout=REQUESTS_TIMEOUT
@@ -232,7 +276,20 @@ class Downloader:
             else:
                 break
 
-    def download_with_progress(self, chunk_size: int = 1024) -> Iterator[int]:
+    def download_with_progress(self, chunk_size: int | None = None) -> Iterator[int]:
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+
+        if self.segment_ranges:
+            self._response.close()
+            try:
+                yield from self._download_segments(chunk_size)
+                return
+            except RangeRequestIgnoredError as e:
+                # Start over and download the file at once.
+                logger.debug("Cannot download %s in segments: %s", self._url, e)
+                self._response = self._get()
+
         fetched_size = 0
         with atomic_open(self._dest) as f:
             for chunk in self._iter_content_with_resume(chunk_size=chunk_size):
@@ -241,6 +298,102 @@ class Downloader:
                     fetched_size += len(chunk)
                     yield fetched_size
 
+    def _download_segments(self, chunk_size: int) -> Iterator[int]:
+        """
+        Download the segments of the file concurrently into a preallocated file.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        ranges = self.segment_ranges
+        # The sizes of fetched chunks or None when a segment is finished.
+        progress: queue.SimpleQueue[int | None] = queue.SimpleQueue()
+        cancelled = threading.Event()
+        lock = threading.Lock()
+
+        with atomic_open(self._dest) as f:
+            f.truncate(self.total_size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(
+                        self._download_segment,
+                        f,
+                        lock,
+                        start,
+                        end,
+                        chunk_size,
+                        progress,
+                        cancelled,
+                    )
+                    for start, end in ranges
+                ]
+                try:
+                    fetched_size = 0
+                    pending = len(futures)
+                    while pending:
+                        size = progress.get()
+                        if size is None:
+                            pending -= 1
+                        else:
+                            fetched_size += size
+                            yield fetched_size
+                finally:
+                    cancelled.set()
+
+            for future in futures:
+                future.result()
+
+    def _download_segment(
+        self,
+        f: BinaryIO,
+        lock: threading.Lock,
+        start: int,
+        end: int,
+        chunk_size: int,
+        progress: queue.SimpleQueue[int | None],
+        cancelled: threading.Event,
+    ) -> None:
+        offset = start
+        retries = 0
+        try:
+            while offset <= end:
+                try:
+                    response = self._get(offset, end)
+                    with response:
+                        content_range = response.headers.get("Content-Range", "")
+                        if response.status_code != 206 or not content_range.startswith(
+                            f"bytes {offset}-"
+                        ):
+                            raise RangeRequestIgnoredError(
+                                f"Unexpected response to range request for bytes"
+                                f" {offset}-{end} ({response.status_code})"
+                            )
+
+                        for chunk in response.iter_content(chunk_size=chunk_size):
+                            if cancelled.is_set():
+                                return
+                            chunk = chunk[: end + 1 - offset]
+                            with lock:
+                                f.seek(offset)
+                                f.write(chunk)
+                            offset += len(chunk)
+                            progress.put(len(chunk))
+
+                    if offset <= end:
+                        raise ChunkedEncodingError(
+                            f"Segment ended at byte {offset}, expected {end + 1}"
+                        )
+                except (ChunkedEncodingError, ConnectionError):
+                    # Resume the segment from the last fetched byte.
+                    if retries < self._max_retries:
+                        retries += 1
+                        continue
+                    raise
+        except BaseException:
+            cancelled.set()
+            raise
+        finally:
+            progress.put(None)
+
 
 def get_package_version_display_string(
     package: Package, root: Path | None = None
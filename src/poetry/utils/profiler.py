@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from collections import Counter
+from collections import defaultdict
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from typing import Any
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class _Timing:
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.calls = 0
+
+    def asdict(self) -> dict[str, Any]:
+        return {"seconds": round(self.seconds, 6), "calls": self.calls}
+
+
+class ResolutionProfiler:
+    """
+    Collects where the time of a dependency resolution is spent.
+
+    Measurements can be nested. The time of a measurement does not include the time
+    of nested measurements so that the categories do not overlap. Measurements
+    in other threads, e.g. for prefetching metadata, are reported separately because
+    they overlap with the measurements in the thread that started profiling.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._thread_id = threading.get_ident()
+        self._start = time.perf_counter()
+        self._end: float | None = None
+
+        self._timings: dict[str, _Timing] = defaultdict(_Timing)
+        self._background_timings: dict[str, _Timing] = defaultdict(_Timing)
+        self._details: dict[str, dict[str, _Timing]] = defaultdict(
+            lambda: defaultdict(_Timing)
+        )
+        self._background_details: dict[str, dict[str, _Timing]] = defaultdict(
+            lambda: defaultdict(_Timing)
+        )
+
+        self._versions_tried: Counter[str] = Counter()
+        self._backtracks = 0
+        self._max_backtrack_depth = 0
+        self._total_backtrack_depth = 0
+
+    @contextmanager
+    def measure(self, category: str, name: str | None = None) -> Iterator[None]:
+        """
+        Adds the time spent in the context to category and,
+        if given, to name within this category.
+        """
+        stack: list[list[float]] = self._local.__dict__.setdefault("stack", [])
+        # The time spent in nested measurements.
+        nested = [0.0]
+        stack.append(nested)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+
+            own = elapsed - nested[0]
+            is_main_thread = threading.get_ident() == self._thread_id
+            if is_main_thread:
+                timings, details = self._timings, self._details
+            else:
+                timings, details = self._background_timings, self._background_details
+            with self._lock:
+                timing = timings[category]
+                timing.seconds += own
+                timing.calls += 1
+                if name is not None:
+                    detail = details[category][name]
+                    detail.seconds += own
+                    detail.calls += 1
+
+    def record_version_tried(self, name: str) -> None:
+        with self._lock:
+            self._versions_tried[name] += 1
+
+    def record_backtrack(self, depth: int) -> None:
+        with self._lock:
+            self._backtracks += 1
+            self._total_backtrack_depth += depth
+            self._max_backtrack_depth = max(self._max_backtrack_depth, depth)
+
+    def stop(self) -> None:
+        if self._end is None:
+            self._end = time.perf_counter()
+
+    def report(self, top: int = 10) -> dict[str, Any]:
+        """
+        Returns a JSON serializable report of the collected measurements.
+        """
+        end = self._end if self._end is not None else time.perf_counter()
+        total = end - self._start
+
+        with self._lock:
+            categories = self._report_timings(self._timings, self._details)
+            background = self._report_timings(
+                self._background_timings, self._background_details
+            )
+            measured = sum(timing.seconds for timing in self._timings.values())
+
+            return {
+                "total": round(total, 6),
+                "categories": categories,
+                "unaccounted": round(max(total - measured, 0), 6),
+                "background": background,
+                "backtracking": {
+                    "count": self._backtracks,
+                    "max_depth": self._max_backtrack_depth,
+                    "mean_depth": (
+                        round(self._total_backtrack_depth / self._backtracks, 2)
+                        if self._backtracks
+                        else 0
+                    ),
+                },
+                "decisions": sum(self._versions_tried.values()),
+                "versions_tried": dict(self._versions_tried.most_common(top)),
+            }
+
+    @staticmethod
+    def _report_timings(
+        timings: dict[str, _Timing], details: dict[str, dict[str, _Timing]]
+    ) -> dict[str, Any]:
+        return {
+            category: {
+                **timing.asdict(),
+                "details": {
+                    name: detail.asdict()
+                    for name, detail in sorted(
+                        details[category].items(),
+                        key=lambda item: -item[1].seconds,
+                    )
+                },
+            }
+            for category, timing in sorted(timings.items())
+        }
+
+
+_profiler: ResolutionProfiler | None = None
+
+
+def get_profiler() -> ResolutionProfiler | None:
+    return _profiler
+
+
+@contextmanager
+def profile() -> Iterator[ResolutionProfiler]:
+    """
+    Profiles everything that is done in the context.
+    """
+    global _profiler
+
+    profiler = ResolutionProfiler()
+    _profiler = profiler
+    try:
+        yield profiler
+    finally:
+        _profiler = None
+        profiler.stop()
+
+
+@contextmanager
+def measure(category: str, name: str | None = None) -> Iterator[None]:
+    """
+    Measures the time spent in the context if profiling is active.
+    """
+    profiler = _profiler
+    if profiler is None:
+        yield
+        return
+
+    with profiler.measure(category, name):
+        yield
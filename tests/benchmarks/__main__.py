@@ -0,0 +1,173 @@
+"""
+Resolution benchmarks against recorded repository snapshots.
+
+Run all benchmarks and write the results to a file:
+
+    python -m tests.benchmarks run --output results.json
+
+Compare the results of another revision with these results:
+
+    python -m tests.benchmarks run --compare results.json
+
+Compare a solver setting with its default, e.g. the activity heuristic:
+
+    python -m tests.benchmarks run --output default.json
+    python -m tests.benchmarks run --config solver.activity-heuristic=true \
+        --compare default.json
+
+Re-record the snapshots from PyPI or another index (requires network access):
+
+    python -m tests.benchmarks record
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import platform
+import sys
+
+from pathlib import Path
+from typing import Any
+
+from tests.benchmarks.runner import compare
+from tests.benchmarks.runner import configure
+from tests.benchmarks.runner import run
+from tests.benchmarks.runner import solver_config
+from tests.benchmarks.snapshot import FIXTURES
+from tests.benchmarks.snapshot import Snapshot
+
+
+def main(args: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Resolution benchmarks against recorded repository snapshots.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument(
+        "snapshots", nargs="*", help="The snapshots to run (default: all)."
+    )
+    run_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="The number of runs to take the best wall time from.",
+    )
+    run_parser.add_argument(
+        "--output", type=Path, help="Write the results as JSON to this file."
+    )
+    run_parser.add_argument(
+        "--compare",
+        type=Path,
+        help="Compare the results with the results in this file"
+        " and fail on regressions.",
+    )
+    run_parser.add_argument(
+        "--config",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="A solver setting to run the benchmarks with, e.g."
+        " solver.activity-heuristic=true (multiple values allowed).",
+    )
+    run_parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="The tolerated relative increase of wall time and peak memory.",
+    )
+
+    record_parser = subparsers.add_parser(
+        "record", help="Record the snapshots from a package index."
+    )
+    record_parser.add_argument(
+        "snapshots", nargs="*", help="The snapshots to record (default: all)."
+    )
+    record_parser.add_argument(
+        "--index-url",
+        default="https://pypi.org/simple/",
+        help="The simple repository API to record from.",
+    )
+
+    options = parser.parse_args(args)
+    names = options.snapshots or sorted(path.stem for path in FIXTURES.glob("*.json"))
+
+    if options.command == "record":
+        return record(names, options.index_url)
+
+    try:
+        configure(options.config)
+    except ValueError as e:
+        parser.error(str(e))
+
+    return benchmark(
+        names, options.repeat, options.output, options.compare, options.tolerance
+    )
+
+
+def record(names: list[str], index_url: str) -> int:
+    logging.basicConfig(format="%(message)s", level=logging.WARNING)
+
+    from poetry.repositories.legacy_repository import LegacyRepository
+
+    repository = LegacyRepository("snapshot", index_url, disable_cache=True)
+    for name in names:
+        snapshot = Snapshot.load(name)
+        snapshot.record(repository)
+        snapshot.dump()
+        _write(f"{name}: recorded {len(snapshot.packages)} releases")
+
+    return 0
+
+
+def benchmark(
+    names: list[str],
+    repeat: int,
+    output: Path | None,
+    baseline: Path | None,
+    tolerance: float,
+) -> int:
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "config": solver_config(),
+        "snapshots": {},
+    }
+    for name in names:
+        result = run(Snapshot.load(name), repeat=repeat)
+        results["snapshots"][name] = result
+        _write(
+            f"{name}: {result['wall_time']:.3f}s,"
+            f" {result['peak_memory'] / 2**20:.1f} MiB,"
+            f" {result['decisions']} decisions,"
+            f" {result['backtracks']} backtracks,"
+            f" {result['version_lookups']} version lookups,"
+            f" {result['metadata_lookups']} metadata lookups,"
+            f" {len(result['packages'])} packages"
+            + ("" if result["solved"] else " (not solved)")
+        )
+
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if baseline is not None:
+        baseline_results = json.loads(baseline.read_text(encoding="utf-8"))
+        if baseline_results["config"] != results["config"]:
+            _write("The solver configuration differs from the baseline.")
+        regressions = compare(baseline_results, results, tolerance)
+        for regression in regressions:
+            _write(f"Regression: {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+def _write(line: str) -> None:
+    sys.stdout.write(f"{line}\n")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
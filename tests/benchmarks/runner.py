@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import gc
+import time
+import tracemalloc
+
+from typing import TYPE_CHECKING
+from typing import Any
+
+from cleo.io.null_io import NullIO
+
+from poetry.config.config import Config
+from poetry.mixology.failure import SolveFailureError
+from poetry.puzzle.exceptions import SolverProblemError
+from poetry.puzzle.solver import Solver
+from poetry.repositories.repository_pool import RepositoryPool
+from poetry.utils.profiler import profile
+
+
+if TYPE_CHECKING:
+    from tests.benchmarks.snapshot import Snapshot
+
+
+# The measurements that must not change between two runs of the same revision.
+COUNTS = ("decisions", "backtracks", "version_lookups", "metadata_lookups")
+# The measurements that are compared with a tolerance.
+MEASUREMENTS = ("wall_time", "peak_memory")
+
+
+def solve(snapshot: Snapshot) -> dict[str, Any]:
+    """
+    Resolves the dependencies of the project of a snapshot once.
+    """
+    repository = snapshot.repository()
+    pool = RepositoryPool([repository])
+    solver = Solver(snapshot.project(), pool, [], [], NullIO())
+
+    start = time.perf_counter()
+    try:
+        transaction = solver.solve()
+    except (SolveFailureError, SolverProblemError):
+        packages = None
+    else:
+        packages = sorted(
+            f"{op.package.name}=={op.package.version}"
+            for op in transaction.calculate_operations()
+        )
+
+    return {
+        "wall_time": time.perf_counter() - start,
+        "packages": packages,
+        "version_lookups": repository.version_lookups,
+        "metadata_lookups": repository.metadata_lookups,
+    }
+
+
+def run(snapshot: Snapshot, repeat: int = 3) -> dict[str, Any]:
+    """
+    Resolves the dependencies of the project of a snapshot and returns
+    the measurements.
+
+    The wall time is the best of repeat runs without profiling.
+    The peak memory and the counts are measured in an additional run because
+    tracing memory allocations and profiling slow down resolution considerably.
+    """
+    wall_times = []
+    for _ in range(repeat):
+        gc.collect()
+        wall_times.append(solve(snapshot)["wall_time"])
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with profile() as profiler:
+            result = solve(snapshot)
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    report = profiler.report()
+    packages = result["packages"]
+
+    return {
+        "solved": packages is not None,
+        "packages": packages or [],
+        "wall_time": round(min(wall_times, default=result["wall_time"]), 6),
+        "peak_memory": peak_memory,
+        "decisions": report["decisions"],
+        "backtracks": report["backtracking"]["count"],
+        "version_lookups": result["version_lookups"],
+        "metadata_lookups": result["metadata_lookups"],
+    }
+
+
+def configure(settings: list[str]) -> None:
+    """
+    Applies solver settings given as "solver.<name>=<value>" so that
+    different configurations can be compared, e.g. solver heuristics.
+    """
+    config = Config.create()
+    for setting in settings:
+        key, sep, value = setting.partition("=")
+        section, _, name = key.partition(".")
+        if not sep or section != "solver" or name not in Config.default_config[section]:
+            raise ValueError(f"Invalid solver setting: {setting}")
+
+        config.merge({section: {name: Config._get_normalizer(key)(value)}})
+
+
+def solver_config() -> dict[str, Any]:
+    """
+    Returns the configuration that influences resolution
+    so that only results with the same configuration are compared.
+    """
+    config = Config.create()
+    return {
+        name: config.get(f"solver.{name}") for name in Config.default_config["solver"]
+    }
+
+
+def compare(
+    baseline: dict[str, Any], results: dict[str, Any], tolerance: float = 0.1
+) -> list[str]:
+    """
+    Returns the regressions of results compared to baseline.
+
+    Counts must not increase at all, wall time and peak memory
+    must not increase by more than the tolerance.
+    """
+    regressions = []
+    for name, result in results["snapshots"].items():
+        base = baseline["snapshots"].get(name)
+        if base is None:
+            continue
+
+        if base["solved"] and not result["solved"]:
+            regressions.append(f"{name}: no longer solved")
+            continue
+        if base["packages"] != result["packages"]:
+            regressions.append(f"{name}: resolved packages changed")
+
+        for key in COUNTS:
+            if result[key] > base[key]:
+                regressions.append(f"{name}: {key} {base[key]} -> {result[key]}")
+        for key in MEASUREMENTS:
+            if result[key] > base[key] * (1 + tolerance):
+                change = (result[key] / base[key] - 1) * 100 if base[key] else 100.0
+                regressions.append(
+                    f"{name}: {key} {base[key]} -> {result[key]} (+{change:.1f}%)"
+                )
+
+    return regressions
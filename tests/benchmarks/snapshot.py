@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import json
+import logging
+
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+import requests
+
+from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+from poetry.core.packages.project_package import ProjectPackage
+
+from poetry.console.exceptions import PoetryRuntimeError
+from poetry.factory import Factory
+from poetry.inspection.info import PackageInfo
+from poetry.repositories.exceptions import PackageNotFoundError
+from poetry.repositories.exceptions import RepositoryError
+from poetry.repositories.repository import Repository
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+
+    from packaging.utils import NormalizedName
+    from poetry.core.constraints.version import VersionConstraint
+
+    from poetry.repositories.cached_repository import CachedRepository
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+logger = logging.getLogger(__name__)
+
+
+class SnapshotRepository(Repository):
+    """
+    A repository that serves recorded metadata without any network access.
+
+    Like a remote repository, it only returns the versions of a package
+    when searching for packages and the dependencies of a release
+    when its metadata is requested. Both are counted as metadata lookups.
+    """
+
+    def __init__(self, infos: Iterable[PackageInfo]) -> None:
+        super().__init__("snapshot")
+
+        self._infos: dict[NormalizedName, dict[Version, PackageInfo]] = defaultdict(
+            dict
+        )
+        for info in infos:
+            assert info.name is not None
+            assert info.version is not None
+            self._infos[canonicalize_name(info.name)][Version.parse(info.version)] = (
+                info
+            )
+
+        self.version_lookups = 0
+        self.metadata_lookups = 0
+
+    def _find_packages(
+        self, name: NormalizedName, constraint: VersionConstraint
+    ) -> list[Package]:
+        self.version_lookups += 1
+
+        return [
+            Package(name, version, yanked=info.yanked)
+            for version, info in self._infos.get(name, {}).items()
+            if constraint.allows(version)
+        ]
+
+    def package(self, name: str, version: Version) -> Package:
+        self.metadata_lookups += 1
+
+        try:
+            info = self._infos[canonicalize_name(name)][version]
+        except KeyError:
+            raise PackageNotFoundError(
+                f"Package {name} ({version}) not found."
+            ) from None
+
+        return info.to_package(name=name)
+
+    def __len__(self) -> int:
+        return sum(len(infos) for infos in self._infos.values())
+
+
+@dataclass
+class Snapshot:
+    """
+    A project and the recorded metadata of the packages it may depend on.
+    """
+
+    name: str
+    python: str
+    dependencies: dict[str, Any]
+    # The number of the latest releases of each package that are recorded.
+    releases: int = 20
+    packages: list[dict[str, Any]] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, name: str) -> Snapshot:
+        with (FIXTURES / f"{name}.json").open(encoding="utf-8") as f:
+            return cls(name=name, **json.load(f))
+
+    def dump(self) -> None:
+        data = {
+            "python": self.python,
+            "dependencies": self.dependencies,
+            "releases": self.releases,
+            "packages": self.packages,
+        }
+        with (FIXTURES / f"{self.name}.json").open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    def project(self) -> ProjectPackage:
+        project = ProjectPackage(f"{self.name}-benchmark", "1.0.0")
+        project.python_versions = self.python
+        for name, constraint in self.dependencies.items():
+            project.add_dependency(Factory.create_dependency(name, constraint))
+
+        return project
+
+    def repository(self) -> SnapshotRepository:
+        return SnapshotRepository(PackageInfo.load(dict(p)) for p in self.packages)
+
+    def record(self, repository: CachedRepository, workers: int = 16) -> None:
+        """
+        Records the metadata of the latest releases of all packages that the project
+        may depend on, and of all releases that are pinned by these packages.
+        """
+        infos: dict[tuple[NormalizedName, Version], PackageInfo] = {}
+        extras: dict[NormalizedName, set[NormalizedName]] = defaultdict(set)
+        pinned: dict[NormalizedName, set[Version]] = defaultdict(set)
+        pending = list(self.project().all_requires)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            while pending:
+                names = set()
+                for dependency in pending:
+                    name = dependency.name
+                    if name not in extras or not extras[name].issuperset(
+                        dependency.extras
+                    ):
+                        names.add(name)
+                        extras[name].update(dependency.extras)
+                    version = dependency.constraint
+                    if isinstance(version, Version) and version not in pinned[name]:
+                        pinned[name].add(version)
+                        names.add(name)
+                pending = []
+
+                releases = []
+                for name in sorted(names):
+                    versions = self._select_versions(repository, name)
+                    versions.update(pinned[name])
+                    releases += [
+                        (name, version)
+                        for version in sorted(versions)
+                        if (name, version) not in infos
+                    ]
+                for release, info in zip(
+                    releases, executor.map(self._get_release_info(repository), releases)
+                ):
+                    if info is not None:
+                        infos[release] = info
+
+                for (name, _), info in infos.items():
+                    if name in names:
+                        pending += self._requirements(info, extras[name])
+
+        self.packages = [
+            {
+                "name": info.name,
+                "version": info.version,
+                "requires_dist": info.requires_dist,
+                "requires_python": info.requires_python,
+                "yanked": info.yanked,
+            }
+            for _, info in sorted(infos.items(), key=lambda item: item[0])
+        ]
+
+    @staticmethod
+    def _get_release_info(
+        repository: CachedRepository,
+    ) -> Callable[[tuple[NormalizedName, Version]], PackageInfo | None]:
+        def get_release_info(
+            release: tuple[NormalizedName, Version],
+        ) -> PackageInfo | None:
+            try:
+                return repository.get_release_info(*release)
+            except (
+                PackageNotFoundError,
+                RepositoryError,
+                PoetryRuntimeError,
+                requests.RequestException,
+                OSError,
+                ValueError,
+            ) as e:
+                # Releases without usable metadata are not recorded.
+                # PackageInfoError for unbuildable sdists is a ValueError.
+                name, version = release
+                logger.warning("Skipping %s (%s): %s", name, version, e)
+                return None
+
+        return get_release_info
+
+    def _select_versions(
+        self, repository: CachedRepository, name: NormalizedName
+    ) -> set[Version]:
+        packages = repository.find_packages(Dependency(name, "*"))
+        versions = sorted(
+            {package.version for package in packages if not package.yanked},
+            reverse=True,
+        )
+        return set(versions[: self.releases])
+
+    @staticmethod
+    def _requirements(
+        info: PackageInfo, extras: set[NormalizedName]
+    ) -> list[Dependency]:
+        requirements = []
+        for requirement in info.requires_dist or []:
+            try:
+                dependency = Dependency.create_from_pep_508(requirement)
+            except ValueError:
+                continue
+            if not dependency.in_extras or set(dependency.in_extras) & extras:
+                requirements.append(dependency)
+
+        return requirements
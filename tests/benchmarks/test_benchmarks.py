@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from poetry.core.constraints.version import Version
+
+from poetry.repositories.exceptions import PackageNotFoundError
+from tests.benchmarks.runner import compare
+from tests.benchmarks.runner import configure
+from tests.benchmarks.runner import run
+from tests.benchmarks.runner import solve
+from tests.benchmarks.runner import solver_config
+from tests.benchmarks.snapshot import FIXTURES
+from tests.benchmarks.snapshot import Snapshot
+
+
+SNAPSHOTS = sorted(path.stem for path in FIXTURES.glob("*.json"))
+
+
+@pytest.mark.parametrize("name", SNAPSHOTS)
+def test_snapshot_can_be_solved(name: str) -> None:
+    result = solve(Snapshot.load(name))
+
+    assert result["packages"]
+    assert result["metadata_lookups"] >= len(result["packages"])
+
+
+def test_run_measures_resolution() -> None:
+    result = run(Snapshot.load("django"), repeat=1)
+
+    assert result["solved"]
+    assert result["wall_time"] > 0
+    assert result["peak_memory"] > 0
+    assert result["decisions"] >= len(result["packages"])
+    assert result["backtracks"] >= 0
+
+
+def test_snapshot_repository_only_serves_recorded_releases() -> None:
+    snapshot = Snapshot(
+        name="test",
+        python="^3.9",
+        dependencies={"foo": "*"},
+        packages=[
+            {
+                "name": "foo",
+                "version": "1.0",
+                "requires_dist": ["bar>=1"],
+                "requires_python": ">=3.9",
+                "yanked": False,
+            }
+        ],
+    )
+    repository = snapshot.repository()
+
+    package = repository.package("foo", Version.parse("1.0"))
+    assert [str(dep) for dep in package.requires] == ["bar (>=1)"]
+    assert package.python_versions == ">=3.9"
+
+    with pytest.raises(PackageNotFoundError):
+        repository.package("foo", Version.parse("2.0"))
+
+    assert repository.metadata_lookups == 2
+
+
+def _results(**measurements: Any) -> dict[str, Any]:
+    result = {
+        "solved": True,
+        "packages": ["foo==1.0"],
+        "wall_time": 1.0,
+        "peak_memory": 1000,
+        "decisions": 10,
+        "backtracks": 2,
+        "version_lookups": 5,
+        "metadata_lookups": 5,
+    }
+    result.update(measurements)
+    return {"snapshots": {"test": result}}
+
+
+@pytest.mark.parametrize(
+    ("measurements", "expected"),
+    [
+        ({}, []),
+        ({"wall_time": 1.05, "peak_memory": 900, "backtracks": 1}, []),
+        ({"wall_time": 1.5}, ["test: wall_time 1.0 -> 1.5 (+50.0%)"]),
+        ({"backtracks": 3}, ["test: backtracks 2 -> 3"]),
+        ({"packages": ["foo==2.0"]}, ["test: resolved packages changed"]),
+        ({"solved": False, "packages": []}, ["test: no longer solved"]),
+    ],
+)
+def test_compare(measurements: dict[str, Any], expected: list[str]) -> None:
+    assert compare(_results(), _results(**measurements)) == expected
+
+
+def test_configure_solver_settings() -> None:
+    assert solver_config()["activity-heuristic"] is False
+
+    configure(["solver.activity-heuristic=true"])
+
+    assert solver_config()["activity-heuristic"] is True
+
+
+@pytest.mark.parametrize(
+    "setting",
+    ["solver.activity-heuristic", "solver.unknown=true", "installer.parallel=false"],
+)
+def test_configure_rejects_invalid_settings(setting: str) -> None:
+    with pytest.raises(ValueError, match="Invalid solver setting"):
+        configure([setting])
@@ -15,6 +15,8 @@ from deepdiff.diff import DeepDiff
 from poetry.config.config import Config
 from poetry.config.config import boolean_normalizer
 from poetry.config.config import int_normalizer
+from poetry.config.config import size_normalizer
+from poetry.config.config import size_validator
 from poetry.utils.password_manager import PasswordManager
 from tests.helpers import flatten_dict
 from tests.helpers import isolated_environment
@@ -122,6 +124,46 @@ def test_config_expands_tilde_for_virtualenvs_path(
     assert config.virtualenvs_path == expected
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("1024", 1024),
+        ("100b", 100),
+        ("2K", 2048),
+        ("500M", 500 * 2**20),
+        ("500MB", 500 * 2**20),
+        ("10GiB", 10 * 2**30),
+        ("1.5g", 3 * 2**29),
+        ("1T", 2**40),
+    ],
+)
+def test_size_normalizer(value: str, expected: int) -> None:
+    assert size_validator(value)
+    assert size_normalizer(value) == expected
+
+
+@pytest.mark.parametrize("value", ["", "G", "-1", "10X", "1,5G"])
+def test_size_validator_invalid(value: str) -> None:
+    assert not size_validator(value)
+
+
+@pytest.mark.parametrize(
+    ("max_size", "expected"), [(None, None), (1024, 1024), ("1K", 1024)]
+)
+def test_config_cache_max_size(
+    config: Config, max_size: int | str | None, expected: int | None
+) -> None:
+    config.merge({"cache": {"max-size": max_size}})
+    assert config.cache_max_size == expected
+
+
+def test_config_cache_max_size_from_environment_variable(
+    config: Config, environ: Iterator[None]
+) -> None:
+    os.environ["POETRY_CACHE_MAX_SIZE"] = "2M"
+    assert config.cache_max_size == 2 * 2**20
+
+
 def test_disabled_keyring_is_unavailable(
     config: Config, with_simple_keyring: None, dummy_keyring: DummyBackend
 ) -> None:
@@ -8,12 +8,14 @@ import pytest
 from cleo.testers.application_tester import ApplicationTester
 
 from poetry.console.application import Application
+from poetry.utils.cache import SQLiteCache
 
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from poetry.utils.cache import FileCache
+    from tests.conftest import Config
 
 T = TypeVar("T")
 
@@ -87,3 +89,24 @@ def test_cache_clear_pkg_no(
     assert tester.io.fetch_output() == ""
     assert cache.has("cachy:0.1")
     assert cache.has("cleo:0.2")
+
+
+def test_cache_clear_pkg_sqlite(
+    tester: ApplicationTester,
+    repository_one: str,
+    repository_cache_dir: Path,
+    config: Config,
+) -> None:
+    config.merge({"cache": {"backend": "sqlite"}})
+    cache: SQLiteCache[dict[str, str]] = SQLiteCache(
+        repository_cache_dir / repository_one
+    )
+    cache.put("cachy:0.1", {"name": "cachy", "version": "0.1"})
+    cache.put("cleo:0.2", {"name": "cleo", "version": "0.2"})
+
+    exit_code = tester.execute(f"cache clear {repository_one}:cachy:0.1", inputs="yes")
+
+    assert exit_code == 0
+    assert tester.io.fetch_output() == ""
+    assert not cache.has("cachy:0.1")
+    assert cache.has("cleo:0.2")
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import os
+import time
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from cleo.io.outputs.output import Verbosity
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from cleo.testers.command_tester import CommandTester
+
+    from poetry.utils.cache import FileCache
+    from tests.conftest import Config
+    from tests.types import CommandTesterFactory
+
+
+@pytest.fixture
+def tester(command_tester_factory: CommandTesterFactory) -> CommandTester:
+    return command_tester_factory("cache prune")
+
+
+@pytest.fixture
+def old_cache(cache: FileCache[dict[str, str]]) -> FileCache[dict[str, str]]:
+    # cachy has been used less recently than cleo.
+    for hours, key in [(24, "cachy:0.1"), (12, "cleo:0.2")]:
+        accessed = time.time() - hours * 60 * 60
+        os.utime(cache._path(key), (accessed, accessed))
+    return cache
+
+
+def test_cache_prune_without_budget(tester: CommandTester) -> None:
+    assert tester.execute() == 1
+    assert "No size budget has been configured" in tester.io.fetch_error()
+
+
+def test_cache_prune_invalid_max_size(tester: CommandTester) -> None:
+    assert tester.execute("--max-size 10X") == 1
+    assert tester.io.fetch_error() == "Invalid size: 10X\n"
+
+
+def test_cache_prune(
+    tester: CommandTester, config: Config, old_cache: FileCache[dict[str, str]]
+) -> None:
+    config.merge({"cache": {"max-size": "50"}})
+
+    assert tester.execute(verbosity=Verbosity.VERBOSE) == 0
+
+    assert tester.io.fetch_output().splitlines() == [
+        f"Removed {old_cache._path('cachy:0.1')}",
+        "Removed 1 entries (45 B), the caches use 44 B of 50 B.",
+    ]
+    assert not old_cache.has("cachy:0.1")
+    assert old_cache.has("cleo:0.2")
+
+
+def test_cache_prune_max_size_option(
+    tester: CommandTester, config: Config, old_cache: FileCache[dict[str, str]]
+) -> None:
+    config.merge({"cache": {"max-size": "1G"}})
+
+    assert tester.execute("--max-size 0") == 0
+
+    assert tester.io.fetch_output() == (
+        "Removed 2 entries (89 B), the caches use 0 B of 0 B.\n"
+    )
+    assert not old_cache.has("cachy:0.1")
+    assert not old_cache.has("cleo:0.2")
+
+
+def test_cache_prune_dry_run(
+    tester: CommandTester,
+    old_cache: FileCache[dict[str, str]],
+    repository_cache_dir: Path,
+) -> None:
+    assert tester.execute("--max-size 1K --dry-run") == 0
+    assert tester.io.fetch_output() == (
+        "Would remove 0 entries (0 B), the caches would use 89 B of 1.0 KiB.\n"
+    )
+
+    assert tester.execute("--max-size 0 --dry-run") == 0
+    assert tester.io.fetch_output() == (
+        "Would remove 2 entries (89 B), the caches would use 89 B of 0 B.\n"
+    )
+    assert old_cache.has("cachy:0.1")
+    assert old_cache.has("cleo:0.2")
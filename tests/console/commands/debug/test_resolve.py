@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from typing import TYPE_CHECKING
 
 import pytest
@@ -9,6 +11,8 @@ from tests.helpers import get_package
 
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from cleo.testers.command_tester import CommandTester
 
     from tests.helpers import TestRepository
@@ -78,3 +82,41 @@ demo     0.1.2
 """
 
     assert tester.io.fetch_output() == expected
+
+
+def test_debug_resolve_profile_option_shows_profile(tester: CommandTester) -> None:
+    tester.execute("cachy --profile")
+
+    output = tester.io.fetch_output()
+    assert "Resolution results:" in output
+    assert "Profile (" in output
+    assert "propagation" in output
+    assert "decision making" in output
+    assert "marker aggregation" in output
+    assert "Backtracked 0 times (maximum depth: 0, mean depth: 0)." in output
+    assert "Most versions tried:\n  cachy: 1\n  msgpack-python: 1\n" in output
+
+
+def test_debug_resolve_profile_output_option_writes_json_report(
+    tester: CommandTester, tmp_path: Path
+) -> None:
+    report_path = tmp_path / "profile.json"
+    tester.execute(f"cachy --profile-output {report_path}")
+
+    assert "Profile (" not in tester.io.fetch_output()
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert set(report) == {
+        "total",
+        "categories",
+        "unaccounted",
+        "background",
+        "backtracking",
+        "decisions",
+        "versions_tried",
+    }
+    assert {"propagation", "decision making", "marker aggregation"} <= set(
+        report["categories"]
+    )
+    assert report["decisions"] == 2
+    assert report["versions_tried"] == {"cachy": 1, "msgpack-python": 1}
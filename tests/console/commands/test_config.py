@@ -56,8 +56,12 @@ def test_list_displays_default_value_if_not_set(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.backend = "file"
+cache.max-size = null
+cache-dir = {cache_dir}
 data-dir = {data_dir}
+installer.download-segments = 4
+installer.link-from-cache = false
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -66,7 +70,12 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.activity-heuristic = false
+solver.incremental = false
 solver.lazy-wheel = true
+solver.max-workers = null
+solver.parallel-sources = false
+solver.resolution-cache = false
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -91,8 +100,12 @@ def test_list_displays_set_get_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.backend = "file"
+cache.max-size = null
+cache-dir = {cache_dir}
 data-dir = {data_dir}
+installer.download-segments = 4
+installer.link-from-cache = false
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -101,7 +114,12 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.activity-heuristic = false
+solver.incremental = false
 solver.lazy-wheel = true
+solver.max-workers = null
+solver.parallel-sources = false
+solver.resolution-cache = false
 system-git-client = false
 virtualenvs.create = false
 virtualenvs.in-project = null
@@ -147,8 +165,12 @@ def test_unset_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.backend = "file"
+cache.max-size = null
+cache-dir = {cache_dir}
 data-dir = {data_dir}
+installer.download-segments = 4
+installer.link-from-cache = false
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -157,7 +179,12 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.activity-heuristic = false
+solver.incremental = false
 solver.lazy-wheel = true
+solver.max-workers = null
+solver.parallel-sources = false
+solver.resolution-cache = false
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -181,8 +208,12 @@ def test_unset_repo_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.backend = "file"
+cache.max-size = null
+cache-dir = {cache_dir}
 data-dir = {data_dir}
+installer.download-segments = 4
+installer.link-from-cache = false
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -191,7 +222,12 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.activity-heuristic = false
+solver.incremental = false
 solver.lazy-wheel = true
+solver.max-workers = null
+solver.parallel-sources = false
+solver.resolution-cache = false
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -316,8 +352,12 @@ def test_list_displays_set_get_local_setting(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.backend = "file"
+cache.max-size = null
+cache-dir = {cache_dir}
 data-dir = {data_dir}
+installer.download-segments = 4
+installer.link-from-cache = false
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -326,7 +366,12 @@ installer.re-resolve = true
 keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 requests.max-retries = 0
+solver.activity-heuristic = false
+solver.incremental = false
 solver.lazy-wheel = true
+solver.max-workers = null
+solver.parallel-sources = false
+solver.resolution-cache = false
 system-git-client = false
 virtualenvs.create = false
 virtualenvs.in-project = null
@@ -359,8 +404,12 @@ def test_list_must_not_display_sources_from_pyproject_toml(
     cache_dir = json.dumps(str(config_cache_dir))
     data_dir = json.dumps(str(config_data_dir))
     venv_path = json.dumps(os.path.join("{cache-dir}", "virtualenvs"))
-    expected = f"""cache-dir = {cache_dir}
+    expected = f"""cache.backend = "file"
+cache.max-size = null
+cache-dir = {cache_dir}
 data-dir = {data_dir}
+installer.download-segments = 4
+installer.link-from-cache = false
 installer.max-workers = null
 installer.no-binary = null
 installer.only-binary = null
@@ -370,7 +419,12 @@ keyring.enabled = true
 python.installation-dir = {json.dumps(str(Path("{data-dir}/python")))}  # {config_data_dir / "python"}
 repositories.foo.url = "https://foo.bar/simple/"
 requests.max-retries = 0
+solver.activity-heuristic = false
+solver.incremental = false
 solver.lazy-wheel = true
+solver.max-workers = null
+solver.parallel-sources = false
+solver.resolution-cache = false
 system-git-client = false
 virtualenvs.create = true
 virtualenvs.in-project = null
@@ -517,6 +571,28 @@ def test_unset_cert(
     assert "cert" not in auth_config_source.config["certificates"]["foo"]
 
 
+def test_config_cache_backend(
+    tester: CommandTester, config_source: DictConfigSource
+) -> None:
+    tester.execute("cache.backend sqlite")
+
+    assert config_source.config["cache"]["backend"] == "sqlite"
+
+    with pytest.raises(RuntimeError, match='"unknown" is an invalid value'):
+        tester.execute("cache.backend unknown")
+
+
+def test_config_cache_max_size(
+    tester: CommandTester, config_source: DictConfigSource
+) -> None:
+    tester.execute("cache.max-size 10G")
+
+    assert config_source.config["cache"]["max-size"] == 10 * 2**30
+
+    with pytest.raises(RuntimeError, match='"10X" is an invalid value'):
+        tester.execute("cache.max-size 10X")
+
+
 def test_config_installer_parallel(
     tester: CommandTester, command_tester_factory: CommandTesterFactory
 ) -> None:
@@ -17,7 +17,9 @@ from requests import codes
 from poetry.inspection.lazy_wheel import HTTPRangeRequestNotRespectedError
 from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupportedError
 from poetry.inspection.lazy_wheel import InvalidWheelError
+from poetry.inspection.lazy_wheel import LazyWheelOverHTTP
 from poetry.inspection.lazy_wheel import LazyWheelUnsupportedError
+from poetry.inspection.lazy_wheel import RangeCache
 from poetry.inspection.lazy_wheel import metadata_from_wheel_url
 from tests.helpers import http_setup_redirect
 
@@ -41,6 +43,8 @@ if TYPE_CHECKING:
             accept_ranges: str | None = "bytes",
             negative_offset_error: tuple[int, bytes] | None = None,
             ignore_accept_ranges: bool = False,
+            multiple_ranges: bool = True,
+            etag: str | None = None,
         ) -> HTTPrettyRequestCallback: ...
 
     class AssertMetadataFromWheelUrl(Protocol):
@@ -102,6 +106,21 @@ def build_partial_response(
                 return 200, response_headers, wheel_bytes
             end = total_length - 1
             body = wheel_bytes[offset:]
+    elif "," in rng:
+        # multiple ranges
+        boundary = "3d6b6a416f9b5"
+        body = b""
+        for part in rng.split(","):
+            start, end = map(int, part.split("-"))
+            body += (
+                f"--{boundary}\r\n"
+                "Content-Type: application/octet-stream\r\n"
+                f"Content-Range: bytes {start}-{end}/{total_length}\r\n\r\n"
+            ).encode()
+            body += wheel_bytes[start : end + 1] + b"\r\n"
+        body += f"--{boundary}--\r\n".encode()
+        response_headers["Content-Type"] = f"multipart/byteranges; boundary={boundary}"
+        return status_code, response_headers, body
     else:
         # range with start and end
         start, end = map(int, rng.split("-"))
@@ -120,6 +139,8 @@ def handle_request_factory(
         accept_ranges: str | None = "bytes",
         negative_offset_error: tuple[int, bytes] | None = None,
         ignore_accept_ranges: bool = False,
+        multiple_ranges: bool = True,
+        etag: str | None = None,
     ) -> HTTPrettyRequestCallback:
         def handle_request(
             request: HTTPrettyRequest, uri: str, response_headers: dict[str, Any]
@@ -136,6 +157,8 @@ def handle_request_factory(
             wheel_bytes = wheel.read_bytes()
 
             del response_headers["status"]
+            if etag is not None:
+                response_headers["ETag"] = etag
 
             if request.method == "HEAD":
                 return build_head_response(
@@ -143,6 +166,13 @@ def handle_request_factory(
                 )
 
             rng = request.headers.get("Range", "=").split("=")[1]
+            if not multiple_ranges:
+                # only respond with the first range
+                rng = rng.split(",")[0]
+            if_range = request.headers.get("If-Range")
+            if if_range is not None and if_range != etag:
+                # the file has changed
+                return 200, response_headers, wheel_bytes
 
             negative_offset_failure = None
             if negative_offset_error and rng.startswith("-"):
@@ -475,3 +505,138 @@ def test_metadata_from_wheel_url_handles_unexpected_errors(
             "https://runtime-error.com/demo_missing_dist_info-0.1.0-py2.py3-none-any.whl",
             requests.Session(),
         )
+
+
+@pytest.mark.parametrize("multiple_ranges", [True, False])
+def test_lazy_wheel_requests_multiple_ranges_at_once(
+    http: type[httpretty.httpretty],
+    handle_request_factory: RequestCallbackFactory,
+    package_distribution_lookup: PackageDistributionLookup,
+    multiple_ranges: bool,
+) -> None:
+    domain = f"multiple-ranges-{str(multiple_ranges).lower()}.com"
+    uri_regex = re.compile(f"^https://{domain}/.*$")
+    request_callback = handle_request_factory(multiple_ranges=multiple_ranges)
+    http.register_uri(http.GET, uri_regex, body=request_callback)
+    http.register_uri(http.HEAD, uri_regex, body=request_callback)
+    wheel = package_distribution_lookup("poetry_core-1.5.0-py3-none-any.whl")
+    assert wheel is not None
+    wheel_bytes = wheel.read_bytes()
+
+    url = f"https://{domain}/poetry_core-1.5.0-py3-none-any.whl"
+    with LazyWheelOverHTTP(url, requests.Session()) as lazy_file:
+        lazy_file.seek(200)
+        assert lazy_file.read(100) == wheel_bytes[200:300]
+        latest_requests = http.latest_requests()
+        latest_requests.clear()
+
+        lazy_file.seek(0)
+        assert lazy_file.read(1000) == wheel_bytes[:1000]
+
+    ranges = [request.headers["Range"] for request in latest_requests]
+    if multiple_ranges:
+        assert ranges == ["bytes=0-199,300-999"]
+    else:
+        assert ranges == ["bytes=0-199,300-999", "bytes=300-999"]
+        assert domain in LazyWheelOverHTTP._domains_without_multiple_ranges
+
+
+def test_metadata_from_wheel_url_uses_cached_ranges(
+    http: type[httpretty.httpretty],
+    handle_request_factory: RequestCallbackFactory,
+    tmp_path: Path,
+) -> None:
+    domain = "cached-ranges.com"
+    uri_regex = re.compile(f"^https://{domain}/.*$")
+    request_callback = handle_request_factory(etag='"v1"')
+    http.register_uri(http.GET, uri_regex, body=request_callback)
+    http.register_uri(http.HEAD, uri_regex, body=request_callback)
+    cache = RangeCache(tmp_path)
+
+    url = f"https://{domain}/poetry_core-1.5.0-py3-none-any.whl"
+    metadata = metadata_from_wheel_url("poetry-core", url, requests.Session(), cache)
+
+    latest_requests = http.latest_requests()
+    assert len(latest_requests) == 3
+    cached = cache.get(url)
+    assert cached is not None
+    assert cached.etag == '"v1"'
+
+    latest_requests.clear()
+    assert (
+        metadata_from_wheel_url("poetry-core", url, requests.Session(), cache)
+        == metadata
+    )
+    assert len(latest_requests) == 0
+
+
+@pytest.mark.parametrize("etag", [None, 'W/"v1"'])
+def test_metadata_from_wheel_url_does_not_cache_without_strong_etag(
+    http: type[httpretty.httpretty],
+    handle_request_factory: RequestCallbackFactory,
+    tmp_path: Path,
+    etag: str | None,
+) -> None:
+    domain = f"uncached-ranges-{str(etag is None).lower()}.com"
+    uri_regex = re.compile(f"^https://{domain}/.*$")
+    request_callback = handle_request_factory(etag=etag)
+    http.register_uri(http.GET, uri_regex, body=request_callback)
+    http.register_uri(http.HEAD, uri_regex, body=request_callback)
+    cache = RangeCache(tmp_path)
+
+    url = f"https://{domain}/poetry_core-1.5.0-py3-none-any.whl"
+    metadata_from_wheel_url("poetry-core", url, requests.Session(), cache)
+
+    assert cache.get(url) is None
+
+
+def test_metadata_from_wheel_url_discards_outdated_cached_ranges(
+    http: type[httpretty.httpretty],
+    handle_request_factory: RequestCallbackFactory,
+    tmp_path: Path,
+) -> None:
+    domain = "outdated-ranges.com"
+    uri_regex = re.compile(f"^https://{domain}/.*$")
+    request_callback = handle_request_factory(etag='"v2"')
+    http.register_uri(http.GET, uri_regex, body=request_callback)
+    http.register_uri(http.HEAD, uri_regex, body=request_callback)
+    cache = RangeCache(tmp_path)
+    url = f"https://{domain}/poetry_core-1.5.0-py3-none-any.whl"
+    metadata = metadata_from_wheel_url("poetry-core", url, requests.Session(), cache)
+    cached = cache.get(url)
+    assert cached is not None
+    # Pretend that only the end of the file of an older version has been cached.
+    cache.put(url, '"v1"', cached.length, cached.ranges[-1:])
+
+    latest_requests = http.latest_requests()
+    latest_requests.clear()
+    assert (
+        metadata_from_wheel_url("poetry-core", url, requests.Session(), cache)
+        == metadata
+    )
+
+    assert latest_requests[0].headers["If-Range"] == '"v1"'
+    assert "If-Range" not in latest_requests[1].headers
+    cached = cache.get(url)
+    assert cached is not None
+    assert cached.etag == '"v2"'
+
+
+def test_range_cache_ignores_incomplete_entries(tmp_path: Path) -> None:
+    cache = RangeCache(tmp_path)
+    url = "https://example.org/demo-0.1.0-py3-none-any.whl"
+    cache.put(url, '"v1"', 100, [(0, b"abc"), (90, b"0123456789")])
+
+    cached = cache.get(url)
+    assert cached is not None
+    assert cached.ranges == [(0, b"abc"), (90, b"0123456789")]
+
+    info_path, data_path = cache._paths(url)
+    # Only the fetched bytes are stored, independent of the length of the file.
+    assert data_path.read_bytes() == b"abc0123456789"
+    data_path.write_bytes(b"abc")
+    assert cache.get(url) is None
+
+    cache.remove(url)
+    assert not info_path.exists()
+    assert cache.get(url) is None
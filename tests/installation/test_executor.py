@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import csv
+import importlib.util
 import json
 import re
 import shutil
 import tempfile
+import threading
 
 from pathlib import Path
 from subprocess import CalledProcessError
@@ -356,6 +358,217 @@ Package operations: 2 installs, 0 updates, 0 removals
     ]
 
 
+@pytest.mark.parametrize("link_from_cache", [True, False])
+def test_execute_installs_cached_wheels_with_linking(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    tmp_path: Path,
+    env: MockEnv,
+    fixture_dir: FixtureDirGetter,
+    link_from_cache: bool,
+) -> None:
+    wheel_install = mocker.patch.object(WheelInstaller, "install")
+    config.merge(
+        {
+            "cache-dir": str(tmp_path),
+            "installer": {"link-from-cache": link_from_cache},
+        }
+    )
+
+    executor = Executor(env, pool, config, io)
+    file_package = Package(
+        "demo",
+        "0.1.0",
+        source_type="file",
+        source_url=(fixture_dir("distributions") / "demo-0.1.0-py2.py3-none-any.whl")
+        .resolve()
+        .as_posix(),
+    )
+
+    return_code = executor.execute(
+        [Install(Package("pytest", "3.5.1")), Install(file_package)]
+    )
+
+    assert return_code == 0
+    assert executor._wheel_installer._link_from_cache is link_from_cache
+    # Only wheels from the artifact cache may be linked from.
+    assert {
+        (call.args[0].name, call.kwargs["cached"])
+        for call in wheel_install.call_args_list
+    } == {
+        ("pytest-3.5.1-py2.py3-none-any.whl", True),
+        ("demo-0.1.0-py2.py3-none-any.whl", False),
+    }
+
+
+def test_execute_downloads_archives_while_preceding_groups_are_installed(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    tmp_path: Path,
+    env: MockEnv,
+) -> None:
+    executor = Executor(env, pool, config, io)
+    downloaded = threading.Event()
+
+    def fetch_archive(operation: Install | Update) -> Path:
+        if operation.package.name == "requests":
+            downloaded.set()
+        return tmp_path / f"{operation.package.name}.whl"
+
+    def install(archive: Path, *, cached: bool) -> None:
+        # The archive of the next group is downloaded while this group is installed.
+        if archive.name == "pytest.whl":
+            assert downloaded.wait(5)
+
+    mocker.patch.object(executor, "_fetch_archive", side_effect=fetch_archive)
+    wheel_install = mocker.patch.object(WheelInstaller, "install", side_effect=install)
+
+    return_code = executor.execute(
+        [
+            Install(Package("pytest", "3.5.1"), priority=1),
+            Install(Package("requests", "2.18.4")),
+        ]
+    )
+
+    assert return_code == 0
+    assert [call.args[0].name for call in wheel_install.call_args_list] == [
+        "pytest.whl",
+        "requests.whl",
+    ]
+
+
+def test_execute_does_not_prefetch_archives_if_not_parallel(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    tmp_path: Path,
+    env: MockEnv,
+) -> None:
+    config.merge({"installer": {"parallel": False}})
+    executor = Executor(env, pool, config, io)
+    prefetch_archive = mocker.spy(executor, "_prefetch_archive")
+    mocker.patch.object(
+        executor, "_fetch_archive", return_value=tmp_path / "pytest.whl"
+    )
+    wheel_install = mocker.patch.object(WheelInstaller, "install")
+
+    assert executor.execute([Install(Package("pytest", "3.5.1"))]) == 0
+
+    assert prefetch_archive.call_count == 0
+    assert wheel_install.call_count == 1
+
+
+def test_execute_reports_failed_prefetch_for_operation(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    env: MockEnv,
+) -> None:
+    executor = Executor(env, pool, config, io)
+    mocker.patch.object(
+        executor, "_fetch_archive", side_effect=RuntimeError("Download failed")
+    )
+    wheel_install = mocker.patch.object(WheelInstaller, "install")
+
+    assert executor.execute([Install(Package("pytest", "3.5.1"))]) == 1
+
+    assert wheel_install.call_count == 0
+    output = io.fetch_output()
+    assert "Download failed" in output
+    assert "Cannot install pytest." in output
+
+
+def test_execute_compiles_bytecode_after_installation(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    tmp_path: Path,
+    env: MockEnv,
+) -> None:
+    executor = Executor(env, pool, config, io)
+    executor.enable_bytecode_compilation()
+    mocker.patch.object(
+        executor, "_fetch_archive", return_value=tmp_path / "archive.whl"
+    )
+    calls = []
+    mocker.patch.object(
+        WheelInstaller, "install", side_effect=lambda *_, **__: calls.append("install")
+    )
+    mocker.patch.object(
+        WheelInstaller,
+        "compile_bytecode",
+        side_effect=lambda **_: calls.append("compile"),
+    )
+
+    return_code = executor.execute(
+        [Install(Package("pytest", "3.5.1")), Install(Package("requests", "2.18.4"))]
+    )
+
+    assert return_code == 0
+    assert calls == ["install", "install", "compile"]
+
+
+def test_execute_compiles_bytecode_of_installed_packages_after_failure(
+    mocker: MockerFixture,
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    env: MockEnv,
+    fixture_dir: FixtureDirGetter,
+) -> None:
+    wheel = fixture_dir("distributions") / "demo-0.1.0-py2.py3-none-any.whl"
+
+    def fetch_archive(operation: Install) -> Path:
+        if operation.package.name == "broken":
+            raise RuntimeError("Download failed")
+        return wheel
+
+    executor = Executor(env, pool, config, io)
+    executor.enable_bytecode_compilation()
+    mocker.patch.object(executor, "_fetch_archive", side_effect=fetch_archive)
+
+    return_code = executor.execute(
+        [Install(Package("demo", "0.1.0")), Install(Package("broken", "1.0"))]
+    )
+
+    assert return_code == 1
+    module = Path(env.paths["purelib"]) / "demo" / "__init__.py"
+    assert Path(importlib.util.cache_from_source(str(module))).exists()
+    assert not executor._wheel_installer._pending_bytecode_files
+
+
+def test_execute_uninstalls_without_pip(
+    config: Config,
+    pool: RepositoryPool,
+    io: BufferedIO,
+    env: MockEnv,
+    fixture_dir: FixtureDirGetter,
+) -> None:
+    WheelInstaller(env).install(
+        fixture_dir("distributions") / "demo-0.1.0-py2.py3-none-any.whl"
+    )
+    purelib = Path(env.paths["purelib"])
+    assert (purelib / "demo" / "__init__.py").exists()
+
+    executor = Executor(env, pool, config, io)
+    return_code = executor.execute(
+        [Uninstall(Package("demo", "0.1.0")), Uninstall(Package("attrs", "17.4.0"))]
+    )
+
+    assert return_code == 0
+    assert not (purelib / "demo").exists()
+    assert not (purelib / "demo-0.1.0.dist-info").exists()
+    # pip is only used for distributions that are not found.
+    assert [command[-3:] for command in env.executed] == [["uninstall", "attrs", "-y"]]
+
+
 @pytest.mark.parametrize(
     "operations, has_warning",
     [
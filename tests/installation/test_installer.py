@@ -25,6 +25,7 @@ from poetry.core.packages.project_package import ProjectPackage
 from poetry.factory import Factory
 from poetry.installation import Installer
 from poetry.packages import Locker as BaseLocker
+from poetry.puzzle import Solver
 from poetry.repositories import Repository
 from poetry.repositories import RepositoryPool
 from poetry.repositories.installed_repository import InstalledRepository
@@ -246,6 +247,34 @@ def test_run_with_dependencies(
     assert locker.written_data == expected
 
 
+@pytest.mark.parametrize(
+    ("max_size", "dry_run", "expected"),
+    [(None, False, None), ("1G", False, 2**30), ("1G", True, None)],
+)
+def test_run_prunes_cache(
+    installer: Installer,
+    repo: Repository,
+    package: ProjectPackage,
+    config: Config,
+    mocker: MockerFixture,
+    max_size: str | None,
+    dry_run: bool,
+    expected: int | None,
+) -> None:
+    config.merge({"cache": {"max-size": max_size}})
+    prune = mocker.patch("poetry.utils.cache.CachePruner.prune_if_due")
+    repo.add_package(get_package("A", "1.0"))
+    package.add_dependency(Factory.create_dependency("A", "~1.0"))
+
+    installer.dry_run(dry_run)
+    assert installer.run() == 0
+
+    if expected is None:
+        prune.assert_not_called()
+    else:
+        prune.assert_called_once_with(expected)
+
+
 @pytest.mark.parametrize("lock_version", ("1.1", "2.1"))
 def test_run_update_after_removing_dependencies(
     installer: Installer,
@@ -318,6 +347,61 @@ def test_run_update_after_removing_dependencies(
     assert installer.executor.removals_count == 1
 
 
+@pytest.mark.parametrize(
+    ("incremental", "python_versions", "expected"),
+    [(True, "*", True), (True, "^3.9", False), (False, "*", False)],
+)
+def test_run_update_solves_incrementally_if_configured(
+    installer: Installer,
+    locker: Locker,
+    repo: Repository,
+    package: ProjectPackage,
+    config: Config,
+    mocker: MockerFixture,
+    incremental: bool,
+    python_versions: str,
+    expected: bool,
+) -> None:
+    config.config["solver"]["incremental"] = incremental
+    lock_data = {
+        "package": [
+            {
+                "name": "A",
+                "version": "1.0",
+                "optional": False,
+                "platform": "*",
+                "python-versions": "*",
+                "checksum": [],
+            },
+        ],
+        "metadata": {
+            "lock-version": "2.1",
+            "python-versions": "*",
+            "content-hash": "123456789",
+            "files": {"A": []},
+        },
+    }
+    fix_lock_data(lock_data)
+    locker.locked(True)
+    locker.mock_lock_data(lock_data)
+    package.python_versions = python_versions
+    package_a = get_package("A", "1.0")
+    package_b = get_package("B", "1.1")
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+
+    package.add_dependency(Factory.create_dependency("A", "~1.0"))
+    package.add_dependency(Factory.create_dependency("B", "~1.1"))
+
+    solve = mocker.spy(Solver, "solve")
+    installer.update(True)
+    installer.whitelist(["B"])
+    result = installer.run()
+    assert result == 0
+
+    assert solve.call_args_list[0].kwargs["incremental"] is expected
+
+
 def _configure_run_install_dev(
     lock_version: str,
     locker: Locker,
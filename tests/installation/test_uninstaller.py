@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import os
+
+from pathlib import Path
+
+import pytest
+
+from poetry.installation.uninstaller import Uninstaller
+from poetry.utils.env import MockEnv
+
+
+@pytest.fixture
+def env(tmp_path: Path) -> MockEnv:
+    return MockEnv(path=tmp_path / "env")
+
+
+def _install(
+    env: MockEnv,
+    name: str,
+    files: dict[str, str],
+    *,
+    record: bool = True,
+    entry_points: str | None = None,
+) -> Path:
+    """
+    Write the given files relative to purelib and a dist-info directory
+    whose RECORD lists them.
+    """
+    purelib = Path(env.paths["purelib"])
+    dist_info = purelib / f"{name.replace('-', '_')}-1.0.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: 1.0\n", encoding="utf-8"
+    )
+    files = {**files}
+    if entry_points is not None:
+        files[f"{dist_info.name}/entry_points.txt"] = entry_points
+
+    lines = [f"{dist_info.name}/METADATA,,"]
+    for path, content in files.items():
+        file = purelib / path
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(content, encoding="utf-8")
+        lines.append(f"{path},sha256=,{len(content.encode())}")
+    if record:
+        lines.append(f"{dist_info.name}/RECORD,,")
+        (dist_info / "RECORD").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    return purelib
+
+
+def test_uninstall_removes_recorded_files(env: MockEnv) -> None:
+    purelib = _install(
+        env,
+        "foo",
+        {
+            "foo/__init__.py": "",
+            "foo/sub/module.py": "x = 1\n",
+            "foo.pth": "/some/path\n",
+            "../scripts/foo": "#!python\n",
+        },
+    )
+    pycache = purelib / "foo" / "__pycache__"
+    pycache.mkdir()
+    (pycache / "__init__.cpython-311.pyc").write_bytes(b"")
+    _install(env, "bar", {"bar/__init__.py": ""})
+
+    assert Uninstaller(env).uninstall("foo")
+
+    assert sorted(path.name for path in purelib.iterdir()) == [
+        "bar",
+        "bar-1.0.dist-info",
+    ]
+    assert Path(env.paths["scripts"]).is_dir()
+    assert not (Path(env.paths["scripts"]) / "foo").exists()
+
+
+def test_uninstall_keeps_shared_directories(env: MockEnv) -> None:
+    purelib = _install(env, "ns-foo", {"ns/foo/__init__.py": ""})
+    _install(env, "ns-bar", {"ns/bar/__init__.py": ""})
+
+    assert Uninstaller(env).uninstall("ns-foo")
+
+    assert not (purelib / "ns" / "foo").exists()
+    assert (purelib / "ns" / "bar" / "__init__.py").exists()
+
+
+def test_uninstall_keeps_replaced_files(env: MockEnv) -> None:
+    purelib = _install(env, "foo", {"shared.py": "foo = 1\n"})
+    # Another distribution has overwritten the file.
+    (purelib / "shared.py").write_text("bar = 1000\n", encoding="utf-8")
+
+    assert Uninstaller(env).uninstall("foo")
+
+    assert (purelib / "shared.py").read_text(encoding="utf-8") == "bar = 1000\n"
+    assert not (purelib / "foo-1.0.dist-info").exists()
+
+
+def test_uninstall_keeps_files_outside_of_environment(
+    tmp_path: Path, env: MockEnv
+) -> None:
+    outside = tmp_path / "outside.py"
+    outside.write_text("", encoding="utf-8")
+    _install(env, "foo", {"foo.py": ""})
+    purelib = Path(env.paths["purelib"])
+    record = purelib / "foo-1.0.dist-info" / "RECORD"
+    relative_outside = Path("..", "..", "outside.py").as_posix()
+    with record.open("a", encoding="utf-8") as f:
+        f.write(f"{relative_outside},,\n")
+
+    assert Uninstaller(env).uninstall("foo")
+
+    assert outside.exists()
+    assert not (purelib / "foo.py").exists()
+
+
+def test_uninstall_keeps_files_in_user_base_of_virtualenv(tmp_path: Path) -> None:
+    env = MockEnv(path=tmp_path / "env", is_venv=True)
+    userbase = tmp_path / "home" / ".local"
+    env.set_paths(userbase=userbase, usersite=userbase / "lib" / "site-packages")
+    tool = userbase / "bin" / "tool"
+    tool.parent.mkdir(parents=True)
+    tool.write_text("", encoding="utf-8")
+    _install(env, "foo", {"foo.py": ""})
+    purelib = Path(env.paths["purelib"])
+    record = purelib / "foo-1.0.dist-info" / "RECORD"
+    relative_tool = Path(os.path.relpath(tool, purelib)).as_posix()
+    with record.open("a", encoding="utf-8") as f:
+        f.write(f"{relative_tool},,\n")
+
+    assert Uninstaller(env).uninstall("foo")
+
+    assert tool.exists()
+    assert not (purelib / "foo.py").exists()
+
+
+def test_uninstall_removes_entry_point_scripts(env: MockEnv) -> None:
+    scripts = Path(env.paths["scripts"])
+    scripts.mkdir(parents=True)
+    (scripts / "foo-cli").write_text("#!python\n", encoding="utf-8")
+    (scripts / "other").write_text("#!python\n", encoding="utf-8")
+    _install(
+        env,
+        "foo",
+        {"foo.py": ""},
+        entry_points="[console_scripts]\nfoo-cli = foo:main\n",
+    )
+
+    assert Uninstaller(env).uninstall("foo")
+
+    assert [path.name for path in scripts.iterdir()] == ["other"]
+
+
+def test_uninstall_falls_back_without_record(env: MockEnv) -> None:
+    purelib = _install(env, "foo", {"foo.py": ""}, record=False)
+
+    assert not Uninstaller(env).uninstall("foo")
+
+    assert (purelib / "foo.py").exists()
+    assert (purelib / "foo-1.0.dist-info").exists()
+
+
+def test_uninstall_falls_back_if_not_installed(env: MockEnv) -> None:
+    assert not Uninstaller(env).uninstall("foo")
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import errno
+import importlib.util
 import re
+import zipfile
 
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -9,12 +12,15 @@ import pytest
 
 from poetry.core.constraints.version import parse_constraint
 
+from poetry.installation.wheel_installer import FileLinker
+from poetry.installation.wheel_installer import UnpackedWheel
 from poetry.installation.wheel_installer import WheelInstaller
 from poetry.utils.env import MockEnv
 
 
 if TYPE_CHECKING:
     from pytest import TempPathFactory
+    from pytest_mock import MockerFixture
 
     from tests.types import FixtureDirGetter
 
@@ -81,3 +87,290 @@ def test_enable_bytecode_compilation(
         assert not list(cache_dir.glob("*.opt-2.pyc"))
     else:
         assert not cache_dir.exists()
+
+
+def _build_wheel(wheel: Path, init: bytes = b"") -> Path:
+    files = {
+        "script/__init__.py": init,
+        "script-1.0.data/scripts/run": b"#!python\nprint('run')\n",
+        "script-1.0.dist-info/METADATA": (
+            b"Metadata-Version: 2.1\nName: script\nVersion: 1.0\n"
+        ),
+        "script-1.0.dist-info/WHEEL": (
+            b"Wheel-Version: 1.0\nRoot-Is-Purelib: true\nTag: py3-none-any\n"
+        ),
+    }
+    record = (
+        "".join(f"{name},,\n" for name in files) + "script-1.0.dist-info/RECORD,,\n"
+    )
+    wheel.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(wheel, "w") as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+        zip_file.writestr("script-1.0.dist-info/RECORD", record)
+    return wheel
+
+
+@pytest.fixture
+def cached_wheel(tmp_path: Path) -> Path:
+    return _build_wheel(tmp_path / "cache" / "script-1.0-py3-none-any.whl")
+
+
+def _installed_files(env: MockEnv) -> dict[str, bytes]:
+    root = Path(env.paths["purelib"])
+    return {
+        path.relative_to(root).as_posix(): path.read_bytes()
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+@pytest.mark.parametrize("cached", [True, False])
+def test_link_from_cache_installs_same_files(
+    tmp_path: Path, cached_wheel: Path, cached: bool
+) -> None:
+    default_env = MockEnv(path=tmp_path / "default")
+    WheelInstaller(default_env).install(cached_wheel)
+
+    env = MockEnv(path=tmp_path / "linked")
+    installer = WheelInstaller(env)
+    installer.enable_linking_from_cache()
+    installer.install(cached_wheel, cached=cached)
+
+    assert _installed_files(env) == _installed_files(default_env)
+    assert UnpackedWheel.path_for(cached_wheel).exists() is cached
+
+    scripts = Path(env.paths["scripts"])
+    assert (scripts / "run").read_text(encoding="utf-8") == (
+        f"#!{env.python}\nprint('run')\n"
+    )
+
+
+def test_link_from_cache_reuses_unpacked_wheel(
+    tmp_path: Path, cached_wheel: Path
+) -> None:
+    for name in ("first", "second"):
+        installer = WheelInstaller(MockEnv(path=tmp_path / name))
+        installer.enable_linking_from_cache()
+        installer.install(cached_wheel, cached=True)
+
+    unpacked = UnpackedWheel.path_for(cached_wheel)
+    source = unpacked / "files" / "script" / "__init__.py"
+    for name in ("first", "second"):
+        target = Path(MockEnv(path=tmp_path / name).paths["purelib"]) / "script"
+        assert (target / "__init__.py").read_bytes() == source.read_bytes()
+
+    # The wheel has only been unpacked once.
+    assert {path.name for path in cached_wheel.parent.iterdir()} == {
+        cached_wheel.name,
+        unpacked.name,
+    }
+
+
+def test_link_from_cache_records_hashes(env: MockEnv, cached_wheel: Path) -> None:
+    installer = WheelInstaller(env)
+    installer.enable_linking_from_cache()
+    installer.install(cached_wheel, cached=True)
+
+    purelib = Path(env.paths["purelib"])
+    record = (purelib / "script-1.0.dist-info" / "RECORD").read_text(encoding="utf-8")
+    assert (
+        "script/__init__.py,sha256=47DEQpj8HBSa-_TImW-5JCeuQeRkm5NMpJWZG3hSuFU,0"
+        in (record)
+    )
+
+
+def test_link_from_cache_ignores_invalid_unpacked_wheel(
+    env: MockEnv, cached_wheel: Path
+) -> None:
+    unpacked = UnpackedWheel.path_for(cached_wheel)
+    unpacked.mkdir()
+    (unpacked / UnpackedWheel.MANIFEST).write_text("{", encoding="utf-8")
+
+    installer = WheelInstaller(env)
+    installer.enable_linking_from_cache()
+    installer.install(cached_wheel, cached=True)
+
+    assert (Path(env.paths["purelib"]) / "script" / "__init__.py").exists()
+    # The invalid copy has been replaced.
+    assert UnpackedWheel.load(cached_wheel) is not None
+    assert {path.name for path in cached_wheel.parent.iterdir()} == {
+        cached_wheel.name,
+        unpacked.name,
+    }
+
+
+def test_link_from_cache_keeps_concurrently_unpacked_wheel(
+    tmp_path: Path, cached_wheel: Path, mocker: MockerFixture
+) -> None:
+    load = UnpackedWheel.load
+    source = UnpackedWheel.path_for(cached_wheel) / "files" / "script" / "__init__.py"
+    inodes: list[int] = []
+
+    def load_after_concurrent_unpacking(wheel: Path) -> UnpackedWheel | None:
+        if inodes:
+            return load(wheel)
+
+        # Another process unpacks the wheel right after it was not found.
+        inodes.append(0)
+        other = WheelInstaller(MockEnv(path=tmp_path / "other"))
+        other.enable_linking_from_cache()
+        other.install(cached_wheel, cached=True)
+        inodes[0] = source.stat().st_ino
+        return None
+
+    mocker.patch.object(
+        UnpackedWheel, "load", side_effect=load_after_concurrent_unpacking
+    )
+
+    env = MockEnv(path=tmp_path / "env")
+    installer = WheelInstaller(env)
+    installer.enable_linking_from_cache()
+    installer.install(cached_wheel, cached=True)
+
+    # The copy of the other process is used instead of being replaced.
+    assert source.stat().st_ino == inodes[0]
+    target = Path(env.paths["purelib"]) / "script" / "__init__.py"
+    assert target.read_bytes() == source.read_bytes()
+
+
+def test_link_from_cache_replaces_existing_file(
+    tmp_path: Path, env: MockEnv, cached_wheel: Path
+) -> None:
+    installer = WheelInstaller(env)
+    installer.enable_linking_from_cache()
+    installer.install(cached_wheel, cached=True)
+
+    # Installing over a linked file must not write through to the cached copy.
+    other_wheel = _build_wheel(
+        tmp_path / "other" / "script-1.0-py3-none-any.whl", b"other"
+    )
+    installer.install(other_wheel)
+
+    target = Path(env.paths["purelib"]) / "script" / "__init__.py"
+    assert target.read_bytes() == b"other"
+    unpacked = UnpackedWheel.path_for(cached_wheel)
+    assert (unpacked / "files" / "script" / "__init__.py").read_bytes() == b""
+
+
+def test_file_linker_falls_back_to_copy(tmp_path: Path, mocker: MockerFixture) -> None:
+    source = tmp_path / "source"
+    source.write_bytes(b"content")
+    mocker.patch.object(
+        FileLinker, "_reflink", side_effect=OSError(errno.ENOTTY, "reflink")
+    )
+    link = mocker.patch("os.link", side_effect=OSError(errno.EXDEV, "link"))
+    linker = FileLinker()
+
+    assert linker.link(source, tmp_path / "first") == "copy"
+    assert linker.link(source, tmp_path / "second") == "copy"
+
+    assert (tmp_path / "first").read_bytes() == b"content"
+    assert (tmp_path / "second").read_bytes() == b"content"
+    # Unsupported methods are not tried again.
+    assert link.call_count == 1
+
+
+def test_file_linker_falls_back_for_single_file_on_other_errors(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    source = tmp_path / "source"
+    source.write_bytes(b"content")
+    mocker.patch.object(
+        FileLinker, "_reflink", side_effect=OSError(errno.EOPNOTSUPP, "reflink")
+    )
+    link = mocker.patch(
+        "os.link", side_effect=[OSError(errno.EMLINK, "Too many links"), None]
+    )
+    linker = FileLinker()
+
+    assert linker.link(source, tmp_path / "first") == "copy"
+    assert linker.link(source, tmp_path / "second") == "hardlink"
+
+    assert (tmp_path / "first").read_bytes() == b"content"
+    assert link.call_count == 2
+    assert linker._unsupported == {"reflink"}
+
+
+def test_file_linker_hardlinks(tmp_path: Path, mocker: MockerFixture) -> None:
+    source = tmp_path / "source"
+    source.write_bytes(b"content")
+    mocker.patch.object(
+        FileLinker, "_reflink", side_effect=OSError(errno.ENOTSUP, "reflink")
+    )
+
+    assert FileLinker().link(source, tmp_path / "target") == "hardlink"
+    assert (tmp_path / "target").samefile(source)
+
+
+def test_file_linker_raises_for_missing_source(tmp_path: Path) -> None:
+    linker = FileLinker()
+
+    with pytest.raises(FileNotFoundError):
+        linker.link(tmp_path / "missing", tmp_path / "target")
+
+    assert not linker._unsupported
+
+
+@pytest.mark.parametrize("compile", [True, False])
+def test_bytecode_is_listed_in_record(
+    env: MockEnv, demo_wheel: Path, compile: bool
+) -> None:
+    installer = WheelInstaller(env)
+    installer.enable_bytecode_compilation(compile)
+    installer.install(demo_wheel)
+
+    purelib = Path(env.paths["purelib"])
+    record = (purelib / "demo-0.1.0.dist-info" / "RECORD").read_text(encoding="utf-8")
+    pyc = Path(importlib.util.cache_from_source("demo/__init__.py")).as_posix()
+    assert (f"{pyc},," in record.splitlines()) is compile
+    assert (purelib / pyc).exists() is compile
+
+
+def test_deferred_bytecode_compilation(
+    env: MockEnv, demo_wheel: Path, cached_wheel: Path
+) -> None:
+    installer = WheelInstaller(env)
+    installer.enable_bytecode_compilation()
+    installer.defer_bytecode_compilation()
+    installer.install(demo_wheel)
+    installer.install(cached_wheel)
+
+    purelib = Path(env.paths["purelib"])
+    pycs = [
+        purelib / importlib.util.cache_from_source(f"{name}/__init__.py")
+        for name in ("demo", "script")
+    ]
+    assert not any(pyc.exists() for pyc in pycs)
+
+    installer.compile_bytecode(max_workers=1)
+
+    assert all(pyc.exists() for pyc in pycs)
+
+
+@pytest.mark.parametrize("process_pool_available", [True, False])
+def test_compile_bytecode_in_batches(
+    env: MockEnv,
+    demo_wheel: Path,
+    cached_wheel: Path,
+    mocker: MockerFixture,
+    process_pool_available: bool,
+) -> None:
+    mocker.patch("poetry.installation.wheel_installer.BYTECODE_BATCH_SIZE", 1)
+    if not process_pool_available:
+        mocker.patch(
+            "concurrent.futures.ProcessPoolExecutor",
+            side_effect=NotImplementedError("no semaphores"),
+        )
+    installer = WheelInstaller(env)
+    installer.enable_bytecode_compilation()
+    installer.defer_bytecode_compilation()
+    installer.install(demo_wheel)
+    installer.install(cached_wheel)
+
+    installer.compile_bytecode(max_workers=2)
+
+    purelib = Path(env.paths["purelib"])
+    for name in ("demo", "script"):
+        pyc = importlib.util.cache_from_source(f"{name}/__init__.py")
+        assert (purelib / pyc).exists()
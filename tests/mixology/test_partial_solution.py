@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import NoVersionsCauseError
+from poetry.mixology.partial_solution import PartialSolution
+from poetry.mixology.set_relation import SetRelation
+from poetry.mixology.term import Term
+
+
+def derive(solution: PartialSolution, constraint: str, is_positive: bool) -> None:
+    dependency = Dependency("foo", constraint)
+    cause = Incompatibility([Term(dependency, not is_positive)], NoVersionsCauseError())
+    solution.derive(dependency, is_positive, cause)
+
+
+def test_satisfier_returns_first_satisfying_assignment() -> None:
+    solution = PartialSolution()
+    derive(solution, ">=1.0", True)
+    derive(solution, "<3.0", True)
+    derive(solution, "2.5", False)
+    solution.decide(Package("bar", "1.0"))
+    derive(solution, "<2.0", True)
+
+    assignments = solution._package_assignments["foo"]
+    assert solution.satisfier(Term(Dependency("foo", ">=0.5"), True)) is assignments[0]
+    assert solution.satisfier(Term(Dependency("foo", "<4.0"), True)) is assignments[1]
+    assert solution.satisfier(Term(Dependency("foo", "2.5"), False)) is assignments[2]
+    assert solution.satisfier(Term(Dependency("foo", "^1.0"), True)) is assignments[3]
+
+
+def test_backtrack_restores_terms_of_removed_packages() -> None:
+    solution = PartialSolution()
+    derive(solution, "2.5", False)
+    solution.decide(Package("bar", "1.0"))
+    derive(solution, ">=1.0,<3.0", True)
+
+    assert (
+        solution.relation(Term(Dependency("foo", ">=1.0,<3.0"), True))
+        == SetRelation.SUBSET
+    )
+
+    solution.backtrack(0)
+
+    assert (
+        solution.relation(Term(Dependency("foo", "2.5"), True)) == SetRelation.DISJOINT
+    )
+    assert solution.relation(Term(Dependency("foo", "^1.0"), True)) == (
+        SetRelation.OVERLAPPING
+    )
+    assert solution.relation(Term(Dependency("bar", "1.0"), True)) == (
+        SetRelation.OVERLAPPING
+    )
+    assert (
+        solution.satisfier(Term(Dependency("foo", "2.5"), False))
+        is (solution._package_assignments["foo"][0])
+    )
+    assert "bar" not in solution._package_assignments
+    assert solution.decisions == []
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from poetry.core.packages.dependency import Dependency
+
+from poetry.mixology.set_relation import SetRelation
+from poetry.mixology.term import Term
+from poetry.mixology.term import clear_term_cache
+from poetry.mixology.term import term_cache_info
+
+
+def test_relation_is_cached_for_equal_terms() -> None:
+    clear_term_cache()
+
+    relation = Term(Dependency("foo", "^1.5"), True).relation(
+        Term(Dependency("foo", "^1.0"), True)
+    )
+    assert relation == SetRelation.SUBSET
+    assert term_cache_info() == (0, 1)
+
+    relation = Term(Dependency("foo", "^1.5"), True).relation(
+        Term(Dependency("foo", "^1.0"), True)
+    )
+    assert relation == SetRelation.SUBSET
+    assert term_cache_info() == (1, 1)
+
+
+def test_relation_considers_positivity_and_dependency() -> None:
+    clear_term_cache()
+    term = Term(Dependency("foo", "^1.5"), True)
+
+    assert term.relation(Term(Dependency("foo", "^1.0"), True)) == SetRelation.SUBSET
+    assert term.relation(Term(Dependency("foo", "^1.0"), False)) == SetRelation.DISJOINT
+    other = Term(Dependency("foo", "^1.0", source_type="legacy"), True)
+    assert term.relation(other) == SetRelation.DISJOINT
+    assert term_cache_info() == (0, 3)
+
+
+def test_relation_of_new_term_reflects_changed_constraint() -> None:
+    clear_term_cache()
+    dependency = Dependency("foo", "*")
+    term = Term(dependency, True)
+    other = Term(Dependency("foo", "^1.0"), True)
+    assert term.relation(other) == SetRelation.OVERLAPPING
+
+    dependency.constraint = "^1.5"
+
+    # The result is consistent for the lifetime of a term ...
+    assert term.relation(other) == SetRelation.OVERLAPPING
+    # ... but the shared cache is keyed by the current constraint.
+    assert Term(dependency, True).relation(other) == SetRelation.SUBSET
+    assert term_cache_info() == (0, 2)
+
+
+def test_intersect_is_cached_but_returns_new_terms() -> None:
+    clear_term_cache()
+    term = Term(Dependency("foo", "^1.0"), True)
+    other = Term(Dependency("foo", ">=1.5"), True)
+
+    intersection = term.intersect(other)
+    assert intersection is not None
+    assert str(intersection) == "foo (>=1.5,<2.0)"
+    assert term_cache_info() == (0, 1)
+
+    second_intersection = term.intersect(Term(Dependency("foo", ">=1.5"), True))
+    assert second_intersection is not None
+    assert second_intersection is not intersection
+    assert str(second_intersection) == "foo (>=1.5,<2.0)"
+    assert term_cache_info() == (1, 1)
+
+
+def test_difference() -> None:
+    term = Term(Dependency("foo", "^1.0"), True)
+
+    assert str(term.difference(Term(Dependency("foo", ">=1.5"), True))) == (
+        "foo (>=1.0,<1.5)"
+    )
+    assert term.difference(Term(Dependency("foo", "*"), True)) is None
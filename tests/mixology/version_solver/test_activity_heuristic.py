@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.core.packages.dependency import Dependency
+
+from poetry.factory import Factory
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import NoVersionsCauseError
+from poetry.mixology.term import Term
+from poetry.mixology.version_solver import VersionSolver
+from tests.mixology.helpers import add_to_repo
+
+
+if TYPE_CHECKING:
+    from poetry.core.packages.project_package import ProjectPackage
+
+    from poetry.repositories import Repository
+    from tests.mixology.version_solver.conftest import Provider
+
+
+@pytest.fixture
+def unsatisfied(repo: Repository) -> list[Dependency]:
+    add_to_repo(repo, "a", "1.0")
+    add_to_repo(repo, "a", "2.0")
+    add_to_repo(repo, "b", "1.0")
+    add_to_repo(repo, "b", "2.0")
+    add_to_repo(repo, "b", "3.0")
+    add_to_repo(repo, "c", "1.0")
+    add_to_repo(repo, "c", "2.0")
+
+    return [Dependency("a", "*"), Dependency("b", "*"), Dependency("c", "*")]
+
+
+def bump(solver: VersionSolver, name: str) -> None:
+    solver._bump_activity(
+        Incompatibility([Term(Dependency(name, "*"), True)], NoVersionsCauseError())
+    )
+
+
+@pytest.mark.parametrize("activity_heuristic", [False, True])
+def test_choose_next_prefers_packages_involved_in_conflicts(
+    root: ProjectPackage,
+    provider: Provider,
+    unsatisfied: list[Dependency],
+    activity_heuristic: bool,
+) -> None:
+    solver = VersionSolver(root, provider, activity_heuristic=activity_heuristic)
+    assert solver._choose_next(unsatisfied).name == "b"
+
+    bump(solver, "a")
+
+    expected = "a" if activity_heuristic else "b"
+    assert solver._choose_next(unsatisfied).name == expected
+
+
+def test_activity_of_older_conflicts_decays(
+    root: ProjectPackage, provider: Provider, unsatisfied: list[Dependency]
+) -> None:
+    solver = VersionSolver(root, provider, activity_heuristic=True)
+
+    bump(solver, "a")
+    bump(solver, "c")
+    assert solver._choose_next(unsatisfied).name == "c"
+
+    bump(solver, "a")
+    assert solver._choose_next(unsatisfied).name == "a"
+
+
+def test_activity_is_rescaled_without_changing_the_order(
+    root: ProjectPackage, provider: Provider, unsatisfied: list[Dependency]
+) -> None:
+    solver = VersionSolver(root, provider, activity_heuristic=True)
+    solver._activity_increment = 1e100
+
+    bump(solver, "a")
+    bump(solver, "c")
+
+    assert solver._activity_increment < 1e100
+    assert solver._choose_next(unsatisfied).name == "c"
+
+
+def test_solve_with_activity_heuristic(
+    root: ProjectPackage, provider: Provider, repo: Repository
+) -> None:
+    root.add_dependency(Factory.create_dependency("a", "*"))
+    root.add_dependency(Factory.create_dependency("b", "*"))
+
+    add_to_repo(repo, "a", "1.0.0", deps={"c": "^1.0.0"})
+    add_to_repo(repo, "a", "2.0.0", deps={"c": "^2.0.0"})
+    add_to_repo(repo, "b", "1.0.0", deps={"c": "^1.0.0"})
+    add_to_repo(repo, "b", "2.0.0", deps={"c": "^1.0.0"})
+    add_to_repo(repo, "b", "3.0.0", deps={"c": "^1.0.0"})
+    add_to_repo(repo, "c", "1.0.0")
+    add_to_repo(repo, "c", "2.0.0")
+
+    solver = VersionSolver(root, provider, activity_heuristic=True)
+    result = solver.solve()
+
+    assert {p.name: p.version.text for p in result.packages} == {
+        "a": "1.0.0",
+        "b": "3.0.0",
+        "c": "1.0.0",
+    }
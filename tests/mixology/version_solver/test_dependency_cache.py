@@ -30,20 +30,19 @@ def test_solver_dependency_cache_respects_source_type(
     add_to_repo(repo, "demo", "1.0.0")
 
     cache = DependencyCache(provider)
-    cache._search_for_cached.cache_clear()
 
     # ensure cache was never hit for both calls
     cache.search_for(dependency_pypi, 0)
     cache.search_for(dependency_git, 0)
-    assert not cache._search_for_cached.cache_info().hits
+    assert cache.hits == 0
 
     # increase test coverage by searching for copies
     # (when searching for the exact same object, __eq__ is never called)
     packages_pypi = cache.search_for(deepcopy(dependency_pypi), 0)
     packages_git = cache.search_for(deepcopy(dependency_git), 0)
 
-    assert cache._search_for_cached.cache_info().hits == 2
-    assert cache._search_for_cached.cache_info().currsize == 2
+    assert cache.hits == 2
+    assert len(cache._search_results) == 2
 
     assert len(packages_pypi) == len(packages_git) == 1
     assert packages_pypi != packages_git
@@ -72,7 +71,6 @@ def test_solver_dependency_cache_pulls_from_prior_level_cache(
 
     wrapped_provider = mock.Mock(wraps=provider)
     cache = DependencyCache(wrapped_provider)
-    cache._search_for_cached.cache_clear()
 
     # On first call, provider.search_for() should be called and the cache
     # populated.
@@ -80,35 +78,35 @@ def test_solver_dependency_cache_pulls_from_prior_level_cache(
     assert len(wrapped_provider.search_for.mock_calls) == 1
     assert ("demo", None, None, None, None) in cache._cache
     assert ("demo", None, None, None, None) in cache._cached_dependencies_by_level[0]
-    assert cache._search_for_cached.cache_info().hits == 0
-    assert cache._search_for_cached.cache_info().misses == 1
+    assert cache.hits == 0
+    assert cache.misses == 1
 
-    # On second call at level 1, neither provider.search_for() nor
-    # cache._search_for_cached() should have been called again, and the cache
-    # should remain the same.
+    # On second call at level 1, provider.search_for() should not have been
+    # called again, the search result should be reused and the cache should
+    # remain the same.
     cache.search_for(dependency_pypi, 1)
     assert len(wrapped_provider.search_for.mock_calls) == 1
     assert ("demo", None, None, None, None) in cache._cache
     assert ("demo", None, None, None, None) in cache._cached_dependencies_by_level[0]
     assert set(cache._cached_dependencies_by_level.keys()) == {0}
-    assert cache._search_for_cached.cache_info().hits == 1
-    assert cache._search_for_cached.cache_info().misses == 1
+    assert cache.hits == 1
+    assert cache.misses == 1
 
     # On third call at level 2 with an updated constraint for the `demo`
-    # package should not call provider.search_for(), but should call
-    # cache._search_for_cached() and update the cache.
+    # package should not call provider.search_for(), but should filter
+    # the cached packages and update the cache.
     cache.search_for(dependency_pypi_constrained, 2)
     assert len(wrapped_provider.search_for.mock_calls) == 1
     assert ("demo", None, None, None, None) in cache._cache
     assert ("demo", None, None, None, None) in cache._cached_dependencies_by_level[0]
     assert ("demo", None, None, None, None) in cache._cached_dependencies_by_level[2]
     assert set(cache._cached_dependencies_by_level.keys()) == {0, 2}
-    assert cache._search_for_cached.cache_info().hits == 1
-    assert cache._search_for_cached.cache_info().misses == 2
+    assert cache.hits == 1
+    assert cache.misses == 2
 
-    # Clearing the level 2 and level 1 caches should invalidate the lru_cache
-    # on cache.search_for and wipe out the level 2 cache while preserving the
-    # level 0 cache.
+    # Clearing the level 2 and level 1 caches should wipe out the level 2 cache
+    # while preserving the level 0 cache. The search results have not been
+    # derived from the level 2 cache so that they are still valid.
     cache.clear_level(2)
     cache.clear_level(1)
     cache.search_for(dependency_pypi, 0)
@@ -116,8 +114,68 @@ def test_solver_dependency_cache_pulls_from_prior_level_cache(
     assert ("demo", None, None, None, None) in cache._cache
     assert ("demo", None, None, None, None) in cache._cached_dependencies_by_level[0]
     assert set(cache._cached_dependencies_by_level.keys()) == {0}
-    assert cache._search_for_cached.cache_info().hits == 0
-    assert cache._search_for_cached.cache_info().misses == 1
+    assert cache.hits == 2
+    assert cache.misses == 2
+    assert cache.invalidations == 0
+
+
+def test_solver_dependency_cache_invalidates_results_of_rolled_back_levels(
+    root: ProjectPackage, provider: Provider, repo: Repository
+) -> None:
+    dependency = Factory.create_dependency("demo", ">=0.1.0")
+    dependency_constrained = Factory.create_dependency("demo", ">=0.1.0,<2.0.0")
+    dependency_more_constrained = Factory.create_dependency("demo", ">=0.1.0,<1.5.0")
+    other_dependency = Factory.create_dependency("other", ">=1.0.0")
+    add_to_repo(repo, "demo", "1.0.0")
+    add_to_repo(repo, "demo", "1.8.0")
+    add_to_repo(repo, "other", "1.0.0")
+
+    cache = DependencyCache(provider)
+    cache.search_for(dependency, 0)
+    cache.search_for(other_dependency, 1)
+    cache.search_for(dependency_constrained, 2)
+    cache.search_for(dependency_more_constrained, 3)
+    assert cache.misses == 4
+
+    # Only the last result has been derived from the packages cached at level 2.
+    cache.clear_level(3)
+    cache.clear_level(2)
+    assert cache.invalidations == 1
+
+    cache.search_for(dependency, 1)
+    cache.search_for(other_dependency, 1)
+    cache.search_for(dependency_constrained, 2)
+    assert cache.hits == 3
+
+    packages = cache.search_for(dependency_more_constrained, 3)
+    assert cache.misses == 5
+    assert [p.package.version.text for p in packages] == ["1.0.0"]
+
+
+def test_solver_dependency_cache_evicts_least_recently_used_results(
+    root: ProjectPackage, provider: Provider, repo: Repository
+) -> None:
+    add_to_repo(repo, "demo", "1.0.0")
+
+    cache = DependencyCache(provider)
+    cache.MIN_SEARCH_RESULTS = 2
+    cache.SEARCH_RESULTS_PER_PACKAGE = 2
+
+    dependencies = [
+        Factory.create_dependency("demo", f">=0.{i}.0") for i in range(1, 4)
+    ]
+    cache.search_for(dependencies[0], 0)
+    cache.search_for(dependencies[1], 0)
+    cache.search_for(dependencies[0], 0)
+    cache.search_for(dependencies[2], 0)
+    assert cache.evictions == 1
+    assert cache.hits == 1
+
+    cache.search_for(dependencies[0], 0)
+    assert cache.hits == 2
+    cache.search_for(dependencies[1], 0)
+    assert cache.hits == 2
+    assert cache.evictions == 2
 
 
 def test_solver_dependency_cache_respects_subdirectories(
@@ -144,20 +202,19 @@ def test_solver_dependency_cache_respects_subdirectories(
     root.add_dependency(dependency_one_copy)
 
     cache = DependencyCache(provider)
-    cache._search_for_cached.cache_clear()
 
     # ensure cache was never hit for both calls
     cache.search_for(dependency_one, 0)
     cache.search_for(dependency_one_copy, 0)
-    assert not cache._search_for_cached.cache_info().hits
+    assert cache.hits == 0
 
     # increase test coverage by searching for copies
     # (when searching for the exact same object, __eq__ is never called)
     packages_one = cache.search_for(deepcopy(dependency_one), 0)
     packages_one_copy = cache.search_for(deepcopy(dependency_one_copy), 0)
 
-    assert cache._search_for_cached.cache_info().hits == 2
-    assert cache._search_for_cached.cache_info().currsize == 2
+    assert cache.hits == 2
+    assert len(cache._search_results) == 2
 
     assert len(packages_one) == len(packages_one_copy) == 1
 
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from poetry.core.packages.dependency import Dependency
+from poetry.core.packages.package import Package
+
+from poetry.mixology.incompatibility import Incompatibility
+from poetry.mixology.incompatibility_cause import ConflictCauseError
+from poetry.mixology.incompatibility_cause import DependencyCauseError
+from poetry.mixology.incompatibility_cause import NoVersionsCauseError
+from poetry.mixology.term import Term
+from poetry.mixology.version_solver import VersionSolver
+
+
+if TYPE_CHECKING:
+    from poetry.core.packages.project_package import ProjectPackage
+
+    from tests.mixology.version_solver.conftest import Provider
+
+
+def test_propagation_skips_incompatibilities_with_unchanged_watched_packages(
+    root: ProjectPackage, provider: Provider
+) -> None:
+    solver = VersionSolver(root, provider)
+    cause = ConflictCauseError(
+        Incompatibility(
+            [Term(Dependency("a", "^1.0"), True), Term(Dependency("x", "^1.0"), False)],
+            DependencyCauseError(),
+        ),
+        Incompatibility(
+            [
+                Term(Dependency("b", "^1.0"), True),
+                Term(Dependency("c", "^1.0"), True),
+                Term(Dependency("x", "^1.0"), True),
+            ],
+            NoVersionsCauseError(),
+        ),
+    )
+    incompatibility = Incompatibility(
+        [
+            Term(Dependency("a", "^1.0"), True),
+            Term(Dependency("b", "^1.0"), True),
+            Term(Dependency("c", "^1.0"), True),
+        ],
+        cause,
+    )
+    solver._add_incompatibility(incompatibility)
+
+    # "a" and "b" are inconclusive so that the incompatibility cannot be satisfied
+    # by a change of "c".
+    solver._propagate("a")
+    assert solver.visited_incompatibilities == 1
+    assert solver._watches == {"a": [0], "b": [0], "c": []}
+
+    solver.solution.decide(Package("c", "1.0"))
+    solver._propagate("c")
+    assert solver.visited_incompatibilities == 1
+    assert solver.skipped_incompatibilities == 1
+
+    # A change of a watched package requires another visit,
+    # which derives that "b" must not be in "^1.0".
+    solver.solution.decide(Package("a", "1.0"))
+    solver._propagate("a")
+    assert solver.visited_incompatibilities == 2
+    assert solver.skipped_incompatibilities == 1
+    assert not solver.solution.satisfies(Term(Dependency("b", "1.0"), True))
+    # The derivation contradicts the incompatibility, which is watched by all its
+    # packages again so that it is visited after backtracking.
+    assert solver._watches == {"a": [0], "b": [0], "c": [0]}
@@ -1,20 +1,24 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import ANY
 
 import pytest
 
+from cleo.io.null_io import NullIO
+from poetry.core.packages.project_package import ProjectPackage
+
 from poetry.factory import Factory
+from poetry.mixology.term import clear_term_cache
 from poetry.puzzle.provider import IncompatibleConstraintsError
+from poetry.repositories import Repository
+from poetry.repositories import RepositoryPool
 from tests.mixology.helpers import add_to_repo
 from tests.mixology.helpers import check_solver_result
+from tests.mixology.version_solver.conftest import Provider
 
 
 if TYPE_CHECKING:
-    from poetry.core.packages.project_package import ProjectPackage
-
-    from poetry.repositories import Repository
-    from tests.mixology.version_solver.conftest import Provider
     from tests.types import FixtureDirGetter
 
 
@@ -148,6 +152,43 @@ So, because myapp depends on b (*), version solving failed."""
     check_solver_result(root, provider, error=error, tries=2)
 
 
+def test_no_valid_solution_after_solving_equal_constraints(
+    root: ProjectPackage, provider: Provider, repo: Repository
+) -> None:
+    # Solve with constraints that are equal to the ones below but formatted
+    # differently, so that the shared term caches are populated with them.
+    clear_term_cache()
+    other_root = ProjectPackage("other", "0.0.0")
+    other_root.add_dependency(Factory.create_dependency("a", "*"))
+    other_root.add_dependency(Factory.create_dependency("b", "*"))
+    other_repo = Repository("other")
+    add_to_repo(other_repo, "a", "1.0", deps={"b": "1.0"})
+    add_to_repo(other_repo, "a", "2.0", deps={"b": "2.0"})
+    add_to_repo(other_repo, "b", "1.0", deps={"a": "2.0"})
+    add_to_repo(other_repo, "b", "2.0", deps={"a": "1.0"})
+    other_provider = Provider(other_root, RepositoryPool([other_repo]), NullIO())
+    check_solver_result(other_root, other_provider, error=ANY)
+
+    root.add_dependency(Factory.create_dependency("a", "*"))
+    root.add_dependency(Factory.create_dependency("b", "*"))
+
+    add_to_repo(repo, "a", "1.0.0", deps={"b": "1.0.0"})
+    add_to_repo(repo, "a", "2.0.0", deps={"b": "2.0.0"})
+
+    add_to_repo(repo, "b", "1.0.0", deps={"a": "2.0.0"})
+    add_to_repo(repo, "b", "2.0.0", deps={"a": "1.0.0"})
+
+    error = """\
+Because no versions of b match <1.0.0 || >1.0.0,<2.0.0 || >2.0.0
+ and b (1.0.0) depends on a (2.0.0), b (!=2.0.0) requires a (2.0.0).
+And because a (2.0.0) depends on b (2.0.0), b is forbidden.
+Because b (2.0.0) depends on a (1.0.0) which depends on b (1.0.0), b is forbidden.
+Thus, b is forbidden.
+So, because myapp depends on b (*), version solving failed."""
+
+    check_solver_result(root, provider, error=error, tries=2)
+
+
 def test_package_with_the_same_name_gives_clear_error_message(
     root: ProjectPackage, provider: Provider, repo: Repository
 ) -> None:
@@ -76,6 +76,17 @@ def test_is_fresh(
     assert locker.is_fresh() is is_fresh
 
 
+def test_content_hash(locker: Locker, root: ProjectPackage) -> None:
+    locker.set_lock_data(root, {})
+    content_hash = locker.content_hash
+    assert locker.lock_data["metadata"]["content-hash"] == content_hash
+
+    locker.set_pyproject_data({"tool": {"poetry": {"dependencies": {"tomli": "*"}}}})
+
+    assert locker.content_hash != content_hash
+    assert locker.content_hash == locker._get_content_hash()
+
+
 @pytest.mark.parametrize("lock_version", [None, "2.0", "2.1"])
 def test_is_locked_group_and_markers(
     locker: Locker, root: ProjectPackage, lock_version: str | None
@@ -1198,6 +1209,39 @@ content-hash = "115cf985d932e9bf5f540555bbdd75decbb62cac81e399375fc19f6277f8c1d8
     assert content == expected
 
 
+def test_locker_dump_packages_can_be_loaded(locker: Locker) -> None:
+    package_a = get_package("A", "1.0.0")
+    package_a.add_dependency(Factory.create_dependency("B", "^1.0"))
+    package_a.files = [{"file": "a-1.0.0.tar.gz", "hash": "sha256:abc"}]
+    package_b = get_package("B", "1.1.0")
+    package_b.files = []
+    packages = {
+        package_a: TransitivePackageInfo(
+            0, {MAIN_GROUP}, {MAIN_GROUP: parse_marker('sys_platform == "linux"')}
+        ),
+        package_b: TransitivePackageInfo(1, {MAIN_GROUP, "dev"}, {}),
+    }
+
+    data = locker.dump_packages(packages)
+
+    assert json.loads(json.dumps(data)) == data
+    loaded = locker.load_packages(data)
+    assert list(loaded) == [package_a, package_b]
+    loaded_a, loaded_b = loaded
+    assert loaded_a.files == package_a.files
+    assert loaded_a.requires == package_a.requires
+    assert loaded[loaded_a].depth == 0
+    assert loaded[loaded_a].markers == {
+        MAIN_GROUP: parse_marker('sys_platform == "linux"')
+    }
+    assert loaded[loaded_b].depth == 1
+    assert loaded[loaded_b].groups == {MAIN_GROUP, "dev"}
+    assert loaded[loaded_b].markers == {
+        MAIN_GROUP: AnyMarker(),
+        "dev": AnyMarker(),
+    }
+
+
 def test_locker_dumps_subdir(
     locker: Locker, root: ProjectPackage, transitive_info: TransitivePackageInfo
 ) -> None:
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from poetry.core.constraints.version import Version
+from poetry.core.packages.package import Package
+
+from poetry.puzzle.prefetcher import MetadataPrefetcher
+from poetry.repositories.exceptions import PackageNotFoundError
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+class Fetcher:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Version, str | None]] = []
+        self.threads: set[str] = set()
+        self.lock = threading.Lock()
+
+    def __call__(
+        self, name: str, version: Version, repository_name: str | None = None
+    ) -> Package:
+        with self.lock:
+            self.calls.append((name, version, repository_name))
+            self.threads.add(threading.current_thread().name)
+        if name == "missing":
+            raise PackageNotFoundError(f"Package {name} ({version}) not found.")
+        return Package(name, version)
+
+
+@pytest.fixture
+def fetcher() -> Fetcher:
+    return Fetcher()
+
+
+@pytest.fixture
+def prefetcher(fetcher: Fetcher) -> Iterator[MetadataPrefetcher]:
+    prefetcher = MetadataPrefetcher(fetcher, max_workers=2)
+    prefetcher.start()
+    yield prefetcher
+    prefetcher.shutdown()
+
+
+def test_prefetch_is_noop_if_not_started(fetcher: Fetcher) -> None:
+    prefetcher = MetadataPrefetcher(fetcher, max_workers=2)
+
+    prefetcher.prefetch("foo", Version.parse("1.0"))
+
+    assert not prefetcher.is_running
+    assert prefetcher.prefetched == 0
+    assert fetcher.calls == []
+
+
+def test_get_returns_prefetched_package(
+    prefetcher: MetadataPrefetcher, fetcher: Fetcher
+) -> None:
+    version = Version.parse("1.0")
+    prefetcher.prefetch("foo", version, repository_name="repo")
+    prefetcher.prefetch("foo", version, repository_name="repo")
+
+    package = prefetcher.get("foo", version, repository_name="repo")
+
+    assert package == Package("foo", "1.0")
+    assert prefetcher.prefetched == 1
+    assert fetcher.calls == [("foo", version, "repo")]
+
+
+def test_get_fetches_packages_that_have_not_been_prefetched(
+    prefetcher: MetadataPrefetcher, fetcher: Fetcher
+) -> None:
+    version = Version.parse("1.0")
+
+    package = prefetcher.get("foo", version)
+
+    assert package == Package("foo", "1.0")
+    assert prefetcher.hits == 0
+    assert fetcher.threads == {threading.current_thread().name}
+
+
+def test_prefetch_ignores_packages_that_have_already_been_requested(
+    prefetcher: MetadataPrefetcher, fetcher: Fetcher
+) -> None:
+    version = Version.parse("1.0")
+    prefetcher.get("foo", version)
+
+    prefetcher.prefetch("foo", version)
+
+    assert prefetcher.prefetched == 0
+    assert len(fetcher.calls) == 1
+
+
+def test_get_raises_errors_of_prefetched_packages(
+    prefetcher: MetadataPrefetcher,
+) -> None:
+    version = Version.parse("1.0")
+    prefetcher.prefetch("missing", version)
+
+    with pytest.raises(PackageNotFoundError):
+        prefetcher.get("missing", version)
+
+
+def test_shutdown_stops_prefetching(
+    prefetcher: MetadataPrefetcher, fetcher: Fetcher
+) -> None:
+    prefetcher.shutdown()
+
+    prefetcher.prefetch("foo", Version.parse("1.0"))
+
+    assert not prefetcher.is_running
+    assert fetcher.calls == []
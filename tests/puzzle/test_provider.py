@@ -11,6 +11,7 @@ import pytest
 
 from cleo.io.null_io import NullIO
 from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
 from poetry.core.packages.dependency import Dependency
 from poetry.core.packages.directory_dependency import DirectoryDependency
 from poetry.core.packages.file_dependency import FileDependency
@@ -21,6 +22,7 @@ from poetry.core.packages.vcs_dependency import VCSDependency
 
 from poetry.factory import Factory
 from poetry.inspection.info import PackageInfo
+from poetry.mixology.incompatibility_cause import PythonCauseError
 from poetry.packages import DependencyPackage
 from poetry.puzzle.provider import IncompatibleConstraintsError
 from poetry.puzzle.provider import Provider
@@ -38,6 +40,7 @@ if TYPE_CHECKING:
 
     from pytest_mock import MockerFixture
 
+    from poetry.repositories.legacy_repository import LegacyRepository
     from tests.types import FixtureDirGetter
 
 
@@ -889,3 +892,100 @@ def test_source_dependency_is_not_satisfied_by_incompatible_direct_origin(
     dep.source_name = repository.name
 
     assert provider.search_for(dep) == [repo_package]
+
+
+def test_prefetching_is_disabled_for_in_memory_repositories(
+    root: ProjectPackage, pool: RepositoryPool
+) -> None:
+    provider = Provider(root, pool, NullIO(), prefetch_workers=4)
+
+    with provider.use_prefetching():
+        assert not provider.is_prefetching()
+
+
+def test_complete_package_uses_prefetched_package(
+    root: ProjectPackage,
+    legacy_repository: LegacyRepository,
+    mocker: MockerFixture,
+) -> None:
+    pool = RepositoryPool([legacy_repository])
+    spy = mocker.spy(pool, "package")
+    provider = Provider(root, pool, NullIO(), prefetch_workers=4)
+    dependency = Factory.create_dependency("isort", "4.3.4")
+    package = provider.search_for(dependency)[0]
+
+    with provider.use_prefetching():
+        assert provider.is_prefetching()
+        provider.prefetch(package)
+        completed = provider.complete_package(package)
+
+    assert not provider.is_prefetching()
+    assert spy.call_count == 1
+    assert completed.package.name == "isort"
+    assert completed.package.version.text == "4.3.4"
+    assert {dep.name for dep in completed.package.requires} == {"futures"}
+
+
+def test_search_for_prefetches_metadata_of_most_likely_versions(
+    root: ProjectPackage,
+    legacy_repository: LegacyRepository,
+    mocker: MockerFixture,
+) -> None:
+    pool = RepositoryPool([legacy_repository])
+    prefetch = mocker.spy(legacy_repository, "prefetch_release_info")
+    fetch = mocker.spy(legacy_repository, "_get_info_from_metadata")
+    provider = Provider(root, pool, NullIO(), prefetch_workers=4)
+    dependency = Factory.create_dependency("isort-metadata", "*")
+
+    with provider.use_prefetching():
+        package = provider.search_for(dependency)[0]
+        completed = provider.complete_package(package)
+
+    prefetch.assert_called_once_with(
+        canonicalize_name("isort-metadata"), [Version.parse("4.3.4")]
+    )
+    assert fetch.call_count == 1
+    assert {dep.name for dep in completed.package.requires} == {"futures"}
+
+
+def test_search_for_does_not_prefetch_without_prefetching(
+    root: ProjectPackage,
+    legacy_repository: LegacyRepository,
+    mocker: MockerFixture,
+) -> None:
+    pool = RepositoryPool([legacy_repository])
+    prefetch = mocker.spy(legacy_repository, "prefetch_release_info")
+    provider = Provider(root, pool, NullIO(), prefetch_workers=4)
+
+    provider.search_for(Factory.create_dependency("isort-metadata", "*"))
+
+    prefetch.assert_not_called()
+
+
+@pytest.mark.parametrize("python", ["^3.8", "^2.7"])
+def test_complete_package_skips_metadata_of_python_incompatible_package(
+    root: ProjectPackage,
+    legacy_repository: LegacyRepository,
+    mocker: MockerFixture,
+    python: str,
+) -> None:
+    root.python_versions = python
+    pool = RepositoryPool([legacy_repository])
+    spy = mocker.spy(pool, "package")
+    provider = Provider(root, pool, NullIO())
+    dependency = Factory.create_dependency("futures", "3.2.0")
+    package = provider.search_for(dependency)[0]
+
+    completed = provider.complete_package(package)
+    incompatibilities = provider.incompatibilities_for(completed)
+
+    assert completed.package.python_versions == ">=2.6, <3"
+    if python == "^3.8":
+        # futures 3.2.0 requires Python <3 according to the project page.
+        assert spy.call_count == 0
+        assert [str(i) for i in incompatibilities] == [
+            "futures (3.2.0) requires Python >=2.6, <3"
+        ]
+    else:
+        assert spy.call_count == 1
+        assert not any(isinstance(i.cause, PythonCauseError) for i in incompatibilities)
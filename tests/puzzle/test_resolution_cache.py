@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from packaging.utils import canonicalize_name
+from poetry.core.packages.dependency_group import MAIN_GROUP
+
+from poetry.factory import Factory
+from poetry.packages import Locker
+from poetry.packages.transitive_package_info import TransitivePackageInfo
+from poetry.puzzle.resolution_cache import ResolutionCache
+from poetry.repositories import Repository
+from poetry.repositories import RepositoryPool
+from tests.helpers import get_package
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from poetry.core.packages.package import Package
+    from pytest_mock import MockerFixture
+
+    from poetry.config.config import Config
+    from poetry.repositories.legacy_repository import LegacyRepository
+
+
+@pytest.fixture
+def locker(tmp_path: Path) -> Locker:
+    return Locker(
+        tmp_path / "poetry.lock",
+        {"tool": {"poetry": {"dependencies": {"black": "*"}}}},
+    )
+
+
+@pytest.fixture
+def pool(legacy_repository: LegacyRepository) -> RepositoryPool:
+    return RepositoryPool([legacy_repository])
+
+
+@pytest.fixture
+def packages(
+    legacy_repository: LegacyRepository,
+) -> dict[Package, TransitivePackageInfo]:
+    dependency = Factory.create_dependency("black", "*")
+    package = legacy_repository.find_packages(dependency)[0]
+    package.files = []
+    return {package: TransitivePackageInfo(0, {MAIN_GROUP}, {})}
+
+
+def test_get_returns_cached_resolution(
+    locker: Locker,
+    pool: RepositoryPool,
+    config: Config,
+    packages: dict[Package, TransitivePackageInfo],
+) -> None:
+    cache = ResolutionCache(locker, pool, config)
+    assert cache.get([], []) is None
+
+    cache.put([], [], packages)
+
+    cached = cache.get([], [])
+    assert cached is not None
+    assert list(cached) == list(packages)
+    assert cache.get([], [canonicalize_name("black")]) is None
+
+
+def test_get_ignores_outdated_resolution(
+    locker: Locker,
+    pool: RepositoryPool,
+    legacy_repository: LegacyRepository,
+    config: Config,
+    packages: dict[Package, TransitivePackageInfo],
+    mocker: MockerFixture,
+) -> None:
+    cache = ResolutionCache(locker, pool, config)
+    cache.put([], [], packages)
+
+    mocker.patch.object(legacy_repository, "get_page_fingerprint", return_value="")
+
+    assert cache.get([], []) is None
+
+
+def test_resolution_is_not_cached_for_direct_origin_packages(
+    locker: Locker,
+    pool: RepositoryPool,
+    config: Config,
+    packages: dict[Package, TransitivePackageInfo],
+) -> None:
+    cache = ResolutionCache(locker, pool, config)
+    package = get_package("demo", "0.1.0")
+    package._source_type = "url"
+    package._source_url = "https://example.com/demo-0.1.0.tar.gz"
+
+    cache.put([], [], {**packages, package: TransitivePackageInfo(0, set(), {})})
+
+    assert cache.get([], []) is None
+
+
+def test_resolution_cache_is_not_supported_for_other_repositories(
+    locker: Locker, config: Config
+) -> None:
+    pool = RepositoryPool([Repository("repo", [get_package("foo", "1.0")])])
+    cache = ResolutionCache(locker, pool, config)
+
+    assert not cache.is_supported
+    cache.put([], [], {get_package("foo", "1.0"): TransitivePackageInfo(0, set(), {})})
+    assert cache.get([], []) is None
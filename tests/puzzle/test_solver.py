@@ -393,6 +393,28 @@ def test_solver_fails_if_mismatch_root_python_versions(
         solver.solve()
 
 
+@pytest.mark.parametrize("fail", [False, True])
+def test_solver_cancels_background_work_of_pool(
+    solver: Solver,
+    repo: Repository,
+    package: ProjectPackage,
+    pool: RepositoryPool,
+    mocker: MockerFixture,
+    fail: bool,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "2.0" if fail else "*"))
+    repo.add_package(get_package("A", "1.0"))
+    cancel = mocker.spy(pool, "cancel_background_work")
+
+    if fail:
+        with pytest.raises(SolverProblemError):
+            solver.solve()
+    else:
+        solver.solve()
+
+    cancel.assert_called_once()
+
+
 def test_solver_ignores_python_restricted_if_mismatch_root_package_python_versions(
     solver: Solver, repo: Repository, package: ProjectPackage
 ) -> None:
@@ -5116,3 +5138,105 @@ def test_solver_resolves_duplicate_dependencies_with_restricted_extras(
             ]
         ),
     )
+
+
+def test_solver_incremental_uses_locked_dependencies(
+    package: ProjectPackage,
+    repo: Repository,
+    pool: RepositoryPool,
+    io: NullIO,
+    mocker: MockerFixture,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "*"))
+    package.add_dependency(Factory.create_dependency("C", "*"))
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(Factory.create_dependency("B", "^1.0"))
+    package_b = get_package("B", "1.0")
+    package_c = get_package("C", "1.0")
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+    repo.add_package(package_c)
+
+    locked_a = get_package("A", "1.0")
+    locked_a.add_dependency(Factory.create_dependency("B", "^1.0"))
+    locked_b = get_package("B", "1.0")
+
+    spy = mocker.spy(pool, "package")
+    solver = Solver(package, pool, [], [locked_a, locked_b], io)
+    transaction = solver.solve(incremental=True)
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": package_b},
+            {"job": "install", "package": package_a},
+            {"job": "install", "package": package_c},
+        ],
+    )
+    assert [c.args[0] for c in spy.call_args_list] == ["C"]
+
+
+def test_solver_incremental_fetches_dependencies_of_new_extras(
+    package: ProjectPackage,
+    repo: Repository,
+    pool: RepositoryPool,
+    io: NullIO,
+) -> None:
+    package.add_dependency(
+        Factory.create_dependency("A", {"version": "*", "extras": ["foo"]})
+    )
+
+    package_a = get_package("A", "1.0")
+    dep_b = Factory.create_dependency("B", {"version": "^1.0", "optional": True})
+    dep_b._in_extras = [canonicalize_name("foo")]
+    package_a.add_dependency(dep_b)
+    package_a.extras = {canonicalize_name("foo"): [dep_b]}
+    package_b = get_package("B", "1.0")
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+
+    # "A" has been locked without extras so that its optional dependency is missing.
+    locked_a = get_package("A", "1.0")
+    locked_a.extras = {canonicalize_name("foo"): [dep_b]}
+
+    solver = Solver(package, pool, [], [locked_a], io)
+    transaction = solver.solve(incremental=True)
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": package_b},
+            {"job": "install", "package": package_a},
+        ],
+    )
+
+
+def test_solver_incremental_falls_back_to_full_resolution(
+    package: ProjectPackage,
+    repo: Repository,
+    pool: RepositoryPool,
+    io: NullIO,
+) -> None:
+    package.add_dependency(Factory.create_dependency("A", "*"))
+
+    package_a = get_package("A", "1.0")
+    package_a.add_dependency(Factory.create_dependency("B", "^1.0"))
+    package_b = get_package("B", "1.0")
+    repo.add_package(package_a)
+    repo.add_package(package_b)
+
+    # The locked dependencies of "A" cannot be satisfied.
+    locked_a = get_package("A", "1.0")
+    locked_a.add_dependency(Factory.create_dependency("B", "^2.0"))
+
+    solver = Solver(package, pool, [], [locked_a], io)
+    transaction = solver.solve(incremental=True)
+
+    check_solver_result(
+        transaction,
+        [
+            {"job": "install", "package": package_b},
+            {"job": "install", "package": package_a},
+        ],
+    )
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from packaging.utils import canonicalize_name
@@ -10,8 +11,10 @@ from poetry.core.version.markers import parse_marker
 
 from poetry.factory import Factory
 from poetry.packages.transitive_package_info import TransitivePackageInfo
+from poetry.puzzle.solver import MarkerCache
 from poetry.puzzle.solver import PackageNode
 from poetry.puzzle.solver import Solver
+from poetry.puzzle.solver import calculate_markers
 from poetry.puzzle.solver import depth_first_search
 from poetry.puzzle.solver import merge_override_packages
 
@@ -21,6 +24,9 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from poetry.core.packages.project_package import ProjectPackage
+    from pytest_mock import MockerFixture
+
+    from poetry.puzzle.solver import MarkerOriginDict
 
 
 def dep(
@@ -356,6 +362,69 @@ def test_propagate_markers_with_cycle(package: ProjectPackage, solver: Solver) -
     }
 
 
+def test_propagate_markers_with_cycle_recalculates_only_affected_packages(
+    package: ProjectPackage, mocker: MockerFixture
+) -> None:
+    a = Package("a", "1")
+    b = Package("b", "1")
+    c = Package("c", "1")
+    marker_a = parse_marker('sys_platform == "win32"')
+    marker_b = parse_marker('sys_platform == "linux"')
+    marker_c = parse_marker('sys_platform == "darwin"')
+    packages = {
+        package: TransitivePackageInfo(-1, {"main"}, {"main": AnyMarker()}),
+        a: TransitivePackageInfo(0, {"main"}, {}),
+        b: TransitivePackageInfo(1, {"main"}, {}),
+        c: TransitivePackageInfo(0, {"main"}, {}),
+    }
+    markers: MarkerOriginDict = defaultdict(lambda: defaultdict(AnyMarker))
+    markers[a][package] = marker_a
+    markers[a][b] = parse_marker('python_version == "3.9"')
+    markers[b][package] = marker_b
+    markers[b][a] = parse_marker('python_version == "3.8"')
+    markers[c][package] = marker_c
+
+    marker_cache = MarkerCache()
+    intersect = mocker.spy(marker_cache, "intersect")
+    calculate_markers(packages, markers, marker_cache)
+
+    assert tm(packages[a]) == {
+        "main": (
+            'sys_platform == "linux" and python_version == "3.9"'
+            ' or sys_platform == "win32"'
+        )
+    }
+    assert tm(packages[b]) == {
+        "main": (
+            'sys_platform == "win32" and python_version == "3.8"'
+            ' or sys_platform == "linux"'
+        )
+    }
+    assert tm(packages[c]) == {"main": 'sys_platform == "darwin"'}
+    # The cycle requires a second pass for "a" and "b" but not for "c".
+    assert [call.args[1] for call in intersect.call_args_list].count(marker_c) == 1
+
+
+def test_marker_cache_returns_interned_results() -> None:
+    marker_cache = MarkerCache()
+    marker1 = parse_marker('sys_platform == "win32"')
+    marker2 = parse_marker('python_version >= "3.9"')
+
+    union = marker_cache.union(marker1, marker2)
+    intersection = marker_cache.intersect(marker1, marker2)
+    assert union == marker1.union(marker2)
+    assert intersection == marker1.intersect(marker2)
+    assert (marker_cache.hits, marker_cache.misses) == (0, 2)
+
+    # Equal markers that are different objects hit the cache as well.
+    assert marker_cache.union(marker1, parse_marker(str(marker2))) is union
+    assert marker_cache.intersect(marker1, parse_marker(str(marker2))) is intersection
+    assert (marker_cache.hits, marker_cache.misses) == (2, 2)
+
+    marker_cache.clear()
+    assert (marker_cache.hits, marker_cache.misses) == (0, 0)
+
+
 def test_merge_override_packages_restricted(package: ProjectPackage) -> None:
     """Markers of dependencies should be intersected with override markers."""
     a = Package("a", "1")
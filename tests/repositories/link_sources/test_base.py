@@ -99,3 +99,38 @@ def test_links_for_version(
         set(link_source.links_for_version(canonicalize_name("demo"), version))
         == expected
     )
+
+
+@pytest.mark.parametrize(
+    "requires_python, expected",
+    [
+        ([">=3.9", ">=3.9"], ">=3.9"),
+        ([">=3.9", ">=3.8"], None),
+        ([">=3.9", None], None),
+        ([None, None], None),
+        ([], None),
+    ],
+)
+def test_requires_python(
+    requires_python: list[str | None], expected: str | None, mocker: MockerFixture
+) -> None:
+    url = "https://example.org"
+    link_source = LinkSource(url)
+    version = Version.parse("0.1.0")
+    mocker.patch(
+        f"{LinkSource.__module__}.{LinkSource.__qualname__}._link_cache",
+        new_callable=PropertyMock,
+        return_value={
+            canonicalize_name("demo"): defaultdict(
+                list,
+                {
+                    version: [
+                        Link(f"{url}/demo-0.1.0-{i}.whl", requires_python=value)
+                        for i, value in enumerate(requires_python)
+                    ]
+                },
+            )
+        },
+    )
+
+    assert link_source.requires_python(canonicalize_name("demo"), version) == expected
@@ -167,3 +167,39 @@ def test_base_url(
     page = HTMLPage("https://example.org", content)
     link = next(iter(page.links))
     assert link.url == expected
+
+
+def test_fingerprint_does_not_depend_on_order_of_links(
+    html_page_content: HTMLPageGetter,
+) -> None:
+    anchors = [
+        '<a href="https://example.org/demo-0.1.whl">demo-0.1.whl</a><br/>',
+        '<a href="https://example.org/demo-0.2.whl">demo-0.2.whl</a><br/>',
+    ]
+    page = HTMLPage("https://example.org", html_page_content("".join(anchors)))
+    reversed_page = HTMLPage(
+        "https://example.org", html_page_content("".join(reversed(anchors)))
+    )
+
+    assert page.fingerprint == reversed_page.fingerprint
+
+
+@pytest.mark.parametrize(
+    "attributes",
+    [
+        'data-requires-python="&gt;=3.7"',
+        "data-yanked",
+        'data-yanked="&lt;reason&gt;"',
+        'data-dist-info-metadata="sha256=abcd"',
+    ],
+)
+def test_fingerprint_changes_with_relevant_attributes(
+    html_page_content: HTMLPageGetter, attributes: str
+) -> None:
+    anchor = '<a href="https://example.org/demo-0.1.whl" {}>demo-0.1.whl</a><br/>'
+    page = HTMLPage("https://example.org", html_page_content(anchor.format("")))
+    changed_page = HTMLPage(
+        "https://example.org", html_page_content(anchor.format(attributes))
+    )
+
+    assert page.fingerprint != changed_page.fingerprint
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from packaging.utils import canonicalize_name
+from poetry.core.constraints.version import Version
+
+from poetry.repositories.link_sources.html import HTMLPage
+from poetry.repositories.link_sources.index import IndexedPage
+from poetry.repositories.link_sources.index import PageIndex
+from poetry.repositories.link_sources.json import SimpleJsonPage
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from poetry.core.packages.utils.link import Link
+
+    from poetry.repositories.link_sources.base import LinkSource
+    from tests.types import HTMLPageGetter
+
+
+def _link_data(link: Link) -> tuple[object, ...]:
+    return (
+        link.url,
+        link.requires_python,
+        dict(link.hashes),
+        link.has_metadata,
+        dict(link.metadata_hashes),
+        link.yanked,
+        link.yanked_reason,
+    )
+
+
+def _assert_same_links(page: LinkSource, indexed: LinkSource) -> None:
+    assert sorted(map(_link_data, indexed.links)) == sorted(map(_link_data, page.links))
+    assert indexed.fingerprint == page.fingerprint
+
+
+def test_indexed_html_page(html_page_content: HTMLPageGetter, tmp_path: Path) -> None:
+    content = html_page_content(
+        """
+        <a href="https://example.org/demo-0.1.tar.gz#sha256=abcd">demo-0.1.tar.gz</a>
+        <a href="https://example.org/demo-0.1-py3-none-any.whl#md5=1234"
+           data-requires-python="&gt;=3.7" data-dist-info-metadata="sha256=ef01"
+           data-yanked="&lt;reason&gt;">demo-0.1-py3-none-any.whl</a>
+        <a href="https://example.org/demo-0.2-py3-none-any.whl"
+           data-core-metadata data-yanked>demo-0.2-py3-none-any.whl</a>
+        """
+    )
+    page = HTMLPage("https://example.org/simple/demo/", content)
+    index = PageIndex(tmp_path)
+    name = canonicalize_name("demo")
+
+    index.put(name, IndexedPage.from_page(page, etag='"v1"', last_modified="yesterday"))
+    indexed = index.get(name)
+
+    assert indexed is not None
+    assert indexed.url == page.url
+    assert indexed.etag == '"v1"'
+    assert indexed.last_modified == "yesterday"
+    _assert_same_links(page, indexed)
+    assert set(indexed.versions(name)) == {Version.parse("0.1"), Version.parse("0.2")}
+    assert indexed.yanked(name, Version.parse("0.2")) is True
+    assert indexed.requires_python(name, Version.parse("0.1")) is None
+
+
+def test_indexed_json_page(tmp_path: Path) -> None:
+    content = {
+        "files": [
+            {
+                "url": "demo-0.1-py3-none-any.whl",
+                "hashes": {"sha256": "abcd"},
+                "requires-python": ">=3.8",
+                "core-metadata": {"sha256": "ef01"},
+                "yanked": "broken",
+            }
+        ]
+    }
+    page = SimpleJsonPage("https://example.org/simple/demo/", content)
+    index = PageIndex(tmp_path)
+    name = canonicalize_name("demo")
+
+    index.put(name, IndexedPage.from_page(page, etag=None, last_modified="today"))
+    indexed = index.get(name)
+
+    assert indexed is not None
+    _assert_same_links(page, indexed)
+
+
+@pytest.mark.parametrize(
+    ("etag", "last_modified", "expected"),
+    [
+        ('"v1"', "yesterday", True),
+        ('"v1"', None, True),
+        ('"v1"', "today", True),
+        ('"v2"', "yesterday", False),
+        (None, "yesterday", False),
+        (None, None, False),
+    ],
+)
+def test_indexed_page_is_valid_with_etag(
+    etag: str | None, last_modified: str | None, expected: bool
+) -> None:
+    indexed = IndexedPage(
+        "https://example.org/simple/demo/",
+        etag='"v1"',
+        last_modified="yesterday",
+        fingerprint="",
+        files={},
+    )
+
+    assert indexed.is_valid(etag, last_modified) is expected
+
+
+@pytest.mark.parametrize(
+    ("etag", "last_modified", "expected"),
+    [
+        (None, "yesterday", True),
+        (None, "today", False),
+        (None, None, False),
+        ('"v1"', "yesterday", False),
+    ],
+)
+def test_indexed_page_is_valid_with_last_modified(
+    etag: str | None, last_modified: str | None, expected: bool
+) -> None:
+    indexed = IndexedPage(
+        "https://example.org/simple/demo/",
+        etag=None,
+        last_modified="yesterday",
+        fingerprint="",
+        files={},
+    )
+
+    assert indexed.is_valid(etag, last_modified) is expected
+
+
+@pytest.mark.parametrize("content", [b"", b"invalid", b"x\x9c\x03\x00\x00\x00\x00\x01"])
+def test_page_index_ignores_invalid_index(tmp_path: Path, content: bytes) -> None:
+    index = PageIndex(tmp_path)
+    name = canonicalize_name("demo")
+    (tmp_path / "demo.idx").write_bytes(content)
+
+    assert index.get(name) is None
+    assert index.get(canonicalize_name("missing")) is None
@@ -77,3 +77,43 @@ def test_metadata(
     link = next(page.links)
     assert link.has_metadata is expected_has_metadata
     assert link.metadata_hashes == expected_metadata_hashes
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "https://files.example.org/demo-0.1-py3-none-any.whl",
+            "https://files.example.org/demo-0.1-py3-none-any.whl",
+        ),
+        (
+            "/files/demo-0.1-py3-none-any.whl",
+            "https://example.org/files/demo-0.1-py3-none-any.whl",
+        ),
+        (
+            "demo-0.1-py3-none-any.whl",
+            "https://example.org/simple/demo/demo-0.1-py3-none-any.whl",
+        ),
+    ],
+)
+def test_relative_urls(url: str, expected: str) -> None:
+    content = {"files": [{"url": url}]}
+    page = SimpleJsonPage("https://example.org/simple/demo/", content)
+
+    link = next(page.links)
+    assert link.url == expected
+
+
+def test_hashes() -> None:
+    content = {
+        "files": [
+            {
+                "url": "https://example.org/demo-0.1-py3-none-any.whl",
+                "hashes": {"sha256": "abcd", "md5": "1234"},
+            }
+        ]
+    }
+    page = SimpleJsonPage("https://example.org", content)
+
+    link = next(page.links)
+    assert link.hashes == {"sha256": "abcd", "md5": "1234"}
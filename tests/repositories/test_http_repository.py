@@ -11,11 +11,14 @@ from zipfile import ZipFile
 import pytest
 
 from packaging.metadata import parse_email
+from packaging.utils import canonicalize_name
 from poetry.core.packages.utils.link import Link
 
 from poetry.inspection.info import PackageInfoError
 from poetry.inspection.lazy_wheel import HTTPRangeRequestUnsupportedError
+from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.http_repository import HTTPRepository
+from poetry.repositories.link_sources.html import HTMLPage
 from poetry.utils.helpers import HTTPRangeRequestSupportedError
 
 
@@ -73,7 +76,7 @@ def test_get_info_from_wheel(
 
     if lazy_wheel and supports_range_requests is not False:
         mock_metadata_from_wheel_url.assert_called_once_with(
-            filename, url, repo.session
+            filename, url, repo.session, cache=repo._range_cache
         )
         mock_download.assert_not_called()
         assert repo._supports_range_requests[domain] is True
@@ -243,3 +246,28 @@ def test_calculate_sha256_defaults_to_sha256_on_md5_errors(
         calculated_hash
         == "sha256:e216b70f013c47b82a72540d34347632c5bfe59fd54f5fe5d51f6a68b19aaf84"
     )
+
+
+def test_page_fingerprints(mocker: MockerFixture) -> None:
+    repo = MockRepository()
+    page = HTMLPage(
+        "https://foo.com/demo/",
+        '<a href="https://foo.com/demo-0.1.whl">demo-0.1.whl</a>',
+    )
+
+    def get_page(name: NormalizedName) -> HTMLPage:
+        if name == "demo":
+            return page
+        raise PackageNotFoundError(f"Package [{name}] not found.")
+
+    mock_get_page = mocker.patch.object(repo, "_get_page", side_effect=get_page)
+
+    assert repo.get_page(canonicalize_name("demo")) is page
+    with pytest.raises(PackageNotFoundError):
+        repo.get_page(canonicalize_name("missing"))
+
+    assert repo.page_fingerprints == {"demo": page.fingerprint, "missing": None}
+
+    assert repo.get_page_fingerprint(canonicalize_name("demo")) == page.fingerprint
+    assert repo.get_page_fingerprint(canonicalize_name("missing")) is None
+    assert mock_get_page.call_count == 4
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import base64
+import json
 import re
 
 from typing import TYPE_CHECKING
+from typing import Any
 
 import pytest
 import requests
@@ -17,16 +19,21 @@ from poetry.factory import Factory
 from poetry.repositories.exceptions import PackageNotFoundError
 from poetry.repositories.exceptions import RepositoryError
 from poetry.repositories.legacy_repository import LegacyRepository
+from poetry.repositories.link_sources.html import HTMLPage
+from poetry.repositories.link_sources.index import IndexedPage
+from poetry.repositories.link_sources.json import SimpleJsonPage
 
 
 if TYPE_CHECKING:
     import httpretty
 
+    from httpretty.core import HTTPrettyRequest
     from pytest import MonkeyPatch
     from pytest_mock import MockerFixture
 
     from poetry.config.config import Config
     from tests.types import DistributionHashGetter
+    from tests.types import HTTPrettyRequestCallback
 
 
 @pytest.fixture(autouse=True)
@@ -181,6 +188,114 @@ def test_get_package_information_pep_658(
         )
 
 
+def test_prefetch_release_info_pep_658(
+    mocker: MockerFixture, legacy_repository: LegacyRepository
+) -> None:
+    repo = legacy_repository
+    spy = mocker.spy(repo, "_get_info_from_metadata")
+    name = canonicalize_name("isort-metadata")
+    version = Version.parse("4.3.4")
+
+    # The project page has not been retrieved yet.
+    repo.prefetch_release_info(name, [version])
+    assert not repo._prefetched
+
+    repo.get_page(name)
+    repo.prefetch_release_info(name, [version, Version.parse("5.0.0")])
+    repo.prefetch_release_info(name, [version])
+    assert list(repo._prefetched) == [(name, version)]
+
+    info = repo.get_release_info(name, version)
+
+    assert spy.call_count == 1
+    assert info.requires_dist == ['futures; python_version=="2.7"']
+    assert not repo._prefetched
+
+
+def test_prefetch_release_info_requires_metadata(
+    legacy_repository: LegacyRepository,
+) -> None:
+    repo = legacy_repository
+    name = canonicalize_name("isort")
+    repo.get_page(name)
+
+    repo.prefetch_release_info(name, [Version.parse("4.3.4")])
+
+    assert not repo._prefetched
+
+
+@pytest.mark.parametrize("backend", ["file", "sqlite"])
+def test_prefetch_release_info_skips_cached_releases(
+    http: type[httpretty.httpretty],
+    legacy_repository_html_callback: HTTPrettyRequestCallback,
+    mock_files_python_hosted: None,
+    config: Config,
+    backend: str,
+) -> None:
+    http.register_uri(
+        http.GET,
+        re.compile("^https://legacy.(.*)+/?(.*)?$"),
+        body=legacy_repository_html_callback,
+    )
+    config.merge({"cache": {"backend": backend}})
+    repo = LegacyRepository("legacy", "https://legacy.foo.bar", config=config)
+    name = canonicalize_name("isort-metadata")
+    version = Version.parse("4.3.4")
+    repo.get_page(name)
+    repo.get_release_info(name, version)
+
+    repo = LegacyRepository("legacy", "https://legacy.foo.bar", config=config)
+    repo.get_page(name)
+    repo.prefetch_release_info(name, [version])
+
+    assert not repo._prefetched
+    assert repo.get_release_info(name, version).requires_dist == [
+        'futures; python_version=="2.7"'
+    ]
+
+
+def test_get_release_info_retries_failed_prefetch(
+    mocker: MockerFixture, legacy_repository: LegacyRepository
+) -> None:
+    repo = legacy_repository
+    name = canonicalize_name("isort-metadata")
+    version = Version.parse("4.3.4")
+    repo.get_page(name)
+    mocker.patch.object(
+        repo, "_fetch_release_info", side_effect=RepositoryError("failed")
+    )
+
+    repo.prefetch_release_info(name, [version])
+    info = repo.get_release_info(name, version)
+
+    assert info.requires_dist == ['futures; python_version=="2.7"']
+
+
+def test_cancel_background_work_cancels_prefetching(
+    mocker: MockerFixture, legacy_repository: LegacyRepository
+) -> None:
+    repo = legacy_repository
+    name = canonicalize_name("isort-metadata")
+    version = Version.parse("4.3.4")
+    repo.get_page(name)
+    repo.prefetch_release_info(name, [version])
+    executor = repo._executor
+    assert executor is not None
+    shutdown = mocker.spy(executor, "shutdown")
+
+    repo.cancel_background_work()
+
+    shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+    assert repo._executor is None
+    assert not repo._prefetched
+    # The repository can still be used and prefetch again.
+    repo.prefetch_release_info(name, [version])
+    assert list(repo._prefetched) == [(name, version)]
+    info = repo.get_release_info(name, version)
+    assert info.requires_dist == ['futures; python_version=="2.7"']
+    repo.cancel_background_work()
+
+
 def test_get_package_information_skips_dependencies_with_invalid_constraints(
     legacy_repository: LegacyRepository,
 ) -> None:
@@ -278,6 +393,23 @@ def test_find_packages_yanked(
     assert [str(p.version) for p in packages] == expected
 
 
+def test_requires_python_from_retrieved_page(
+    legacy_repository: LegacyRepository,
+) -> None:
+    repo = legacy_repository
+    name = canonicalize_name("futures")
+    version = Version.parse("3.2.0")
+
+    # The project page has not been retrieved yet.
+    assert repo.requires_python(name, version) is None
+
+    repo.find_packages(Factory.create_dependency("futures", "*"))
+
+    assert repo.requires_python(name, version) == ">=2.6, <3"
+    with pytest.raises(PackageNotFoundError):
+        repo.requires_python(name, Version.parse("1.0"))
+
+
 def test_get_package_information_chooses_correct_distribution(
     legacy_repository: LegacyRepository,
 ) -> None:
@@ -582,7 +714,10 @@ def test_get_redirected_response_url(
     redirect_url = "http://legacy.redirect.bar"
 
     def get_mock(
-        url: str, raise_for_status: bool = True, timeout: int = 5
+        url: str,
+        raise_for_status: bool = True,
+        timeout: int = 5,
+        headers: dict[str, str] | None = None,
     ) -> requests.Response:
         response = requests.Response()
         response.status_code = 200
@@ -595,6 +730,108 @@ def test_get_redirected_response_url(
     assert page._url == "http://legacy.redirect.bar/foo"
 
 
+def test_get_page_requests_json_and_falls_back_to_html(
+    http: type[httpretty.httpretty],
+) -> None:
+    repo = MockHttpRepository({"/foo/": 200}, http)
+
+    page = repo.get_page("foo")
+
+    accept = http.last_request().headers["Accept"]
+    assert accept.startswith("application/vnd.pypi.simple.v1+json, ")
+    assert "text/html" in accept
+    assert isinstance(page, HTMLPage)
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    [
+        "application/vnd.pypi.simple.v1+json",
+        "application/vnd.pypi.simple.v1+json; charset=utf-8",
+    ],
+)
+def test_get_page_json(http: type[httpretty.httpretty], content_type: str) -> None:
+    repo = LegacyRepository("legacy", url="http://legacy.foo.bar", disable_cache=True)
+    content = {
+        "meta": {"api-version": "1.0"},
+        "name": "foo",
+        "files": [
+            {
+                "filename": "foo-1.0-py3-none-any.whl",
+                "url": "../../files/foo-1.0-py3-none-any.whl",
+                "hashes": {"sha256": "abcd"},
+                "requires-python": ">=3.9",
+                "core-metadata": True,
+            }
+        ],
+    }
+    http.register_uri(
+        http.GET,
+        "http://legacy.foo.bar/foo/",
+        body=json.dumps(content),
+        content_type=content_type,
+    )
+
+    page = repo.get_page("foo")
+
+    assert isinstance(page, SimpleJsonPage)
+    link = next(page.links)
+    assert link.url == "http://legacy.foo.bar/files/foo-1.0-py3-none-any.whl"
+    assert link.hashes == {"sha256": "abcd"}
+    assert link.requires_python == ">=3.9"
+    assert link.has_metadata
+    assert [
+        p.version.text
+        for p in repo.find_packages(Factory.create_dependency("foo", "*"))
+    ] == ["1.0"]
+
+
+def test_get_page_invalid_json(http: type[httpretty.httpretty]) -> None:
+    repo = LegacyRepository("legacy", url="http://legacy.foo.bar", disable_cache=True)
+    http.register_uri(
+        http.GET,
+        "http://legacy.foo.bar/foo/",
+        body="<html></html>",
+        content_type="application/vnd.pypi.simple.v1+json",
+    )
+
+    with pytest.raises(RepositoryError, match="Invalid JSON project page"):
+        repo.get_page("foo")
+
+
+def test_get_page_revalidates_indexed_page(
+    http: type[httpretty.httpretty], config: Config
+) -> None:
+    body = (
+        '<a href="https://legacy.foo.bar/files/foo-1.0-py3-none-any.whl#sha256=abcd"'
+        ' data-requires-python="&gt;=3.9">foo-1.0-py3-none-any.whl</a>'
+    )
+
+    def callback(
+        request: HTTPrettyRequest, uri: str, headers: dict[str, Any]
+    ) -> tuple[int, dict[str, Any], str]:
+        headers["ETag"] = '"v1"'
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, headers, ""
+        return 200, headers, body
+
+    http.register_uri(http.GET, "https://legacy.foo.bar/foo/", body=callback)
+
+    repo = LegacyRepository("legacy", url="https://legacy.foo.bar", config=config)
+    page = repo.get_page("foo")
+    assert isinstance(page, HTMLPage)
+    assert "If-None-Match" not in http.last_request().headers
+
+    repo = LegacyRepository("legacy", url="https://legacy.foo.bar", config=config)
+    indexed = repo.get_page("foo")
+    assert isinstance(indexed, IndexedPage)
+    assert http.last_request().headers["If-None-Match"] == '"v1"'
+    assert [
+        (link.url, link.requires_python, link.hashes) for link in indexed.links
+    ] == [(link.url, link.requires_python, link.hashes) for link in page.links]
+    assert indexed.fingerprint == page.fingerprint
+
+
 @pytest.mark.parametrize(
     ("repositories",),
     [
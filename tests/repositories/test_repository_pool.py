@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import threading
+
+from typing import TYPE_CHECKING
+
 import pytest
 
+from packaging.utils import canonicalize_name
 from poetry.core.constraints.version import Version
 
 from poetry.repositories import Repository
@@ -13,6 +18,14 @@ from tests.helpers import get_dependency
 from tests.helpers import get_package
 
 
+if TYPE_CHECKING:
+    from poetry.core.packages.dependency import Dependency
+    from poetry.core.packages.package import Package
+    from pytest_mock import MockerFixture
+
+    from poetry.config.config import Config
+
+
 def test_pool() -> None:
     pool = RepositoryPool()
 
@@ -181,6 +194,88 @@ def test_pool_find_packages_only_considers_supplemental_when_needed() -> None:
     assert returned_packages_needs_supplemental == [package2]
 
 
+@pytest.fixture
+def parallel_config(config: Config) -> Config:
+    config.merge({"solver": {"parallel-sources": True, "max-workers": 4}})
+    return config
+
+
+class SlowRepository(Repository):
+    """
+    A repository whose lookups only finish when all other lookups have started.
+    """
+
+    def __init__(
+        self, name: str, packages: list[Package], barrier: threading.Barrier
+    ) -> None:
+        super().__init__(name, packages)
+        self._barrier = barrier
+
+    def find_packages(self, dependency: Dependency) -> list[Package]:
+        self._barrier.wait(timeout=5)
+        return super().find_packages(dependency)
+
+    def package(self, name: str, version: Version) -> Package:
+        self._barrier.wait(timeout=5)
+        return super().package(name, version)
+
+
+def test_pool_parallel_lookups_are_concurrent(parallel_config: Config) -> None:
+    package1 = get_package("foo", "1.0.0")
+    package2 = get_package("foo", "2.0.0")
+    barrier = threading.Barrier(3)
+    pool = RepositoryPool(config=parallel_config)
+    pool.add_repository(SlowRepository("repo1", [package1], barrier))
+    pool.add_repository(SlowRepository("repo2", [package2], barrier))
+    pool.add_repository(
+        SlowRepository("repo3", [], barrier), priority=Priority.SUPPLEMENTAL
+    )
+
+    assert pool.find_packages(get_dependency("foo")) == [package1, package2]
+
+    barrier.reset()
+    assert pool.package("foo", Version.parse("2.0.0")) == package2
+
+
+def test_pool_parallel_lookups_keep_priority_order(
+    parallel_config: Config, mocker: MockerFixture
+) -> None:
+    package1 = get_package("foo", "1.0.0")
+    package2 = get_package("foo", "2.0.0")
+    repo1 = Repository("repo1", [package1, package2])
+    repo2 = Repository("repo2", [package1])
+    supplemental = Repository("supplemental", [package2])
+    pool = RepositoryPool(config=parallel_config)
+    pool.add_repository(repo1)
+    pool.add_repository(repo2)
+    pool.add_repository(supplemental, priority=Priority.SUPPLEMENTAL)
+    # Lookups in sources with a lower priority must not matter
+    # if a source with a higher priority already provides the package.
+    mocker.patch.object(supplemental, "find_packages", side_effect=RuntimeError)
+    mocker.patch.object(supplemental, "package", side_effect=RuntimeError)
+
+    assert pool.find_packages(get_dependency("foo")) == [
+        package1,
+        package2,
+        package1,
+    ]
+    assert pool.package("foo", Version.parse("2.0.0")) is package2
+
+    with pytest.raises(RuntimeError):
+        pool.find_packages(get_dependency("foo", "3.0.0"))
+
+
+def test_pool_parallel_lookups_raise_package_not_found(
+    parallel_config: Config,
+) -> None:
+    pool = RepositoryPool(config=parallel_config)
+    pool.add_repository(Repository("repo1"))
+    pool.add_repository(Repository("repo2"))
+
+    with pytest.raises(PackageNotFoundError):
+        pool.package("foo", Version.parse("1.0.0"))
+
+
 def test_pool_get_package_in_specified_repository() -> None:
     package = get_package("foo", "1.0.0")
     repo1 = Repository("repo1", [package])
@@ -212,6 +307,33 @@ def test_pool_no_package_from_specified_repository_raises_package_not_found() ->
         pool.package("foo", Version.parse("1.0.0"), repository_name="repo1")
 
 
+def test_pool_requires_python_from_the_repository_with_the_package(
+    mocker: MockerFixture,
+) -> None:
+    repo1 = Repository("repo1")
+    repo2 = Repository("repo2")
+    repo3 = Repository("repo3")
+    mocker.patch.object(
+        repo1, "requires_python", side_effect=PackageNotFoundError("not found")
+    )
+    mocker.patch.object(repo2, "requires_python", return_value=">=3.9")
+    mocker.patch.object(repo3, "requires_python", return_value=">=3.10")
+    pool = RepositoryPool([repo1, repo2, repo3])
+    name = canonicalize_name("foo")
+    version = Version.parse("1.0.0")
+
+    assert pool.requires_python(name, version) == ">=3.9"
+    assert pool.requires_python(name, version, repository_name="repo3") == ">=3.10"
+
+
+def test_pool_requires_python_is_unknown_for_in_memory_repositories() -> None:
+    package = get_package("foo", "1.0.0")
+    package.python_versions = ">=3.9"
+    pool = RepositoryPool([Repository("repo", [package])])
+
+    assert pool.requires_python(package.name, package.version) is None
+
+
 def test_pool_find_packages_in_any_repository() -> None:
     package1 = get_package("foo", "1.1.1")
     package2 = get_package("foo", "1.2.3")
@@ -282,3 +404,28 @@ def test_search_legacy_repositories_are_not_skipped(
 
     assert repo1.search("demo") == []
     assert repo2.search("demo") == pool.search("demo") == [demo_package]
+
+
+def test_pool_cancel_background_work_shuts_down_lookups_and_repositories(
+    parallel_config: Config, mocker: MockerFixture
+) -> None:
+    package = get_package("foo", "1.0.0")
+    repo1 = Repository("repo1", [package])
+    repo2 = Repository("repo2", [package])
+    pool = RepositoryPool([repo1, repo2], config=parallel_config)
+    assert pool.find_packages(get_dependency("foo")) == [package, package]
+    executor = pool._executor
+    assert executor is not None
+    shutdown = mocker.spy(executor, "shutdown")
+    cancel1 = mocker.spy(repo1, "cancel_background_work")
+    cancel2 = mocker.spy(repo2, "cancel_background_work")
+
+    pool.cancel_background_work()
+
+    shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+    cancel1.assert_called_once()
+    cancel2.assert_called_once()
+    assert pool._executor is None
+    # Lookups are still possible afterwards.
+    assert pool.find_packages(get_dependency("foo")) == [package, package]
+    pool.cancel_background_work()
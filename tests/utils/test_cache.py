@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import concurrent.futures
+import os
 import shutil
+import time
 import traceback
 
 from pathlib import Path
@@ -13,8 +15,13 @@ import pytest
 from packaging.tags import Tag
 from poetry.core.packages.utils.link import Link
 
+from poetry.inspection.lazy_wheel import RangeCache
+from poetry.utils.cache import ACCESS_INTERVAL
 from poetry.utils.cache import ArtifactCache
+from poetry.utils.cache import CachePruner
 from poetry.utils.cache import FileCache
+from poetry.utils.cache import SQLiteCache
+from poetry.utils.cache import create_file_cache
 from poetry.utils.env import MockEnv
 
 
@@ -46,8 +53,11 @@ def test_cache_validates(repository_cache_dir: Path) -> None:
     assert str(e.value) == "FileCache.hash_type is unknown value: 'unknown'."
 
 
-def test_cache_get_put_has(repository_cache_dir: Path) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_get_put_has(
+    cache_class: type[FileCache[Any]], repository_cache_dir: Path
+) -> None:
+    cache = cache_class(repository_cache_dir / "cache")
     cache.put("key1", "value")
     cache.put("key2", {"a": ["json-encoded", "value"]})
 
@@ -58,8 +68,11 @@ def test_cache_get_put_has(repository_cache_dir: Path) -> None:
     assert not cache.has("key3")
 
 
-def test_cache_forget(repository_cache_dir: Path) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_forget(
+    cache_class: type[FileCache[Any]], repository_cache_dir: Path
+) -> None:
+    cache = cache_class(repository_cache_dir / "cache")
     cache.put("key1", "value")
     cache.put("key2", "value")
 
@@ -72,8 +85,11 @@ def test_cache_forget(repository_cache_dir: Path) -> None:
     assert cache.has("key2")
 
 
-def test_cache_flush(repository_cache_dir: Path) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_flush(
+    cache_class: type[FileCache[Any]], repository_cache_dir: Path
+) -> None:
+    cache = cache_class(repository_cache_dir / "cache")
     cache.put("key1", "value")
     cache.put("key2", "value")
 
@@ -86,8 +102,11 @@ def test_cache_flush(repository_cache_dir: Path) -> None:
     assert not cache.has("key2")
 
 
-def test_cache_remember(repository_cache_dir: Path, mocker: MockerFixture) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_remember(
+    cache_class: type[FileCache[Any]], repository_cache_dir: Path, mocker: MockerFixture
+) -> None:
+    cache = cache_class(repository_cache_dir / "cache")
 
     method = mocker.Mock(return_value="value2")
     cache.put("key1", "value1")
@@ -98,10 +117,13 @@ def test_cache_remember(repository_cache_dir: Path, mocker: MockerFixture) -> No
     method.assert_called()
 
 
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
 def test_cache_get_limited_minutes(
-    repository_cache_dir: Path, mocker: MockerFixture
+    cache_class: type[FileCache[Any]],
+    repository_cache_dir: Path,
+    mocker: MockerFixture,
 ) -> None:
-    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+    cache = cache_class(repository_cache_dir / "cache")
 
     start_time = 1111111111
 
@@ -177,6 +199,187 @@ def test_detect_corrupted_cache_key_file(
     assert poetry_file_cache.get("key1") is None
 
 
+@pytest.mark.parametrize("cache_class", [FileCache, SQLiteCache])
+def test_cache_get_many(
+    cache_class: type[FileCache[Any]], repository_cache_dir: Path, mocker: MockerFixture
+) -> None:
+    cache = cache_class(repository_cache_dir / "cache")
+    mocker.patch("time.time", return_value=1111111111)
+    cache.put("key1", "value1")
+    cache.put("key2", {"a": "value2"})
+    cache.put("key3", "value3", minutes=5)
+
+    mocker.patch("time.time", return_value=1111111111 + 5 * 60 + 1)
+    assert cache.get_many(["key1", "key2", "key3", "key4"]) == {
+        "key1": "value1",
+        "key2": {"a": "value2"},
+    }
+    assert cache.get_many([]) == {}
+
+
+def test_sqlite_cache_get_many_in_batches(
+    repository_cache_dir: Path, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(SQLiteCache, "BATCH_SIZE", 2)
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    keys = [f"key{i}" for i in range(5)]
+    for key in keys:
+        cache.put(key, key)
+
+    assert cache.get_many(keys) == {key: key for key in keys}
+
+
+def test_sqlite_cache_stores_items_in_one_file(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value")
+    cache.put("key2", "value")
+
+    assert not [path for path in cache.path.iterdir() if path.is_dir()]
+    assert (cache.path / SQLiteCache.DATABASE).exists()
+
+
+def test_sqlite_cache_is_shared_between_instances(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    other: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+
+    cache.put("key1", "value1")
+    assert other.get("key1") == "value1"
+
+    other.forget("key1")
+    assert cache.get("key1") is None
+
+
+def test_sqlite_cache_concurrent_writes(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+
+    def put(i: int) -> None:
+        # Use an own instance per thread as well as the shared one.
+        SQLiteCache(cache.path).put(f"key{i}", i)
+        cache.put(f"other{i}", i)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(put, range(50)))
+
+    assert cache.get_many([f"key{i}" for i in range(50)]) == {
+        f"key{i}": i for i in range(50)
+    }
+    assert cache.get_many([f"other{i}" for i in range(50)]) == {
+        f"other{i}": i for i in range(50)
+    }
+
+
+def test_sqlite_cache_detects_corrupt_entry(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value")
+    cache._connection.execute("UPDATE items SET data = 'garbage'")
+
+    assert cache.get("key1") is None
+    assert cache._connection.execute("SELECT COUNT(*) FROM items").fetchone() == (0,)
+
+
+def test_sqlite_cache_migrates_file_cache(
+    repository_cache_dir: Path, mocker: MockerFixture
+) -> None:
+    path = repository_cache_dir / "cache"
+    file_cache: FileCache[Any] = FileCache(path)
+    mocker.patch("time.time", return_value=1111111111)
+    file_cache.put("key1", "value1")
+    file_cache.put("key2", {"a": "value2"}, minutes=5)
+    file_cache.put("key3", "value3", minutes=5)
+    # Other content of the directory must not be touched.
+    (path / "_http" / "ab").mkdir(parents=True)
+    (path / "_http" / "ab" / "entry").write_text("http", encoding="utf-8")
+    (path / "81").mkdir(exist_ok=True)
+    (path / "81" / "unrelated").write_text("unrelated", encoding="utf-8")
+
+    cache: SQLiteCache[Any] = SQLiteCache(path)
+    mocker.patch("time.time", return_value=1111111111 + 60)
+    assert cache.get_many(["key1", "key2", "key3"]) == {
+        "key1": "value1",
+        "key2": {"a": "value2"},
+        "key3": "value3",
+    }
+    mocker.patch("time.time", return_value=1111111111 + 5 * 60 + 1)
+    assert cache.get("key2") is None
+
+    assert not file_cache._path("key1").exists()
+    assert sorted(p.name for p in path.iterdir() if p.is_dir()) == ["81", "_http"]
+    assert (path / "_http" / "ab" / "entry").exists()
+    assert (path / "81" / "unrelated").exists()
+
+    # Items that are added to a file cache later can be migrated explicitly.
+    file_cache.put("key4", "value4")
+    assert cache.get("key4") is None
+    assert cache.migrate() == 1
+    assert cache.get("key4") == "value4"
+    assert not file_cache._path("key4").exists()
+
+
+@pytest.mark.parametrize(
+    ("backend", "expected"), [("file", FileCache), ("sqlite", SQLiteCache)]
+)
+def test_create_file_cache(
+    backend: str, expected: type[FileCache[Any]], tmp_path: Path
+) -> None:
+    cache = create_file_cache(tmp_path, backend)
+
+    assert type(cache) is expected
+    assert cache.path == tmp_path
+
+
+def test_create_file_cache_unknown_backend(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Unknown cache backend: 'unknown'"):
+        create_file_cache(tmp_path, "unknown")
+
+
+def test_file_cache_marks_accessed_entries(repository_cache_dir: Path) -> None:
+    cache: FileCache[Any] = FileCache(repository_cache_dir / "cache")
+    cache.put("key1", "value")
+    path = cache._path("key1")
+
+    accessed = time.time() - 2 * ACCESS_INTERVAL
+    os.utime(path, (accessed, accessed))
+    assert cache.get("key1") == "value"
+    assert path.stat().st_mtime > accessed
+
+    # Accesses within the access interval are not recorded.
+    accessed = time.time() - ACCESS_INTERVAL / 2
+    os.utime(path, (accessed, accessed))
+    assert cache.get("key1") == "value"
+    assert path.stat().st_mtime == accessed
+
+
+def test_sqlite_cache_marks_accessed_entries(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value")
+    cache.put("key2", "value")
+    ((_, _, accessed),) = [
+        entry for entry in cache.entries() if entry[0] == cache._hash("key1")
+    ]
+    assert accessed == pytest.approx(time.time(), abs=2)
+
+    old = round(time.time()) - 2 * ACCESS_INTERVAL
+    cache._connection.execute("UPDATE items SET accessed = ?", (old,))
+    assert cache.get("key1") == "value"
+    assert cache.get_many(["key2"]) == {"key2": "value"}
+
+    assert all(accessed > old for _, _, accessed in cache.entries())
+
+
+def test_sqlite_cache_evict(repository_cache_dir: Path) -> None:
+    cache: SQLiteCache[Any] = SQLiteCache(repository_cache_dir / "cache")
+    cache.put("key1", "value1")
+    cache.put("key2", "value2")
+    entries = {key: accessed for key, _, accessed in cache.entries()}
+    key1, key2 = cache._hash("key1"), cache._hash("key2")
+
+    # Entries that have been accessed after the given time are kept.
+    cache.evict([(key1, entries[key1]), (key2, entries[key2] - 1)])
+
+    assert cache.get("key1") is None
+    assert cache.get("key2") == "value2"
+
+
 def test_get_cache_directory_for_link(tmp_path: Path) -> None:
     cache = ArtifactCache(cache_dir=tmp_path)
     directory = cache.get_cache_directory_for_link(
@@ -367,3 +570,186 @@ def test_get_cached_archive_for_git() -> None:
     cache = ArtifactCache(cache_dir=Path())
     archive = cache.get_cached_archive_for_git("url", "ref", "subdirectory", MockEnv())
     assert archive is None
+
+
+def test_get_cached_archive_for_link_marks_accessed_entries(tmp_path: Path) -> None:
+    cache = ArtifactCache(cache_dir=tmp_path)
+    link = Link("https://files.pythonhosted.org/demo-0.1.0.tar.gz")
+    cache_dir = cache.get_cache_directory_for_link(link)
+    cache_dir.mkdir(parents=True)
+    (cache_dir / link.filename).touch()
+    accessed = time.time() - 2 * ACCESS_INTERVAL
+    os.utime(cache_dir, (accessed, accessed))
+
+    archive = cache.get_cached_archive_for_link(link, strict=True)
+
+    assert archive == cache_dir / link.filename
+    assert cache_dir.stat().st_mtime > accessed
+
+
+HOUR = 60 * 60
+
+
+@pytest.fixture
+def pruner(tmp_path: Path) -> CachePruner:
+    now = time.time()
+
+    def artifact(name: str, accessed: float) -> None:
+        path = tmp_path / "artifacts" / name[:2] / name[2:4] / name[4:6] / name[6:]
+        path.mkdir(parents=True)
+        (path / "demo-0.1.0.tar.gz").write_bytes(b"a" * 1000)
+        os.utime(path / "demo-0.1.0.tar.gz", (accessed, accessed))
+        os.utime(path, (accessed, accessed))
+
+    artifact("aabbccdd", now - 4 * HOUR)
+    artifact("aabbccee", now - 2 * HOUR)
+
+    file_cache: FileCache[Any] = FileCache(tmp_path / "repositories" / "legacy")
+    file_cache.put("key1", "a" * 100)
+    path = file_cache._path("key1")
+    os.utime(path, (now - 3 * HOUR, now - 3 * HOUR))
+
+    sqlite_cache: SQLiteCache[Any] = SQLiteCache(tmp_path / "repositories" / "pypi")
+    sqlite_cache.put("key2", "b" * 100)
+    sqlite_cache.put("key3", "c" * 100)
+    sqlite_cache._connection.execute(
+        "UPDATE items SET accessed = ? WHERE key = ?",
+        (round(now - 5 * HOUR), sqlite_cache._hash("key2")),
+    )
+
+    return CachePruner(
+        artifacts_cache_dir=tmp_path / "artifacts",
+        file_cache_dirs=[
+            tmp_path / "repositories" / "legacy",
+            tmp_path / "repositories" / "pypi",
+            tmp_path / "resolutions",
+        ],
+        stamp=tmp_path / ".pruned",
+    )
+
+
+def test_cache_pruner_entries(pruner: CachePruner, tmp_path: Path) -> None:
+    entries = sorted(pruner.entries(), key=lambda entry: entry.accessed)
+
+    assert [entry.size for entry in entries] == [102, 1000, 112, 1000, 102]
+    assert entries[0].path == tmp_path / "repositories" / "pypi"
+    assert entries[0].key is not None
+    assert entries[1].path == tmp_path / "artifacts" / "aa" / "bb" / "cc" / "dd"
+    assert entries[2].path == FileCache(tmp_path / "repositories" / "legacy")._path(
+        "key1"
+    )
+
+
+def test_cache_pruner_evicts_least_recently_used_entries(
+    pruner: CachePruner, tmp_path: Path
+) -> None:
+    result = pruner.prune(2200)
+
+    assert result.size == 2316
+    assert [entry.size for entry in result.evicted] == [102, 1000]
+    assert result.evicted_size == 1102
+    assert not (tmp_path / "artifacts" / "aa" / "bb" / "cc" / "dd").exists()
+    assert (tmp_path / "artifacts" / "aa" / "bb" / "cc" / "ee").exists()
+    assert SQLiteCache(tmp_path / "repositories" / "pypi").get("key2") is None
+    assert SQLiteCache(tmp_path / "repositories" / "pypi").get("key3") is not None
+    assert sum(entry.size for entry in pruner.entries()) == 1214
+    assert (tmp_path / ".pruned").exists()
+
+
+def test_cache_pruner_keeps_recently_used_entries(
+    pruner: CachePruner, tmp_path: Path
+) -> None:
+    result = pruner.prune(0)
+
+    assert len(result.evicted) == 4
+    assert [entry.size for entry in pruner.entries()] == [102]
+    # Empty directories are removed, but not the caches themselves.
+    assert not any((tmp_path / "artifacts").iterdir())
+    assert not any((tmp_path / "repositories" / "legacy").iterdir())
+
+
+def test_cache_pruner_dry_run(pruner: CachePruner, tmp_path: Path) -> None:
+    result = pruner.prune(0, dry_run=True)
+
+    assert len(result.evicted) == 4
+    assert len(pruner.entries()) == 5
+    assert not (tmp_path / ".pruned").exists()
+
+
+def test_cache_pruner_keeps_entries_accessed_after_scan(
+    pruner: CachePruner, tmp_path: Path, mocker: MockerFixture
+) -> None:
+    entries = pruner.entries()
+    mocker.patch.object(pruner, "entries", return_value=entries)
+    artifact = tmp_path / "artifacts" / "aa" / "bb" / "cc" / "dd"
+    os.utime(artifact)
+    file_cache: FileCache[Any] = FileCache(tmp_path / "repositories" / "legacy")
+    os.utime(file_cache._path("key1"))
+    sqlite_cache: SQLiteCache[Any] = SQLiteCache(tmp_path / "repositories" / "pypi")
+    sqlite_cache._connection.execute(
+        "UPDATE items SET accessed = ?", (round(time.time()) + 1,)
+    )
+
+    pruner.prune(0)
+
+    assert artifact.exists()
+    assert file_cache.get("key1") is not None
+    assert sqlite_cache.get("key2") is not None
+    assert not (tmp_path / "artifacts" / "aa" / "bb" / "cc" / "ee").exists()
+
+
+def test_cache_pruner_prune_if_due(pruner: CachePruner, tmp_path: Path) -> None:
+    result = pruner.prune_if_due(0)
+    assert result is not None
+    assert len(result.evicted) == 4
+
+    assert pruner.prune_if_due(0) is None
+
+    accessed = time.time() - CachePruner.PRUNE_INTERVAL
+    os.utime(tmp_path / ".pruned", (accessed, accessed))
+    result = pruner.prune_if_due(0)
+    assert result is not None
+    assert not result.evicted
+
+
+def test_cache_pruner_counts_stored_bytes_of_range_cache_entries(
+    pruner: CachePruner, tmp_path: Path
+) -> None:
+    range_cache = RangeCache(tmp_path / "repositories" / "pypi" / "lazy-wheel")
+    url = "https://example.org/demo-0.1.0-py3-none-any.whl"
+    range_cache.put(url, '"v1"', 2**30, [(0, b"a" * 100), (2**30 - 100, b"b" * 100)])
+    info_path, data_path = range_cache._paths(url)
+
+    sizes = {entry.path: entry.size for entry in pruner.entries()}
+
+    assert sizes[data_path] == 200
+    assert sizes[info_path] == info_path.stat().st_size
+
+
+def test_cache_pruner_counts_allocated_size_of_sparse_files(
+    pruner: CachePruner, tmp_path: Path
+) -> None:
+    path = tmp_path / "repositories" / "pypi" / "lazy-wheel" / "sparse.data"
+    path.parent.mkdir()
+    with path.open("wb") as f:
+        f.truncate(2**30)
+        f.write(b"a" * 100)
+    stat = path.stat()
+    if getattr(stat, "st_blocks", None) is None or stat.st_blocks * 512 >= 2**30:
+        pytest.skip("The file system does not support sparse files.")
+
+    sizes = {entry.path: entry.size for entry in pruner.entries()}
+
+    assert sizes[path] == stat.st_blocks * 512
+
+
+def test_cache_pruner_from_config(config: Config) -> None:
+    (config.repository_cache_directory / "pypi").mkdir(parents=True)
+
+    pruner = CachePruner.from_config(config)
+
+    assert pruner._artifacts_cache_dir == config.artifacts_cache_directory
+    assert pruner._file_cache_dirs == [
+        config.repository_cache_directory / "pypi",
+        config.resolution_cache_directory,
+    ]
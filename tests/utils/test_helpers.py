@@ -21,8 +21,11 @@ from poetry.utils.helpers import get_highest_priority_hash_type
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from httpretty import httpretty
     from httpretty.core import HTTPrettyRequest
+    from pytest_mock import MockerFixture
 
     from tests.conftest import Config
     from tests.types import FixtureDirGetter
@@ -301,6 +304,166 @@ def test_downloader_uses_authenticator_by_default(
     assert request.headers["Authorization"] == f"Basic {basic_auth}"
 
 
+def _ranged_request_handler(
+    body: bytes, *, ignore_ranges: bool = False, fail_once_at: int | None = None
+) -> Callable[
+    [HTTPrettyRequest, str, dict[str, Any]], tuple[int, dict[str, Any], bytes]
+]:
+    def handle_request(
+        request: HTTPrettyRequest, uri: str, response_headers: dict[str, Any]
+    ) -> tuple[int, dict[str, Any], bytes]:
+        nonlocal fail_once_at
+
+        response_headers["Accept-Ranges"] = "bytes"
+        range_header = request.headers.get("Range")
+        if range_header is None or ignore_ranges:
+            response_headers["Content-Length"] = str(len(body))
+            return 200, response_headers, body
+
+        start, end = (int(i) for i in range_header.split("=")[1].split("-"))
+        response_headers["Content-Length"] = str(end + 1 - start)
+        response_headers["Content-Range"] = f"bytes {start}-{end}/{len(body)}"
+        if fail_once_at is not None and start <= fail_once_at <= end:
+            # Return an incomplete segment.
+            fail_once_at = None
+            return 206, response_headers, body[start : (start + end) // 2]
+        return 206, response_headers, body[start : end + 1]
+
+    return handle_request
+
+
+@pytest.fixture
+def large_body(mocker: MockerFixture) -> bytes:
+    mocker.patch.object(Downloader, "MIN_SEGMENT_SIZE", 1000)
+    return bytes(range(256)) * 16
+
+
+def test_downloader_downloads_segments(
+    http: type[httpretty], tmp_path: Path, large_body: bytes
+) -> None:
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(http.GET, url, body=_ranged_request_handler(large_body))
+    dest = tmp_path / "demo-0.1.0.tar.gz"
+
+    downloader = Downloader(url, dest, segments=3)
+    assert downloader.segment_ranges == [(0, 1365), (1366, 2731), (2732, 4095)]
+    progress = list(downloader.download_with_progress(chunk_size=512))
+
+    assert dest.read_bytes() == large_body
+    assert progress == sorted(progress)
+    assert progress[-1] == len(large_body)
+    ranges = {
+        request.headers["Range"]
+        for request in http.latest_requests()
+        if "Range" in request.headers
+    }
+    assert ranges == {"bytes=0-1365", "bytes=1366-2731", "bytes=2732-4095"}
+
+
+@pytest.mark.parametrize(
+    ("segments", "expected"),
+    [(1, 0), (2, 2), (4, 4), (8, 4)],
+)
+def test_downloader_segment_ranges(
+    http: type[httpretty],
+    tmp_path: Path,
+    large_body: bytes,
+    segments: int,
+    expected: int,
+) -> None:
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(http.GET, url, body=_ranged_request_handler(large_body))
+
+    downloader = Downloader(url, tmp_path / "demo", segments=segments)
+
+    ranges = downloader.segment_ranges
+    assert len(ranges) == expected
+    if ranges:
+        assert ranges[0][0] == 0
+        assert ranges[-1][1] == len(large_body) - 1
+        assert all(end + 1 == start for (_, end), (start, _) in zip(ranges, ranges[1:]))
+
+
+def test_downloader_resumes_segments(
+    http: type[httpretty], tmp_path: Path, large_body: bytes
+) -> None:
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(
+        http.GET, url, body=_ranged_request_handler(large_body, fail_once_at=3000)
+    )
+    dest = tmp_path / "demo-0.1.0.tar.gz"
+
+    downloader = Downloader(url, dest, max_retries=1, segments=2)
+    list(downloader.download_with_progress(chunk_size=256))
+
+    assert dest.read_bytes() == large_body
+    ranges = [
+        request.headers["Range"]
+        for request in http.latest_requests()
+        if "Range" in request.headers
+    ]
+    # The second segment is resumed from the last fetched byte.
+    assert ranges.count("bytes=2048-4095") == 1
+    resumed = [r for r in ranges if r.endswith("-4095") and r != "bytes=2048-4095"]
+    assert len(resumed) == 1
+
+
+def test_downloader_fails_if_segment_cannot_be_resumed(
+    http: type[httpretty], tmp_path: Path, large_body: bytes
+) -> None:
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(
+        http.GET, url, body=_ranged_request_handler(large_body, fail_once_at=3000)
+    )
+    dest = tmp_path / "downloads" / "demo-0.1.0.tar.gz"
+    dest.parent.mkdir()
+
+    downloader = Downloader(url, dest, segments=2)
+    with pytest.raises(ChunkedEncodingError):
+        list(downloader.download_with_progress(chunk_size=256))
+
+    assert list(dest.parent.iterdir()) == []
+
+
+def test_downloader_falls_back_if_ranges_are_ignored(
+    http: type[httpretty], tmp_path: Path, large_body: bytes
+) -> None:
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(
+        http.GET, url, body=_ranged_request_handler(large_body, ignore_ranges=True)
+    )
+    dest = tmp_path / "demo-0.1.0.tar.gz"
+
+    downloader = Downloader(url, dest, segments=2)
+    list(downloader.download_with_progress(chunk_size=256))
+
+    assert dest.read_bytes() == large_body
+    assert "Range" not in http.last_request().headers
+
+
+@pytest.mark.parametrize(
+    ("size", "expected"),
+    [
+        (0, Downloader.MIN_CHUNK_SIZE),
+        (1024, Downloader.MIN_CHUNK_SIZE),
+        (64 * 1024 * 1024, 256 * 1024),
+        (2 * 1024 * 1024 * 1024, Downloader.MAX_CHUNK_SIZE),
+    ],
+)
+def test_downloader_chunk_size(
+    http: type[httpretty],
+    mocker: MockerFixture,
+    tmp_path: Path,
+    size: int,
+    expected: int,
+) -> None:
+    url = "https://foo.com/demo-0.1.0.tar.gz"
+    http.register_uri(http.GET, url, body=b"")
+    mocker.patch.object(Downloader, "total_size", size)
+
+    assert Downloader(url, tmp_path / "demo").chunk_size == expected
+
+
 def test_ensure_path_converts_string(tmp_path: Path) -> None:
     assert tmp_path.exists()
     assert ensure_path(path=tmp_path.as_posix(), is_directory=True) == tmp_path
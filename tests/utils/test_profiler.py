@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import threading
+
+from typing import TYPE_CHECKING
+
+from poetry.utils.profiler import get_profiler
+from poetry.utils.profiler import measure
+from poetry.utils.profiler import profile
+
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_measure_does_nothing_without_profiling() -> None:
+    assert get_profiler() is None
+
+    with measure("network"):
+        pass
+
+    assert get_profiler() is None
+
+
+def test_nested_measurements_do_not_overlap(mocker: MockerFixture) -> None:
+    time = mocker.patch("poetry.utils.profiler.time")
+    time.perf_counter.side_effect = [0.0, 1.0, 2.0, 5.0, 6.0, 6.0, 10.0, 12.0]
+
+    with profile() as profiler:
+        assert get_profiler() is profiler
+        # 1.0 - 6.0, of which 2.0 - 5.0 are spent in network
+        with measure("metadata", "repo"), measure("network", "repo"):
+            pass
+        # 6.0 - 10.0
+        with measure("network", "other"):
+            pass
+
+    assert get_profiler() is None
+
+    report = profiler.report()
+    assert report["total"] == 12.0
+    assert report["categories"] == {
+        "metadata": {
+            "seconds": 2.0,
+            "calls": 1,
+            "details": {"repo": {"seconds": 2.0, "calls": 1}},
+        },
+        "network": {
+            "seconds": 7.0,
+            "calls": 2,
+            "details": {
+                "other": {"seconds": 4.0, "calls": 1},
+                "repo": {"seconds": 3.0, "calls": 1},
+            },
+        },
+    }
+    assert report["unaccounted"] == 3.0
+
+
+def test_measurements_in_other_threads_are_reported_separately() -> None:
+    def work() -> None:
+        with measure("network", "repo"):
+            pass
+
+    with profile() as profiler:
+        with measure("network", "repo"):
+            pass
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+
+    report = profiler.report()
+    assert report["categories"]["network"]["calls"] == 1
+    assert report["categories"]["network"]["details"]["repo"]["calls"] == 1
+    assert report["background"]["network"]["calls"] == 1
+    assert report["background"]["network"]["details"]["repo"]["calls"] == 1
+
+
+def test_report_backtracking_and_versions_tried() -> None:
+    with profile() as profiler:
+        profiler.record_backtrack(1)
+        profiler.record_backtrack(4)
+        for name in ["a", "b", "a", "c", "a", "b"]:
+            profiler.record_version_tried(name)
+
+    report = profiler.report(top=2)
+    assert report["backtracking"] == {"count": 2, "max_depth": 4, "mean_depth": 2.5}
+    assert report["versions_tried"] == {"a": 3, "b": 2}
+    assert report["decisions"] == 6